@@ -3,6 +3,7 @@ from django.utils.translation import gettext_lazy as _
 from parler.models import TranslatableModel, TranslatedFields
 
 from commons.models.abstract_models import AbstractDateTimeModel
+from commons.models.translations import LanguageScopedManager
 
 
 class Author(TranslatableModel, AbstractDateTimeModel):
@@ -21,6 +22,8 @@ class Author(TranslatableModel, AbstractDateTimeModel):
     )
     is_active = models.BooleanField(default=True)
 
+    objects = LanguageScopedManager()
+
     class Meta:
         verbose_name = _("Author")
         verbose_name_plural = _("Authors")
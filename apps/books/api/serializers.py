@@ -1,25 +1,21 @@
 from rest_framework import serializers
 
 from apps.books.infrastructure.models import Book, BookCategory
+from commons.interfaces.projections import (ListProjection,
+                                           model_absolute_file_url,
+                                           model_file_url)
+from commons.interfaces.translated_fields import (TranslatedCharField,
+                                                 TranslatedRelatedNamesField,
+                                                 translated_value)
 from commons.interfaces.urlfile_path import FileResponseField
 
 
 class BookListSerializer(serializers.ModelSerializer):
-    name = serializers.CharField()
+    name = TranslatedCharField()
     description = serializers.SerializerMethodField()
     image = FileResponseField()
-    authors = serializers.SlugRelatedField(
-        many=True,
-        read_only=True,
-        source="author",
-        slug_field="name"
-    )
-    categories = serializers.SlugRelatedField(
-        many=True,
-        read_only=True,
-        source="category",
-        slug_field="name"
-    )
+    authors = TranslatedRelatedNamesField(relation="author")
+    categories = TranslatedRelatedNamesField(relation="category")
     created_at_display = serializers.SerializerMethodField()
 
     class Meta:
@@ -41,8 +37,9 @@ class BookListSerializer(serializers.ModelSerializer):
         return obj.created_at.strftime("%H:%M %d.%m.%Y")
 
     def get_description(self, obj):
-        if obj.description:
-            return obj.description[:100] + "..."
+        description = translated_value(obj, "description")
+        if description:
+            return description[:100] + "..."
         return ""
 
 
@@ -87,9 +84,58 @@ class BookDetailSerializer(serializers.ModelSerializer):
 
 
 class BookCategorySerializer(serializers.ModelSerializer):
-    name = serializers.CharField()
+    name = TranslatedCharField()
     books_count = serializers.IntegerField()
 
     class Meta:
         model = BookCategory
         fields = ("id", "name", "books_count", "slug", "image")
+
+
+class BookListProjection(ListProjection):
+    """values()-версия BookListSerializer для list-эндпоинтов (тот же JSON)."""
+
+    field_sources = {
+        "id": ("id",),
+        "name": ("translated_name",),
+        "description": ("translated_description",),
+        "price": ("price",),
+        "image": ("image",),
+        "slug": ("slug",),
+        "is_adult": ("is_adult",),
+        "authors": ("translated_author_name",),
+        "categories": ("translated_category_name",),
+        "created_at_display": ("created_at",),
+    }
+    expandable_fields = {
+        "in_stock": ("in_stock",),
+    }
+
+    def get_description(self, row):
+        description = row["translated_description"]
+        return description[:100] + "..." if description else ""
+
+    def get_image(self, row):
+        return model_file_url(Book, "image", row["image"])
+
+    def get_authors(self, row):
+        return row["translated_author_name"] or []
+
+    def get_categories(self, row):
+        return row["translated_category_name"] or []
+
+    def get_created_at_display(self, row):
+        return row["created_at"].strftime("%H:%M %d.%m.%Y")
+
+
+class BookCategoryProjection(ListProjection):
+    field_sources = {
+        "id": ("id",),
+        "name": ("translated_name",),
+        "books_count": ("books_count",),
+        "slug": ("slug",),
+        "image": ("image",),
+    }
+
+    def get_image(self, row):
+        return model_absolute_file_url(BookCategory, "image", row["image"], self.context.get("request"))
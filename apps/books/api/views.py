@@ -1,20 +1,40 @@
+from django.http import StreamingHttpResponse
 from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.utils import extend_schema
 from rest_framework.decorators import action
-from rest_framework.exceptions import NotFound
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.viewsets import ReadOnlyModelViewSet
 
-from apps.books.api.serializers import (BookCategorySerializer,
+from apps.books.api.serializers import (BookCategoryProjection,
+                                        BookCategorySerializer,
                                         BookDetailSerializer,
+                                        BookListProjection,
                                         BookListSerializer)
 from apps.books.infrastructure.selectors import (get_active_categories,
-                                                 search_books, get_allowed_books_by_category)
+                                                 search_books, get_allowed_books_by_category,
+                                                 iter_catalog_export_rows)
+from apps.books.interface.api_schema import (book_category_books_schema,
+                                             book_category_list_schema,
+                                             book_export_schema,
+                                             book_list_schema)
+from apps.books.interface.exports import EXPORT_FORMATS, encode_catalog
 from apps.books.interface.filters import BookFilter, BookCategoryFilter
 from apps.books.interface.paginations import CustomBooksPagination
+from apps.books.interface.throttles import CatalogExportThrottle
+from commons.interfaces.conditional import ConditionalGetMixin
+from commons.interfaces.projections import ProjectionListMixin
+from commons.interfaces.response_cache import CachedResponseMixin
+from commons.services.cache_versions import CATALOG, STOCK
 
 
-class BookViewSet(ReadOnlyModelViewSet):
+class BookViewSet(
+    ConditionalGetMixin, CachedResponseMixin, ProjectionListMixin, ReadOnlyModelViewSet
+):
     pagination_class = CustomBooksPagination
+    list_projection_class = BookListProjection
+    cache_version_groups = (CATALOG,)
+    response_cache_vary = ("Authorization",)
     lookup_field = "slug"
     # permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend]
@@ -23,11 +43,32 @@ class BookViewSet(ReadOnlyModelViewSet):
     def get_queryset(self):
         user_age = getattr(self.request.user, "age", 0)
         query = self.request.query_params.get("search")
-        return search_books(query=query, user_age=user_age)
+        for_list = self.action == "list"
+        return search_books(
+            query=query,
+            user_age=user_age,
+            for_list=for_list,
+            columns=self.get_list_columns() if for_list else None,
+        )
 
     def get_serializer_class(self):
         return BookListSerializer if self.action == "list" else BookDetailSerializer
 
+    def get_response_cache_variant(self) -> str:
+        # Книги 18+ видны только взрослым — кешируем две версии ответа.
+        return "adult" if getattr(self.request.user, "age", 0) >= 18 else "minor"
+
+    def get_cache_version_groups(self) -> tuple[str, ...]:
+        # Остаток есть в деталях книги и в списке с ?expand=in_stock (или ?fields=in_stock):
+        # только эти ответы сбрасываются с каждой покупкой.
+        if self.action == "retrieve" or (self.action == "list" and "in_stock" in self.get_list_fields()):
+            return CATALOG, STOCK
+        return self.cache_version_groups
+
+    @extend_schema(**book_list_schema)
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
     def get_object(self):
         slug = self.kwargs[self.lookup_field]
         obj = self.filter_queryset(self.get_queryset()).filter(slug=slug).first()
@@ -38,9 +79,46 @@ class BookViewSet(ReadOnlyModelViewSet):
         self.check_object_permissions(self.request, obj)
         return obj
 
+    @extend_schema(**book_export_schema)
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="export",
+        # Весь каталог одним потоком — только для партнёров с токеном и с отдельным лимитом.
+        permission_classes=[IsAuthenticated],
+        throttle_classes=[CatalogExportThrottle],
+    )
+    def export(self, request):
+        output = request.query_params.get("output", "jsonl")
+        if output not in EXPORT_FORMATS:
+            raise ValidationError({"output": f"Choose one of: {', '.join(EXPORT_FORMATS)}."})
+
+        compress = request.query_params.get("compress") == "gzip"
+        content_type, extension = EXPORT_FORMATS[output]
+        user_age = getattr(request.user, "age", 0)
+
+        chunks = encode_catalog(
+            iter_catalog_export_rows(user_age=user_age),
+            output=output,
+            compress=compress,
+        )
+
+        filename = f"catalog.{extension}.gz" if compress else f"catalog.{extension}"
+        response = StreamingHttpResponse(
+            chunks,
+            content_type="application/gzip" if compress else content_type,
+        )
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
 
-class BookCategoryViewSet(ReadOnlyModelViewSet):
+class BookCategoryViewSet(
+    ConditionalGetMixin, CachedResponseMixin, ProjectionListMixin, ReadOnlyModelViewSet
+):
     serializer_class = BookCategorySerializer
+    list_projection_class = BookCategoryProjection
+    cache_version_groups = (CATALOG,)
+    response_cache_vary = ("Authorization",)
     lookup_field = "slug"
     pagination_class = CustomBooksPagination
     # permission_classes = [IsAuthenticated]
@@ -48,7 +126,22 @@ class BookCategoryViewSet(ReadOnlyModelViewSet):
     filterset_class = BookCategoryFilter
 
     def get_queryset(self):
-        return get_active_categories()
+        user_age = getattr(self.request.user, "age", 0)
+        return get_active_categories(user_age=user_age)
+
+    def get_response_cache_variant(self) -> str:
+        # Количество книг в категории для младше 18 считается без книг 18+.
+        return "adult" if getattr(self.request.user, "age", 0) >= 18 else "minor"
+
+    def get_cache_version_groups(self) -> tuple[str, ...]:
+        # Книги категории с ?expand=in_stock — как список книг в BookViewSet.
+        if self.action == "books" and "in_stock" in self.get_list_fields(BookListProjection):
+            return CATALOG, STOCK
+        return self.cache_version_groups
+
+    @extend_schema(**book_category_list_schema)
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
 
     def get_object(self):
         slug = self.kwargs[self.lookup_field]
@@ -60,17 +153,23 @@ class BookCategoryViewSet(ReadOnlyModelViewSet):
         self.check_object_permissions(self.request, obj)
         return obj
 
+    @extend_schema(**book_category_books_schema)
     @action(detail=True, methods=["get"], url_path="books")
     def books(self, request, slug: str = None):
+        return self.cached_response(self._books, request, slug=slug)
+
+    def _books(self, request, slug: str = None):
         user_age = getattr(request.user, "age", 0)
 
         category_exists = self.get_queryset().filter(slug=slug).exists()
         if not category_exists:
             raise NotFound()
 
-        qs = get_allowed_books_by_category(slug=slug, user_age=user_age)
-
-        page = self.paginate_queryset(qs)
-        serializer = BookListSerializer(page, many=True, context={"request": request})
+        qs = get_allowed_books_by_category(
+            slug=slug,
+            user_age=user_age,
+            for_list=True,
+            columns=self.get_list_columns(BookListProjection),
+        )
 
-        return self.get_paginated_response(serializer.data)
+        return self.paginated_projection(qs, BookListProjection)
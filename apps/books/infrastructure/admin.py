@@ -45,7 +45,7 @@ class BookAdmin(TranslatableAdmin):
 
 @admin.register(BookCategory)
 class BookCategoryAdmin(TranslatableAdmin):
-    list_display = ("name", "is_active", "image_preview")
+    list_display = ("name", "is_active", "active_books_count", "image_preview")
     list_editable = ("is_active",)
     list_filter = ("created_at",)
     list_per_page = 20
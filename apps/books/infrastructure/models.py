@@ -5,6 +5,7 @@ from parler.models import TranslatableModel, TranslatedFields
 
 from apps.authors.infrastructure.models import Author
 from commons.models.abstract_models import AbstractDateTimeModel
+from commons.models.translations import LanguageScopedManager
 
 
 class BookCategory(TranslatableModel, AbstractDateTimeModel):
@@ -22,6 +23,13 @@ class BookCategory(TranslatableModel, AbstractDateTimeModel):
         unique=True,
     )
     is_active = models.BooleanField(default=True)
+    # Денормализованные счётчики (поддерживаются сигналами, см. BookCategoryCounterRepository).
+    active_books_count = models.PositiveIntegerField(default=0, editable=False)
+    active_adult_books_count = models.PositiveIntegerField(default=0, editable=False)
+
+    COUNTER_FIELDS = ("active_books_count", "active_adult_books_count")
+
+    objects = LanguageScopedManager()
 
     class Meta:
         verbose_name = _("Book Category")
@@ -30,6 +38,15 @@ class BookCategory(TranslatableModel, AbstractDateTimeModel):
     def __str__(self):
         return self.safe_translation_getter("name", any_language=True)
 
+    def save(self, *args, **kwargs):
+        # Обычное сохранение (админка) не должно перетирать счётчики устаревшими значениями.
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
 
 class Book(TranslatableModel, AbstractDateTimeModel):
     translations = TranslatedFields(
@@ -65,6 +82,8 @@ class Book(TranslatableModel, AbstractDateTimeModel):
     is_active = models.BooleanField(default=True)
     is_adult = models.BooleanField(default=False)
 
+    objects = LanguageScopedManager()
+
     class Meta:
         verbose_name = _("Book")
         verbose_name_plural = _("Books")
@@ -0,0 +1,421 @@
+import csv
+import io
+from typing import Any, Iterable
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce, Greatest
+
+from apps.authors.infrastructure.models import Author
+from apps.books.infrastructure.models import Book, BookCategory
+from apps.sync.infrastructure.models import CatalogChange
+from apps.sync.infrastructure.repositories import CatalogChangeRepository
+from commons.services.cache_versions import CATALOG, bump_cache_version_on_commit
+from commons.services.slug_generation import make_base_slug
+
+CATALOG_LANGUAGES = tuple(language["code"] for language in settings.PARLER_LANGUAGES[None])
+
+TRUE_VALUES = {"1", "true", "t", "yes", "y", "on"}
+FALSE_VALUES = {"0", "false", "f", "no", "n", "off"}
+SMALLINT_MAX = 32767
+
+
+def _qn(name: str) -> str:
+    return connection.ops.quote_name(name)
+
+
+class CatalogImportRepository:
+    """
+    Массовая загрузка каталога (авторы, категории, книги) пачками.
+
+    Каждая пачка:
+    1. COPY во временную staging-таблицу (одна операция вместо N INSERT-ов).
+    2. Set-based UPDATE существующих строк + INSERT новых по slug.
+    3. Upsert переводов всех языков одним INSERT ... ON CONFLICT.
+    4. Для книг — пересборка M2M связей с авторами и категориями.
+    5. Запись затронутых id в журнал CatalogChange одним INSERT ... SELECT.
+
+    Зачем slug как естественный ключ:
+    Повторный импорт того же файла обновляет записи, а не плодит дубли
+    с суффиксами -1, -2 (как это делает generate_slug в pre_save).
+    Обновляет только явный slug: строка без него создаёт новую запись, и slug из названия,
+    если он уже занят, получает суффикс -1, -2 (см. _assign_derived_slugs).
+
+    Сигналы (pre_save, m2m_changed) намеренно не вызываются — в этом и смысл.
+    """
+
+    KINDS = ("authors", "categories", "books")
+
+    def __init__(self, kind: str):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown catalog kind: {kind}")
+        self.kind = kind
+        self.model = {"authors": Author, "categories": BookCategory, "books": Book}[kind]
+        self.translation_model = self.model._parler_meta.root.model
+        self.staging_table = f"import_{kind}"
+        self._explicit_slugs: set[str] = set()
+        self._derived_rows: list[list[Any]] = []
+        self.reslugged: list[tuple[str, str]] = []
+
+    # ---------- Подготовка строк ----------
+
+    @property
+    def translated_fields(self) -> tuple[str, ...]:
+        if self.kind == "books":
+            return "name", "description"
+        return ("name",)
+
+    @property
+    def master_fields(self) -> tuple[str, ...]:
+        if self.kind == "books":
+            return "is_active", "price", "in_stock", "is_adult"
+        return ("is_active",)
+
+    @property
+    def staging_columns(self) -> list[tuple[str, str]]:
+        columns = [("slug", "varchar(255)")]
+        for field in self.translated_fields:
+            column_type = "varchar(255)" if field == "name" else "text"
+            columns += [(f"{field}_{lang}", column_type) for lang in CATALOG_LANGUAGES]
+        columns.append(("is_active", "boolean"))
+        if self.kind == "books":
+            columns += [
+                ("price", "integer"),
+                ("in_stock", "integer"),
+                ("is_adult", "boolean"),
+                ("authors", "text"),
+                ("categories", "text"),
+            ]
+        return columns
+
+    def prepare_rows(self, raw_rows: Iterable[dict[str, Any]]) -> list[list[Any]]:
+        """
+        Нормализует строки источника; slug строк без явного slug — пока только база из названия.
+
+        Уникальный slug таким строкам назначает _assign_derived_slugs (нужен запрос к БД).
+        Повтор явного slug в пачке — одна запись: берётся последняя строка, как при повторном импорте.
+        """
+        prepared: dict[str, list[Any]] = {}
+        self._derived_rows = []
+        self.reslugged = []
+
+        for raw in raw_rows:
+            explicit = (raw.get("slug") or "").strip()[:255]
+            slug = explicit or self._slug_from_names(raw)[:255]
+            if not slug:
+                continue
+
+            row = [slug]
+            for column, column_type in self.staging_columns[1:]:
+                try:
+                    row.append(self._normalize(raw.get(column), column_type))
+                except ValueError as exc:
+                    raise ValueError(f"{slug}: {column}: {exc}") from exc
+
+            if explicit:
+                prepared.pop(explicit, None)
+                prepared[explicit] = row
+            else:
+                self._derived_rows.append(row)
+
+        self._explicit_slugs = set(prepared)
+        return [*prepared.values(), *self._derived_rows]
+
+    def _assign_derived_slugs(self) -> None:
+        """
+        Уникальные slug строкам без явного slug — как generate_slug, но на всю пачку сразу.
+
+        Зачем:
+        Строка без slug только создаёт запись: slug из названия, занятый в БД или
+        раньше в файле, получает суффикс -1, -2, ... Занятые slug всех баз пачки
+        читаются одним запросом, суффиксы подбираются в памяти. Строки пачки,
+        получившие суффикс, — в self.reslugged: (slug из названия, назначенный slug).
+        """
+        if not self._derived_rows:
+            return
+
+        bases = {row[0] for row in self._derived_rows}
+        lookup = Q(slug__in=bases)
+        for base in bases:
+            lookup |= Q(slug__startswith=f"{base}-")
+        # Прошлые пачки уже в БД; в памяти — только slug этой пачки.
+        taken = set(self.model.objects.filter(lookup).values_list("slug", flat=True))
+        taken |= self._explicit_slugs
+
+        counters: dict[str, int] = {}
+        for row in self._derived_rows:
+            base = slug = row[0]
+            counter = counters.get(base, 1)
+            while slug in taken:
+                suffix = f"-{counter}"
+                slug = f"{base[:255 - len(suffix)]}{suffix}"
+                counter += 1
+            counters[base] = counter
+            if slug != base:
+                self.reslugged.append((base, slug))
+            row[0] = slug
+            taken.add(slug)
+
+    @staticmethod
+    def _slug_from_names(raw: dict[str, Any]) -> str:
+        for lang in CATALOG_LANGUAGES:
+            name = (raw.get(f"name_{lang}") or "").strip()
+            if name:
+                return make_base_slug(name)
+        return ""
+
+    @staticmethod
+    def _normalize(value: Any, column_type: str) -> Any:
+        if value is None:
+            return None
+
+        if isinstance(value, (list, tuple)):
+            value = "|".join(str(item) for item in value)
+
+        if isinstance(value, bool):
+            return "t" if value else "f"
+
+        value = str(value).strip()
+        if value == "":
+            return None
+
+        if column_type == "boolean":
+            lowered = value.lower()
+            if lowered in TRUE_VALUES:
+                return "t"
+            if lowered in FALSE_VALUES:
+                return "f"
+            raise ValueError(f"Invalid boolean value: {value!r}")
+
+        if column_type == "integer":
+            number = int(float(value))
+            # price и in_stock — PositiveSmallIntegerField.
+            if not 0 <= number <= SMALLINT_MAX:
+                raise ValueError(f"{value!r} is out of range 0..{SMALLINT_MAX}")
+            return str(number)
+
+        if column_type == "varchar(255)":
+            return value[:255]
+
+        return value
+
+    # ---------- Загрузка ----------
+
+    def import_batch(self, raw_rows: Iterable[dict[str, Any]]) -> int:
+        rows = self.prepare_rows(raw_rows)
+        if not rows:
+            return 0
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            self._assign_derived_slugs()
+            self._create_staging_table(cursor)
+            self._copy_rows(cursor, rows)
+            self._upsert_masters(cursor)
+            self._upsert_translations(cursor)
+            if self.kind == "books":
+                self._replace_relations(cursor, Book.author, "authors")
+                self._replace_relations(cursor, Book.category, "categories")
+            self._record_changes(cursor)
+
+        return len(rows)
+
+    def _create_staging_table(self, cursor) -> None:
+        columns = ", ".join(f"{_qn(name)} {column_type}" for name, column_type in self.staging_columns)
+        cursor.execute(
+            f"CREATE TEMPORARY TABLE {_qn(self.staging_table)} ({columns}) ON COMMIT DROP"
+        )
+
+    def _copy_rows(self, cursor, rows: list[list[Any]]) -> None:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        buffer.seek(0)
+
+        columns = ", ".join(_qn(name) for name, _ in self.staging_columns)
+        cursor.copy_expert(
+            f"COPY {_qn(self.staging_table)} ({columns}) FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+
+    def _upsert_masters(self, cursor) -> None:
+        table = _qn(self.model._meta.db_table)
+        staging = _qn(self.staging_table)
+
+        fields = self.master_fields
+        defaults = {"is_active": "TRUE", "is_adult": "FALSE", "price": "0", "in_stock": "1"}
+
+        assignments = ", ".join(
+            f"{_qn(field)} = COALESCE(s.{_qn(field)}, t.{_qn(field)})" for field in fields
+        )
+        cursor.execute(
+            f"UPDATE {table} AS t SET {assignments}, {_qn('updated_at')} = now() "
+            f"FROM {staging} AS s WHERE t.{_qn('slug')} = s.{_qn('slug')}"
+        )
+
+        insert_columns = ", ".join(_qn(field) for field in ("slug",) + fields + ("created_at", "updated_at"))
+        select_values = ", ".join(
+            [f"s.{_qn('slug')}"]
+            + [f"COALESCE(s.{_qn(field)}, {defaults[field]})" for field in fields]
+            + ["now()", "now()"]
+        )
+        cursor.execute(
+            f"INSERT INTO {table} ({insert_columns}) "
+            f"SELECT {select_values} FROM {staging} AS s "
+            f"WHERE NOT EXISTS (SELECT 1 FROM {table} AS t WHERE t.{_qn('slug')} = s.{_qn('slug')}) "
+            f"ON CONFLICT ({_qn('slug')}) DO NOTHING"
+        )
+
+    def _upsert_translations(self, cursor) -> None:
+        table = _qn(self.model._meta.db_table)
+        translation_table = _qn(self.translation_model._meta.db_table)
+        staging = _qn(self.staging_table)
+        fields = self.translated_fields
+
+        values = ", ".join(
+            "({})".format(
+                ", ".join([f"'{lang}'"] + [f"s.{_qn(f'{field}_{lang}')}" for field in fields])
+            )
+            for lang in CATALOG_LANGUAGES
+        )
+        value_columns = ", ".join(["language_code", *fields])
+        insert_columns = ", ".join(_qn(column) for column in ("master_id", "language_code", *fields))
+        updates = ", ".join(
+            f"{_qn(field)} = COALESCE(EXCLUDED.{_qn(field)}, tr.{_qn(field)})" for field in fields
+        )
+
+        cursor.execute(
+            f"INSERT INTO {translation_table} AS tr ({insert_columns}) "
+            f"SELECT t.{_qn('id')}, v.language_code, {', '.join(f'v.{_qn(field)}' for field in fields)} "
+            f"FROM {staging} AS s "
+            f"JOIN {table} AS t ON t.{_qn('slug')} = s.{_qn('slug')} "
+            f"CROSS JOIN LATERAL (VALUES {values}) AS v({value_columns}) "
+            f"WHERE v.{_qn('name')} IS NOT NULL "
+            f"ON CONFLICT ({_qn('language_code')}, {_qn('master_id')}) DO UPDATE SET {updates}"
+        )
+
+    def _replace_relations(self, cursor, descriptor, column: str) -> None:
+        """
+        Пересобирает M2M связи книг из колонки со slug-ами через "|".
+
+        NULL в колонке означает «не трогать связи» — так частичный файл
+        (например, только цены) не обнуляет авторов и категории.
+        """
+        field = descriptor.field
+        through_table = _qn(field.remote_field.through._meta.db_table)
+        source_column = _qn(field.m2m_column_name())
+        target_column = _qn(field.m2m_reverse_name())
+        target_table = _qn(field.related_model._meta.db_table)
+        book_table = _qn(Book._meta.db_table)
+        staging = _qn(self.staging_table)
+
+        cursor.execute(
+            f"DELETE FROM {through_table} AS rel "
+            f"USING {staging} AS s JOIN {book_table} AS b ON b.{_qn('slug')} = s.{_qn('slug')} "
+            f"WHERE rel.{source_column} = b.{_qn('id')} AND s.{_qn(column)} IS NOT NULL"
+        )
+        cursor.execute(
+            f"INSERT INTO {through_table} ({source_column}, {target_column}) "
+            f"SELECT DISTINCT b.{_qn('id')}, target.{_qn('id')} "
+            f"FROM {staging} AS s "
+            f"JOIN {book_table} AS b ON b.{_qn('slug')} = s.{_qn('slug')} "
+            f"CROSS JOIN LATERAL unnest(string_to_array(s.{_qn(column)}, '|')) AS ref(slug) "
+            f"JOIN {target_table} AS target ON target.{_qn('slug')} = btrim(ref.slug) "
+            f"ON CONFLICT DO NOTHING"
+        )
+
+    def _record_changes(self, cursor) -> None:
+        """Сигналы не вызываются, поэтому журнал для delta-sync и версию кеша каталога обновляем сами."""
+        table = _qn(self.model._meta.db_table)
+        staging = _qn(self.staging_table)
+
+        CatalogChangeRepository.lock_journal()
+        cursor.execute(
+            f"INSERT INTO {_qn(CatalogChange._meta.db_table)} "
+            f"({_qn('entity')}, {_qn('object_id')}, {_qn('action')}, {_qn('created_at')}) "
+            f"SELECT %s, t.{_qn('id')}, CASE WHEN t.{_qn('is_active')} THEN %s ELSE %s END, now() "
+            f"FROM {staging} AS s JOIN {table} AS t ON t.{_qn('slug')} = s.{_qn('slug')} "
+            f"ORDER BY t.{_qn('id')}",
+            [self.kind, CatalogChange.Action.UPSERT.value, CatalogChange.Action.DELETE.value],
+        )
+        bump_cache_version_on_commit(CATALOG)
+
+
+class BookCategoryCounterRepository:
+    """
+    Поддерживает BookCategory.active_books_count / active_adult_books_count.
+
+    Зачем:
+    Список категорий читает готовые колонки вместо COUNT по M2M таблице
+    на каждый запрос. Счётчики меняются F()-выражениями в той же транзакции,
+    что и сама связь/книга, поэтому параллельные изменения не теряются.
+
+    Массовые операции мимо сигналов (QuerySet.update, import_catalog)
+    выравниваются командой reconcile_category_counters.
+    """
+
+    @staticmethod
+    def contribution(*, is_active: bool, is_adult: bool) -> tuple[int, int]:
+        """Вклад одной книги в счётчики категории: (active, active_adult)."""
+        return int(is_active), int(is_active and is_adult)
+
+    @staticmethod
+    @transaction.atomic
+    def shift(category_ids: Iterable[int], *, active: int, adult: int) -> None:
+        category_ids = list(category_ids)
+        if not category_ids or (active == 0 and adult == 0):
+            return
+
+        BookCategory.objects.filter(pk__in=category_ids).update(
+            active_books_count=Greatest(F("active_books_count") + active, 0),
+            active_adult_books_count=Greatest(F("active_adult_books_count") + adult, 0),
+        )
+
+    @staticmethod
+    @transaction.atomic
+    def shift_for_books(category_id: int, book_ids: Iterable[int], *, sign: int) -> None:
+        """Добавление/удаление пачки книг в одну категорию (category.books.add/remove)."""
+        counts = Book.objects.filter(pk__in=list(book_ids)).aggregate(
+            active=Count("pk", filter=Q(is_active=True)),
+            adult=Count("pk", filter=Q(is_active=True, is_adult=True)),
+        )
+        BookCategoryCounterRepository.shift(
+            [category_id], active=sign * counts["active"], adult=sign * counts["adult"]
+        )
+
+    @staticmethod
+    @transaction.atomic
+    def reconcile(category_ids: Iterable[int] | None = None) -> int:
+        """
+        Пересчитывает счётчики из M2M таблицы одним UPDATE.
+
+        Возвращает количество категорий, у которых значения разошлись.
+        """
+        through = Book.category.through
+        links = through.objects.filter(bookcategory_id=OuterRef("pk"), book__is_active=True)
+
+        def counter(queryset):
+            return Coalesce(
+                Subquery(
+                    queryset.order_by().values("bookcategory_id").annotate(total=Count("*")).values("total")
+                ),
+                0,
+            )
+
+        qs = BookCategory.objects.all()
+        if category_ids is not None:
+            qs = qs.filter(pk__in=list(category_ids))
+
+        qs = qs.annotate(
+            actual_active=counter(links),
+            actual_adult=counter(links.filter(book__is_adult=True)),
+        ).filter(~Q(active_books_count=F("actual_active")) | ~Q(active_adult_books_count=F("actual_adult")))
+
+        stale_ids = list(qs.values_list("pk", flat=True))
+        if stale_ids:
+            BookCategory.objects.filter(pk__in=stale_ids).update(
+                active_books_count=counter(links),
+                active_adult_books_count=counter(links.filter(book__is_adult=True)),
+            )
+            bump_cache_version_on_commit(CATALOG)
+
+        return len(stale_ids)
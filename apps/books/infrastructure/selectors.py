@@ -1,22 +1,58 @@
+from collections import defaultdict
+from typing import Any, Collection, Iterator
+
 from django.contrib.postgres.search import TrigramSimilarity
-from django.db.models import Count, F, Max, Q, QuerySet
+from django.db.models import F, Max, QuerySet
 from django.db.models.query import Prefetch
 
 from apps.authors.infrastructure.models import Author
 from apps.books.infrastructure.models import Book, BookCategory
+from apps.books.infrastructure.repositories import CATALOG_LANGUAGES
+from commons.utils.iterables import chunked
 
 
-def get_allowed_books(user_age: int) -> QuerySet:
-    qs = Book.objects.filter(is_active=True).prefetch_related(Prefetch("translations"),
-            Prefetch(
-                "author",
-                queryset=Author.objects.prefetch_related("translations"),
-            ),
-            Prefetch(
-                "category",
-                queryset=BookCategory.objects.prefetch_related("translations"),
-            )
-        ).order_by("-created_at")
+def _with_book_translations(
+    qs: QuerySet, *, for_list: bool, columns: Collection[str] | None = None
+) -> QuerySet:
+    """
+    Список получает переводы книги, авторов и категорий колонками одного запроса
+    (with_translated), детальная карточка — через language-scoped prefetch.
+
+    columns — values()-колонки, которые прочитает список (?fields=). Подзапросы
+    переводов, которых там нет (например массив имён авторов), не добавляются.
+    """
+    if for_list:
+        def wanted(column: str) -> bool:
+            return columns is None or column in columns
+
+        translated = [field for field in ("name", "description") if wanted(f"translated_{field}")]
+        if translated:
+            qs = qs.with_translated(*translated)
+
+        for relation in ("author", "category"):
+            if wanted(f"translated_{relation}_name"):
+                qs = qs.with_translated_related(relation, "name")
+
+        return qs
+
+    return qs.prefetch_translations().prefetch_related(
+        Prefetch(
+            "author",
+            queryset=Author.objects.prefetch_translations(),
+        ),
+        Prefetch(
+            "category",
+            queryset=BookCategory.objects.prefetch_translations(),
+        )
+    )
+
+
+def get_allowed_books(
+    user_age: int, *, for_list: bool = False, columns: Collection[str] | None = None
+) -> QuerySet:
+    qs = _with_book_translations(
+        Book.objects.filter(is_active=True), for_list=for_list, columns=columns
+    ).order_by("-created_at")
 
     if user_age < 18:
         qs = qs.filter(is_adult=False)
@@ -24,21 +60,21 @@ def get_allowed_books(user_age: int) -> QuerySet:
     return qs
 
 
-def get_allowed_books_by_category(slug: str, user_age: int) -> QuerySet:
-    qs = (
-        Book.objects.filter(is_active=True, category__slug=slug)
-        .prefetch_related(Prefetch("translations"),
-            Prefetch(
-                "author",
-                queryset=Author.objects.prefetch_related("translations"),
-            ),
-            Prefetch(
-                "category",
-                queryset=BookCategory.objects.prefetch_related("translations"),
-            )
-        )
-        .distinct()
-    )
+def get_books_for_cards(*, ids: Collection[int]) -> QuerySet:
+    """
+    Книги по id для карточек в корзине, избранном и подборках.
+
+    Без фильтра is_active: неактивная книга остаётся в корзине и должна отображаться.
+    """
+    return _with_book_translations(Book.objects.filter(id__in=ids), for_list=True)
+
+
+def get_allowed_books_by_category(
+    slug: str, user_age: int, *, for_list: bool = False, columns: Collection[str] | None = None
+) -> QuerySet:
+    qs = _with_book_translations(
+        Book.objects.filter(is_active=True, category__slug=slug), for_list=for_list, columns=columns
+    ).distinct()
 
     if user_age < 18:
         qs = qs.filter(is_adult=False)
@@ -46,8 +82,10 @@ def get_allowed_books_by_category(slug: str, user_age: int) -> QuerySet:
     return qs
 
 
-def search_books(*, query: str | None, user_age: int) -> QuerySet:
-    qs = get_allowed_books(user_age=user_age)
+def search_books(
+    *, query: str | None, user_age: int, for_list: bool = False, columns: Collection[str] | None = None
+) -> QuerySet:
+    qs = get_allowed_books(user_age=user_age, for_list=for_list, columns=columns)
 
     if not query:
         return qs
@@ -70,16 +108,89 @@ def search_books(*, query: str | None, user_age: int) -> QuerySet:
     )
 
 
-def get_active_categories() -> QuerySet:
+def get_active_categories(user_age: int = 18) -> QuerySet:
+    """
+    Активные категории с количеством книг из денормализованных счётчиков.
+
+    Для пользователей младше 18 книги 18+ не считаются — как и в списке книг.
+    """
+    if user_age < 18:
+        books_count = F("active_books_count") - F("active_adult_books_count")
+    else:
+        books_count = F("active_books_count")
+
     return (
         BookCategory.objects.filter(is_active=True)
-        .prefetch_related("translations")
-        .annotate(
-            books_count=Count(
-                "books",
-                filter=Q(books__is_active=True),
-                distinct=True,
-            )
-        )
+        .with_translated("name")
+        .annotate(books_count=books_count)
         .order_by("-created_at")
     )
+
+
+def iter_catalog_export_rows(*, user_age: int, chunk_size: int = 2000) -> Iterator[dict[str, Any]]:
+    """
+    Потоково отдаёт активные книги плоскими словарями в формате import_catalog.
+
+    Зачем:
+    Книги читаются server-side курсором (.iterator), а переводы, авторы
+    и категории подтягиваются тремя запросами на каждую пачку id —
+    память постоянна при любом размере каталога, без COUNT/OFFSET пагинации.
+    """
+    books = Book.objects.filter(is_active=True)
+    if user_age < 18:
+        books = books.filter(is_adult=False)
+
+    rows = books.order_by("id").values(
+        "id", "slug", "is_active", "price", "in_stock", "is_adult", "image"
+    ).iterator(chunk_size=chunk_size)
+
+    storage = Book._meta.get_field("image").storage
+
+    for batch in chunked(rows, chunk_size):
+        book_ids = [row["id"] for row in batch]
+        translations = _get_export_translations(book_ids)
+        authors = _get_related_slugs(Book.author.field, book_ids)
+        categories = _get_related_slugs(Book.category.field, book_ids)
+
+        for row in batch:
+            book_id = row.pop("id")
+            book_translations = translations.get(book_id, {})
+            image = row.pop("image")
+
+            for lang in CATALOG_LANGUAGES:
+                name, description = book_translations.get(lang, (None, None))
+                row[f"name_{lang}"] = name
+                row[f"description_{lang}"] = description
+
+            row["authors"] = "|".join(authors.get(book_id, ()))
+            row["categories"] = "|".join(categories.get(book_id, ()))
+            row["image"] = storage.url(image) if image else None
+            yield row
+
+
+def _get_export_translations(book_ids: list[int]) -> dict[int, dict[str, tuple]]:
+    translation_model = Book._parler_meta.root.model
+    result: dict[int, dict[str, tuple]] = defaultdict(dict)
+
+    for master_id, language_code, name, description in translation_model.objects.filter(
+        master_id__in=book_ids
+    ).values_list("master_id", "language_code", "name", "description"):
+        result[master_id][language_code] = (name, description)
+
+    return result
+
+
+def _get_related_slugs(field, book_ids: list[int]) -> dict[int, list[str]]:
+    through = field.remote_field.through
+    source = field.m2m_field_name()
+    target = field.m2m_reverse_field_name()
+    result: dict[int, list[str]] = defaultdict(list)
+
+    for book_id, slug in (
+        through.objects.filter(**{f"{source}_id__in": book_ids})
+        .order_by(f"{target}__slug")
+        .values_list(f"{source}_id", f"{target}__slug")
+    ):
+        result[book_id].append(slug)
+
+    return result
@@ -1,7 +1,8 @@
-from django.db.models.signals import pre_save
+from django.db.models.signals import m2m_changed, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 
 from apps.books.infrastructure.models import Book, BookCategory
+from apps.books.infrastructure.repositories import BookCategoryCounterRepository
 from commons.services.slug_generation import generate_slug
 from commons.signals.media import connect_media_cleanup
 
@@ -17,5 +18,99 @@ def book_slug_signal(sender, instance, **kwargs):
     generate_slug(instance, sender, "name")
 
 
+@receiver(pre_save, sender=Book)
+def book_flags_snapshot_signal(sender, instance: Book, raw=False, **kwargs):
+    """Запоминает is_active/is_adult до сохранения, чтобы post_save посчитал разницу."""
+    if raw or instance._state.adding:
+        instance._counter_flags = None
+        return
+
+    instance._counter_flags = (
+        Book.objects.filter(pk=instance.pk).values_list("is_active", "is_adult").first()
+    )
+
+
+@receiver(post_save, sender=Book)
+def book_flags_counter_signal(sender, instance: Book, created: bool, raw=False, **kwargs):
+    # Новая книга ещё без категорий — её вклад учтёт m2m_changed.
+    old_flags = getattr(instance, "_counter_flags", None)
+    if raw or created or old_flags is None:
+        return
+
+    old_active, old_adult = BookCategoryCounterRepository.contribution(
+        is_active=old_flags[0], is_adult=old_flags[1]
+    )
+    new_active, new_adult = BookCategoryCounterRepository.contribution(
+        is_active=instance.is_active, is_adult=instance.is_adult
+    )
+    if (old_active, old_adult) == (new_active, new_adult):
+        return
+
+    BookCategoryCounterRepository.shift(
+        instance.category.values_list("pk", flat=True),
+        active=new_active - old_active,
+        adult=new_adult - old_adult,
+    )
+
+
+@receiver(pre_delete, sender=Book)
+def book_delete_counter_signal(sender, instance: Book, **kwargs):
+    # Строки M2M удаляются каскадом без m2m_changed — вычитаем вклад книги заранее.
+    active, adult = BookCategoryCounterRepository.contribution(
+        is_active=instance.is_active, is_adult=instance.is_adult
+    )
+    BookCategoryCounterRepository.shift(
+        instance.category.values_list("pk", flat=True), active=-active, adult=-adult
+    )
+
+
+@receiver(m2m_changed, sender=Book.category.through)
+def book_category_counter_signal(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Связь книга-категория изменилась с любой стороны.
+
+    forward: book.category.add/remove/clear  — instance это Book, pk_set это категории.
+    reverse: category.books.add/remove/clear — instance это BookCategory, pk_set это книги.
+    При clear pk_set пуст, поэтому затронутые id снимаются на pre_clear.
+    При remove pk_set содержит все переданные id, даже не связанные, — на pre_remove
+    оставляем только реально связанные, иначе счётчик уменьшится у чужой категории.
+    """
+    if action == "pre_remove":
+        if reverse:
+            links = sender.objects.filter(bookcategory_id=instance.pk, book_id__in=pk_set)
+            instance._counter_removed_ids = list(links.values_list("book_id", flat=True))
+        else:
+            links = sender.objects.filter(book_id=instance.pk, bookcategory_id__in=pk_set)
+            instance._counter_removed_ids = list(links.values_list("bookcategory_id", flat=True))
+        return
+
+    if action == "pre_clear":
+        if reverse:
+            instance._counter_cleared_ids = list(instance.books.values_list("pk", flat=True))
+        else:
+            instance._counter_cleared_ids = list(instance.category.values_list("pk", flat=True))
+        return
+
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    sign = 1 if action == "post_add" else -1
+    if action == "post_add":
+        ids = pk_set
+    elif action == "post_remove":
+        ids = getattr(instance, "_counter_removed_ids", [])
+    else:
+        ids = getattr(instance, "_counter_cleared_ids", [])
+
+    if reverse:
+        BookCategoryCounterRepository.shift_for_books(instance.pk, ids, sign=sign)
+        return
+
+    active, adult = BookCategoryCounterRepository.contribution(
+        is_active=instance.is_active, is_adult=instance.is_adult
+    )
+    BookCategoryCounterRepository.shift(ids, active=sign * active, adult=sign * adult)
+
+
 for obj in [Book, BookCategory]:
     connect_media_cleanup(obj)
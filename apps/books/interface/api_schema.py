@@ -0,0 +1,48 @@
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, OpenApiResponse
+
+from apps.books.api.serializers import BookCategoryProjection, BookListProjection
+from commons.interfaces.projections import sparse_fields_parameters
+
+book_export_schema = dict(
+    summary="Потоковая выгрузка каталога",
+    description=(
+        "Отдаёт все активные книги одним потоком (без пагинации) в формате JSONL или CSV. "
+        "Колонки совпадают с командой import_catalog. Книги 18+ скрыты для пользователей младше 18. "
+        "Только для авторизованных клиентов, не чаще CATALOG_EXPORT_RATE."
+    ),
+    parameters=[
+        OpenApiParameter(
+            name="output",
+            type=OpenApiTypes.STR,
+            enum=["jsonl", "csv"],
+            default="jsonl",
+            description="Формат выгрузки.",
+        ),
+        OpenApiParameter(
+            name="compress",
+            type=OpenApiTypes.STR,
+            enum=["gzip"],
+            required=False,
+            description="Сжать выгрузку gzip (файл .gz).",
+        ),
+    ],
+    responses={
+        (200, "application/x-ndjson"): OpenApiResponse(response=OpenApiTypes.BINARY),
+        (200, "text/csv"): OpenApiResponse(response=OpenApiTypes.BINARY),
+        400: OpenApiResponse(description="Неизвестный формат выгрузки."),
+    },
+)
+
+
+book_list_schema = dict(
+    parameters=sparse_fields_parameters(BookListProjection),
+)
+
+book_category_list_schema = dict(
+    parameters=sparse_fields_parameters(BookCategoryProjection),
+)
+
+book_category_books_schema = dict(
+    parameters=sparse_fields_parameters(BookListProjection),
+)
@@ -0,0 +1,84 @@
+from typing import Any, Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.manager import BaseManager
+from django.utils.translation import get_language
+from drf_spectacular.utils import extend_schema_field
+from rest_framework import serializers
+
+from apps.books.api.serializers import BookListProjection, BookListSerializer
+from apps.books.infrastructure.selectors import get_books_for_cards
+from commons.services.cache_versions import CATALOG, get_cache_versions
+
+
+def get_book_cards(book_ids: Iterable[int]) -> dict[int, dict[str, Any]]:
+    """
+    Карточки книг (JSON BookListSerializer) на текущем языке: book_id -> карточка.
+
+    Зачем:
+    Книга встраивается в корзину, избранное и подборки, и каждый раз сериализовалась
+    заново — с переводами, авторами и категориями. Карточка кешируется на книгу
+    и язык под номером версии CATALOG: все карточки списка читаются одним get_many,
+    промахи собираются одним запросом через BookListProjection и пишутся одним set_many.
+    """
+    ids = set(book_ids)
+    if not ids:
+        return {}
+
+    (version,) = get_cache_versions(CATALOG)
+    prefix = f"book-card:{get_language()}:{version}:"
+    keys = {book_id: f"{prefix}{book_id}" for book_id in ids}
+
+    cached = cache.get_many(list(keys.values()))
+    cards = {book_id: cached[key] for book_id, key in keys.items() if key in cached}
+
+    missing = ids - cards.keys()
+    if missing:
+        rows = BookListProjection.project(get_books_for_cards(ids=missing))
+        built = {card["id"]: card for card in BookListProjection(rows).data}
+        cache.set_many(
+            {keys[book_id]: card for book_id, card in built.items()},
+            settings.RESPONSE_CACHE_TIMEOUT,
+        )
+        cards.update(built)
+
+    return cards
+
+
+# Сериализатор строки со встроенной книгой (позиция корзины, избранное, книга подборки).
+# Комментарий, а не docstring: drf-spectacular взял бы его в описание схемы.
+#
+# Карточка берётся из get_book_cards по book_id строки. В списке (many=True
+# с BookCardListSerializer) карточки всех строк загружены заранее одним get_many.
+class BookCardsMixin:
+    book_id_attr = "book_id"
+
+    def get_book_card(self, instance) -> dict[str, Any] | None:
+        book_id = getattr(instance, self.book_id_attr)
+        cards = getattr(self, "book_cards", None) or {}
+        if book_id not in cards:
+            cards = get_book_cards([book_id])
+        return cards.get(book_id)
+
+
+@extend_schema_field(BookListSerializer)
+class BookCardField(serializers.Field):
+    """Книга как карточка (JSON BookListSerializer); родитель — сериализатор с BookCardsMixin."""
+
+    def __init__(self, **kwargs):
+        kwargs["read_only"] = True
+        kwargs["source"] = "*"
+        super().__init__(**kwargs)
+
+    def to_representation(self, instance):
+        return self.parent.get_book_card(instance)
+
+
+class BookCardListSerializer(serializers.ListSerializer):
+    """ListSerializer, который перед сериализацией строк достаёт карточки всех книг одним get_many."""
+
+    def to_representation(self, data):
+        items = list(data.all() if isinstance(data, BaseManager) else data)
+        self.child.book_cards = get_book_cards(getattr(item, self.child.book_id_attr) for item in items)
+        return super().to_representation(items)
@@ -0,0 +1,70 @@
+import csv
+import io
+import json
+import zlib
+from typing import Any, Iterable, Iterator
+
+from apps.books.infrastructure.repositories import CATALOG_LANGUAGES
+
+EXPORT_FORMATS = {
+    "jsonl": ("application/x-ndjson", "jsonl"),
+    "csv": ("text/csv", "csv"),
+}
+
+EXPORT_COLUMNS = (
+    ["slug"]
+    + [f"name_{lang}" for lang in CATALOG_LANGUAGES]
+    + [f"description_{lang}" for lang in CATALOG_LANGUAGES]
+    + ["is_active", "price", "in_stock", "is_adult", "authors", "categories", "image"]
+)
+
+# Сколько байт копить перед отдачей клиенту: меньше — лишние syscalls, больше — память.
+FLUSH_SIZE = 64 * 1024
+
+
+def encode_catalog(rows: Iterable[dict[str, Any]], *, output: str, compress: bool = False) -> Iterator[bytes]:
+    """
+    Превращает поток строк каталога в поток байт (JSONL или CSV, опционально gzip).
+
+    Колонки совпадают с форматом import_catalog — выгрузку можно загрузить обратно.
+    """
+    chunks = _encode_csv(rows) if output == "csv" else _encode_jsonl(rows)
+    return _gzip(chunks) if compress else chunks
+
+
+def _encode_jsonl(rows: Iterable[dict[str, Any]]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write(json.dumps(row, ensure_ascii=False))
+        buffer.write("\n")
+        if buffer.tell() >= FLUSH_SIZE:
+            yield buffer.getvalue().encode()
+            buffer = io.StringIO()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def _encode_csv(rows: Iterable[dict[str, Any]]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS, extrasaction="ignore")
+    writer.writeheader()
+
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= FLUSH_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def _gzip(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31 — gzip-заголовок
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
@@ -0,0 +1,6 @@
+from rest_framework.throttling import UserRateThrottle
+
+
+class CatalogExportThrottle(UserRateThrottle):
+    # Выгрузка всего каталога дорогая: отдельный лимит на пользователя (CATALOG_EXPORT_RATE).
+    scope = "catalog_export"
@@ -0,0 +1,85 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.books.api.serializers import (BookCategoryProjection,
+                                        BookCategorySerializer,
+                                        BookListProjection,
+                                        BookListSerializer)
+from apps.books.infrastructure.selectors import get_active_categories, get_allowed_books
+from apps.gallery.api.serializers import GalleryListProjection, GalleryListSerializer
+from apps.gallery.infrastructure.selectors import get_active_galleries
+from apps.recommendations.api.serializers import (RecommendationListProjection,
+                                                  RecommendationListSerializer)
+from apps.recommendations.infrastructure.selectors import get_active_recommendations
+from apps.services.api.serializers import ServiceListProjection, ServiceListSerializer
+from apps.services.infrastructure.selectors import get_active_services
+
+ENDPOINTS = {
+    "books": (lambda: get_allowed_books(user_age=18, for_list=True), BookListSerializer, BookListProjection),
+    "categories": (lambda: get_active_categories(user_age=18), BookCategorySerializer, BookCategoryProjection),
+    "galleries": (get_active_galleries, GalleryListSerializer, GalleryListProjection),
+    "services": (get_active_services, ServiceListSerializer, ServiceListProjection),
+    "recommendations": (get_active_recommendations, RecommendationListSerializer, RecommendationListProjection),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares ModelSerializer and values()-projection list paths: "
+        "checks that both produce the same JSON and reports timings."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("endpoints", nargs="*", help=f"Any of: {', '.join(ENDPOINTS)}. Defaults to all.")
+        parser.add_argument("--per-page", type=int, default=100)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, endpoints: list[str], per_page: int, repeat: int, **options):
+        unknown = set(endpoints) - set(ENDPOINTS)
+        if unknown:
+            raise CommandError(f"Unknown endpoints: {', '.join(sorted(unknown))}")
+
+        request = Request(APIRequestFactory().get("/"))
+        context = {"request": request}
+        mismatched = []
+
+        for name in endpoints or ENDPOINTS:
+            selector, serializer_class, projection_class = ENDPOINTS[name]
+
+            serializer_data, serializer_time = self._measure(
+                lambda: serializer_class(list(selector()[:per_page]), many=True, context=context).data,
+                repeat,
+            )
+            projection_data, projection_time = self._measure(
+                lambda: projection_class(
+                    list(projection_class.project(selector())[:per_page]), context=context
+                ).data,
+                repeat,
+            )
+
+            same = [dict(item) for item in serializer_data] == projection_data
+            if not same:
+                mismatched.append(name)
+
+            self.stdout.write(
+                f"{name:<16} rows={len(projection_data):<5} "
+                f"serializer={serializer_time * 1000:8.2f}ms "
+                f"projection={projection_time * 1000:8.2f}ms "
+                f"x{serializer_time / max(projection_time, 1e-9):.1f} "
+                + (self.style.SUCCESS("same") if same else self.style.ERROR("DIFFERENT"))
+            )
+
+        if mismatched:
+            raise CommandError(f"Projection output differs from serializer: {', '.join(mismatched)}")
+
+    @staticmethod
+    def _measure(build, repeat: int):
+        """Среднее CPU-время на страницу (запрос к БД + сериализация)."""
+        data = None
+        started = time.process_time()
+        for _ in range(repeat):
+            data = build()
+        return data, (time.process_time() - started) / max(repeat, 1)
@@ -0,0 +1,98 @@
+import datetime
+import time
+import uuid
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+from apps.books.api.serializers import BookListProjection
+from apps.books.infrastructure.selectors import get_allowed_books
+from commons.interfaces.renderers import ORJSONRenderer
+
+
+def _edge_cases() -> dict[str, object]:
+    """Значения, на которых orjson и stdlib json расходятся, если их не выровнять."""
+    now = datetime.datetime(2026, 10, 19, 12, 30, 15, 123456)
+    return {
+        "decimal": {"total_price": Decimal("1250.50"), "zero": Decimal("0"), "small": Decimal("0.1")},
+        "datetime_naive": now,
+        "datetime_utc": now.replace(tzinfo=datetime.timezone.utc),
+        "datetime_offset": now.replace(microsecond=0, tzinfo=datetime.timezone(datetime.timedelta(hours=5))),
+        "date": now.date(),
+        "time": now.time(),
+        "timedelta": datetime.timedelta(minutes=15),
+        "lazy": _("Not found."),
+        "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "return_dict": ReturnDict({"id": 1, "name": "Kitap"}, serializer=None),
+        "return_list": ReturnList([{"id": 1}, {"id": 2}], serializer=None),
+        "int_keys": {1: "a", 2: "b"},
+        "unicode": "Türkmen dili — Русский «текст» ☕",
+        "separators": "line\u2028paragraph\u2029end",
+        "control": "tab\tnewline\nquote\"backslash\\",
+        "numbers": [0, -1, 2**53, 1.5, 0.1, 100.0],
+        "empty": [[], {}, "", None, True, False],
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Checks that ORJSONRenderer output is byte-identical to DRF JSONRenderer "
+        "on edge cases and real book pages, and compares render time."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--per-page", type=int, default=100)
+        parser.add_argument("--repeat", type=int, default=200)
+
+    def handle(self, *args, per_page: int, repeat: int, **options):
+        request = Request(APIRequestFactory().get("/"))
+        books = list(BookListProjection.project(get_allowed_books(user_age=18, for_list=True))[:per_page])
+        page = {
+            "count": len(books),
+            "results": BookListProjection(books, context={"request": request}).data,
+        }
+
+        payloads = {
+            **{f"edge:{name}": value for name, value in _edge_cases().items()},
+            "edge:all": _edge_cases(),
+            f"books:{len(books)}": page,
+            "error": {"detail": _("Not found.")},
+            "created_at": {"created_at": timezone.now()},
+        }
+
+        stock, fast = JSONRenderer(), ORJSONRenderer()
+        mismatched = []
+
+        for name, payload in payloads.items():
+            expected = stock.render(payload)
+            actual = fast.render(payload)
+            if expected != actual:
+                mismatched.append(name)
+                self.stdout.write(self.style.ERROR(f"{name}: {expected!r} != {actual!r}"))
+
+        for name in (f"books:{len(books)}", "edge:all"):
+            stock_time = self._measure(stock, payloads[name], repeat)
+            fast_time = self._measure(fast, payloads[name], repeat)
+            self.stdout.write(
+                f"{name:<12} bytes={len(fast.render(payloads[name])):<8} "
+                f"json={stock_time * 1e6:9.1f}us orjson={fast_time * 1e6:9.1f}us "
+                f"x{stock_time / max(fast_time, 1e-9):.1f}"
+            )
+
+        if mismatched:
+            raise CommandError(f"ORJSONRenderer output differs: {', '.join(mismatched)}")
+
+        self.stdout.write(self.style.SUCCESS(f"{len(payloads)} payloads byte-identical"))
+
+    @staticmethod
+    def _measure(renderer, payload, repeat: int) -> float:
+        started = time.process_time()
+        for _ in range(repeat):
+            renderer.render(payload)
+        return (time.process_time() - started) / max(repeat, 1)
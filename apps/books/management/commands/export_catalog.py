@@ -0,0 +1,57 @@
+import sys
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+from apps.books.infrastructure.selectors import iter_catalog_export_rows
+from apps.books.interface.exports import EXPORT_FORMATS, encode_catalog
+
+
+class Command(BaseCommand):
+    help = (
+        "Streams all active books to a CSV/JSONL file (optionally gzipped) "
+        "in the import_catalog format."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", nargs="?", type=Path, help="Output file. Defaults to stdout.")
+        parser.add_argument("--output", choices=tuple(EXPORT_FORMATS), default="jsonl")
+        parser.add_argument("--gzip", action="store_true", dest="compress")
+        parser.add_argument("--chunk-size", type=int, default=2000)
+        parser.add_argument(
+            "--include-adult",
+            action="store_true",
+            help="Include 18+ books (excluded by default, as for anonymous API clients).",
+        )
+
+    def handle(self, *args, path: Path | None, output: str, compress: bool, chunk_size: int,
+               include_adult: bool, **options):
+        started = time.monotonic()
+        exported = 0
+
+        def counted_rows():
+            nonlocal exported
+            for row in iter_catalog_export_rows(user_age=18 if include_adult else 0, chunk_size=chunk_size):
+                exported += 1
+                yield row
+
+        chunks = encode_catalog(counted_rows(), output=output, compress=compress)
+
+        if path is None:
+            for chunk in chunks:
+                sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
+            return
+
+        with path.open("wb") as target:
+            for chunk in chunks:
+                target.write(chunk)
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Exported {exported} books to {path} in {elapsed:.1f}s "
+                f"({exported / max(elapsed, 1e-9):.0f} rows/s)"
+            )
+        )
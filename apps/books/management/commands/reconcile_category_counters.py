@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from apps.books.infrastructure.repositories import BookCategoryCounterRepository
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalculates BookCategory.active_books_count / active_adult_books_count "
+        "from the book-category links. Run after bulk updates that bypass signals."
+    )
+
+    def handle(self, *args, **options):
+        fixed = BookCategoryCounterRepository.reconcile()
+        self.stdout.write(self.style.SUCCESS(f"Reconciled counters, {fixed} categories were out of date."))
@@ -0,0 +1,50 @@
+# Generated by Django 6.0.1 on 2026-10-19 12:05
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_counters(apps, schema_editor):
+    BookCategory = apps.get_model("books", "BookCategory")
+    Book = apps.get_model("books", "Book")
+    links = Book.category.through.objects.filter(
+        bookcategory_id=OuterRef("pk"), book__is_active=True
+    )
+
+    def counter(queryset):
+        return Coalesce(
+            Subquery(
+                queryset.order_by()
+                .values("bookcategory_id")
+                .annotate(total=Count("*"))
+                .values("total")
+            ),
+            0,
+        )
+
+    BookCategory.objects.update(
+        active_books_count=counter(links),
+        active_adult_books_count=counter(links.filter(book__is_adult=True)),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("books", "0005_add_pg_trgm_extension"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bookcategory",
+            name="active_adult_books_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="bookcategory",
+            name="active_books_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(fill_counters, migrations.RunPython.noop),
+    ]
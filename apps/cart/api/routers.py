@@ -16,5 +16,6 @@ cart - базовый URL: /api/cart/
 - PATCH  /api/cart/update-quantity/{book_id}/ - update_quantity action
 - DELETE /api/cart/remove/{book_id}/          - remove action
 - DELETE /api/cart/clear/     - clear action
+- POST   /api/cart/batch/     - batch action
 """
 router.register(r'cart', CartViewSet, basename='cart')
@@ -1,12 +1,15 @@
 from rest_framework import serializers
 
 from apps.books.infrastructure.models import Book
+from apps.books.interface.book_cards import (BookCardField,
+                                            BookCardListSerializer,
+                                            BookCardsMixin)
 from apps.cart.infrastructure.models import Cart, CartItem
-from apps.books.api.serializers import BookListSerializer
+from apps.cart.infrastructure.repositories import BATCH_OPS, OP_ADD
 
 
-class CartItemSerializer(serializers.ModelSerializer):
-    book = BookListSerializer(read_only=True)
+class CartItemSerializer(BookCardsMixin, serializers.ModelSerializer):
+    book = BookCardField()
     subtotal = serializers.SerializerMethodField()
 
     class Meta:
@@ -20,21 +23,12 @@ class CartItemSerializer(serializers.ModelSerializer):
             'updated_at'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
+        list_serializer_class = BookCardListSerializer
 
     @staticmethod
     def get_subtotal(obj: CartItem) -> float:
         return obj.book.price * obj.quantity
 
-    def to_representation(self, instance: CartItem) -> dict:
-        representation = super().to_representation(instance)
-        request = self.context.get('request')
-        book_serializer = BookListSerializer(
-            instance.book,
-            context={'request': request}
-        )
-        representation['book'] = book_serializer.data
-        return representation
-
 
 class CartSerializer(serializers.ModelSerializer):
     items = CartItemSerializer(many=True, read_only=True)
@@ -58,7 +52,7 @@ class CartSerializer(serializers.ModelSerializer):
         return obj.total_items
 
     def get_total_price(self, obj: Cart) -> float:
-        return sum(item.subtotal for item in obj.items.all())
+        return obj.total_price
 
 
 class AddToCartSerializer(serializers.Serializer):
@@ -112,3 +106,48 @@ class UpdateCartItemSerializer(serializers.Serializer):
         max_value=999,
         help_text="Новое количество (0 для удаления)"
     )
+
+
+class CartBatchLineSerializer(serializers.Serializer):
+    book_id = serializers.IntegerField(
+        min_value=0,
+        help_text="ID книги"
+    )
+    quantity = serializers.IntegerField(
+        default=1,
+        min_value=0,
+        max_value=999,
+        help_text="add — сколько добавить, set — новое количество (0 удаляет), remove — не используется"
+    )
+    op = serializers.ChoiceField(
+        choices=BATCH_OPS,
+        default=OP_ADD,
+        help_text="add — добавить к текущему, set — установить, remove — удалить позицию"
+    )
+
+    def validate(self, attrs: dict) -> dict:
+        if attrs['op'] == OP_ADD and attrs['quantity'] < 1:
+            raise serializers.ValidationError(
+                "Quantity must be at least 1"
+            )
+        return attrs
+
+
+class CartBatchSerializer(serializers.Serializer):
+    items = CartBatchLineSerializer(
+        many=True,
+        allow_empty=False,
+        max_length=100,
+        help_text="Изменения применяются по порядку (до 100 строк)"
+    )
+
+
+class CartBatchErrorSerializer(serializers.Serializer):
+    index = serializers.IntegerField(help_text="Номер строки в items")
+    book_id = serializers.IntegerField()
+    error = serializers.CharField()
+
+
+class CartBatchResultSerializer(serializers.Serializer):
+    cart = CartSerializer()
+    errors = CartBatchErrorSerializer(many=True)
@@ -1,7 +1,9 @@
+from typing import Optional
+
 from drf_spectacular.utils import extend_schema
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 
@@ -10,15 +12,25 @@ from apps.cart.api.serializers import (
     CartItemSerializer,
     AddToCartSerializer,
     UpdateCartItemSerializer,
+    CartBatchSerializer,
 )
+from apps.cart.interface.throttles import GuestCartThrottle
 from apps.cart.interface.api_schema import (
     cart_list_schema, cart_add_schema, cart_patch_schema,
     cart_clear_schema, cart_remove_schema, cart_summary_schema,
+    cart_batch_schema,
+)
+from apps.cart.infrastructure.guest_cart import (
+    get_guest_token,
+    new_guest_token,
+    set_guest_token,
 )
-from apps.cart.infrastructure.repositories import CartRepository
+from apps.cart.infrastructure.repositories import CartRepository, GuestCartRepository
 from apps.cart.infrastructure.selectors import (
-    get_cart_with_items,
+    get_current_cart,
     get_cart_summary,
+    get_guest_cart,
+    get_guest_cart_summary,
 )
 
 
@@ -31,22 +43,50 @@ class CartViewSet(viewsets.ViewSet):
     - DELETE /cart/remove/{book_id}/ - удалить книгу
     - DELETE /cart/clear/ - очистить корзину
     - GET /cart/summary/ - краткая сводка
+    - POST /cart/batch/ - несколько изменений за один запрос
+
+    Без авторизации (кроме batch) работает гостевая корзина по подписанной cookie;
+    при входе она сливается в корзину пользователя.
     """
-    permission_classes = [IsAuthenticated]
+    permission_classes = [AllowAny]
+
+    def get_permissions(self):
+        if self.action == 'batch':
+            return [IsAuthenticated()]
+        return super().get_permissions()
+
+    def get_throttles(self):
+        # Для вошедшего пользователя AnonRateThrottle не считает запросы.
+        if self.request.method not in ('GET', 'HEAD', 'OPTIONS'):
+            return super().get_throttles() + [GuestCartThrottle()]
+        return super().get_throttles()
+
+    @staticmethod
+    def _guest_token(request: Request) -> Optional[str]:
+        # Для вошедшего пользователя гостевой корзины нет.
+        if request.user.is_authenticated:
+            return None
+        return get_guest_token(request) or new_guest_token()
 
     @extend_schema(**cart_list_schema)
     def list(self, request: Request) -> Response:
-        cart = get_cart_with_items(request.user)
+        return Response(self._cart_data(request))
+
+    @staticmethod
+    def _cart_data(request: Request) -> dict:
+        if request.user.is_authenticated:
+            cart = get_current_cart(request.user)
+        else:
+            cart = get_guest_cart(get_guest_token(request))
         if not cart:
-            return Response({
+            return {
                 'id': None,
                 'items': [],
                 'total_items': 0,
                 'total_price': 0.0
-            })
+            }
 
-        serializer = CartSerializer(cart, context={'request': request})
-        return Response(serializer.data)
+        return CartSerializer(cart, context={'request': request}).data
 
     @extend_schema(**cart_add_schema)
     @action(detail=False, methods=['post'])
@@ -64,21 +104,32 @@ class CartViewSet(viewsets.ViewSet):
         book_id = serializer.validated_data['book_id']
         quantity = serializer.validated_data['quantity']
 
-        cart_item, created = CartRepository.add_item(
-            user=request.user,
-            book_id=book_id,
-            quantity=quantity
-        )
+        token = self._guest_token(request)
+        if token:
+            cart_item, created = GuestCartRepository.add_item(
+                token=token,
+                book_id=book_id,
+                quantity=quantity
+            )
+        else:
+            cart_item, created = CartRepository.add_item(
+                user=request.user,
+                book_id=book_id,
+                quantity=quantity
+            )
 
         item_serializer = CartItemSerializer(cart_item, context={'request': request})
 
-        return Response(
+        response = Response(
             {
                 'message': 'Item added to cart' if created else 'Quantity updated',
                 'item': item_serializer.data
             },
             status=status.HTTP_201_CREATED if created else status.HTTP_200_OK
         )
+        if token:
+            set_guest_token(response, token)
+        return response
 
     @extend_schema(**cart_patch_schema)
     @action(detail=False, methods=['patch'], url_path='update-quantity/(?P<book_id>[0-9]+)')
@@ -92,12 +143,20 @@ class CartViewSet(viewsets.ViewSet):
 
         quantity = serializer.validated_data['quantity']
 
+        token = self._guest_token(request)
         try:
-            cart_item = CartRepository.update_quantity(
-                user=request.user,
-                book_id=int(book_id),
-                quantity=quantity
-            )
+            if token:
+                cart_item = GuestCartRepository.update_quantity(
+                    token=token,
+                    book_id=int(book_id),
+                    quantity=quantity
+                )
+            else:
+                cart_item = CartRepository.update_quantity(
+                    user=request.user,
+                    book_id=int(book_id),
+                    quantity=quantity
+                )
 
             if cart_item is None:
                 return Response(
@@ -106,13 +165,16 @@ class CartViewSet(viewsets.ViewSet):
                 )
 
             item_serializer = CartItemSerializer(cart_item)
-            return Response(
+            response = Response(
                 {
                     'message': 'Quantity updated',
                     'item': item_serializer.data
                 },
                 status=status.HTTP_200_OK
             )
+            if token:
+                set_guest_token(response, token)
+            return response
 
         except Exception as e:
             return Response(
@@ -126,10 +188,14 @@ class CartViewSet(viewsets.ViewSet):
         """
         DELETE /api/cart/remove/5/
         """
-        success = CartRepository.remove_item(
-            user=request.user,
-            book_id=int(book_id)
-        )
+        token = self._guest_token(request)
+        if token:
+            success = GuestCartRepository.remove_item(token=token, book_id=int(book_id))
+        else:
+            success = CartRepository.remove_item(
+                user=request.user,
+                book_id=int(book_id)
+            )
 
         if success:
             return Response(
@@ -148,7 +214,11 @@ class CartViewSet(viewsets.ViewSet):
         """
         DELETE /api/cart/clear/
         """
-        deleted_count = CartRepository.clear_cart(request.user)
+        token = self._guest_token(request)
+        if token:
+            deleted_count = GuestCartRepository.clear_cart(token)
+        else:
+            deleted_count = CartRepository.clear_cart(request.user)
 
         return Response(
             {
@@ -174,5 +244,35 @@ class CartViewSet(viewsets.ViewSet):
         - Бейдж на иконке корзины: "5 товаров"
         - Быстрый запрос без загрузки всех данных
         """
-        summary = get_cart_summary(request.user)
+        if request.user.is_authenticated:
+            summary = get_cart_summary(request.user)
+        else:
+            summary = get_guest_cart_summary(get_guest_token(request))
         return Response(summary)
+
+    @extend_schema(**cart_batch_schema)
+    @action(detail=False, methods=['post'])
+    def batch(self, request: Request) -> Response:
+        """
+        POST /api/cart/batch/
+        Body: {"items": [{"book_id": 1, "quantity": 2, "op": "add"}, ...]}
+
+        Зачем:
+        - «Повторить заказ» и «восстановить корзину» за один запрос вместо запроса на книгу
+        - Ошибки по строкам не отменяют остальные изменения
+        """
+        serializer = CartBatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        errors = CartRepository.apply_batch(
+            user=request.user,
+            lines=serializer.validated_data['items']
+        )
+
+        return Response(
+            {
+                'cart': self._cart_data(request),
+                'errors': errors
+            },
+            status=status.HTTP_200_OK
+        )
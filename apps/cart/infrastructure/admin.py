@@ -1,8 +1,34 @@
 from django.contrib import admin
+from django.db import transaction
 from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 
-from apps.cart.infrastructure.models import Cart, CartItem
+from apps.cart.infrastructure.hot_cart import HotCartStore
+from apps.cart.infrastructure.models import AbandonedCart, Cart, CartItem
+
+
+class HotCartInvalidationMixin:
+    """Правки из админки идут в обход HotCartStore — после них корзина перечитывается из БД."""
+
+    @staticmethod
+    def get_cart_user_id(obj) -> int:
+        return obj.user_id
+
+    def _invalidate(self, objs) -> None:
+        user_ids = {self.get_cart_user_id(obj) for obj in objs}
+        transaction.on_commit(lambda: [HotCartStore.invalidate(user_id) for user_id in user_ids])
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        self._invalidate([obj])
+
+    def delete_model(self, request, obj):
+        self._invalidate([obj])
+        super().delete_model(request, obj)
+
+    def delete_queryset(self, request, queryset):
+        self._invalidate(list(queryset))
+        super().delete_queryset(request, queryset)
 
 
 class CartItemInline(admin.TabularInline):
@@ -43,7 +69,7 @@ class CartItemInline(admin.TabularInline):
 
 
 @admin.register(Cart)
-class CartAdmin(admin.ModelAdmin):
+class CartAdmin(HotCartInvalidationMixin, admin.ModelAdmin):
     list_display = [
         'id',
         'user_link',
@@ -101,7 +127,7 @@ class CartAdmin(admin.ModelAdmin):
 
 
 @admin.register(CartItem)
-class CartItemAdmin(admin.ModelAdmin):
+class CartItemAdmin(HotCartInvalidationMixin, admin.ModelAdmin):
     list_display = [
         'id',
         'cart_user',
@@ -134,6 +160,10 @@ class CartItemAdmin(admin.ModelAdmin):
     ordering = ['-created_at']
     list_per_page = 25
 
+    @staticmethod
+    def get_cart_user_id(obj) -> int:
+        return obj.cart.user_id
+
     def cart_user(self, obj):
         return format_html(
             '<a href="/admin-panel/cart/cart/{}/change/">{}</a>',
@@ -156,3 +186,45 @@ class CartItemAdmin(admin.ModelAdmin):
 
     def has_add_permission(self, request):
         return False
+
+
+@admin.register(AbandonedCart)
+class AbandonedCartAdmin(admin.ModelAdmin):
+    list_display = [
+        'id',
+        'user',
+        'total_items',
+        'total_price',
+        'last_activity_at',
+        'created_at'
+    ]
+
+    list_filter = [
+        'created_at',
+        'last_activity_at'
+    ]
+
+    search_fields = [
+        'user__email',
+        'user__nickname'
+    ]
+
+    readonly_fields = [
+        'user',
+        'items',
+        'total_items',
+        'total_price',
+        'last_activity_at',
+        'created_at',
+        'updated_at'
+    ]
+
+    list_select_related = ['user']
+    ordering = ['-created_at']
+    list_per_page = 25
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,122 @@
+import logging
+import time
+from datetime import datetime
+from functools import partial
+from typing import Optional
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+
+from apps.cart.infrastructure.hot_cart import HotCartStore
+from apps.cart.infrastructure.models import AbandonedCart, Cart, CartItem
+
+logger = logging.getLogger(__name__)
+
+
+def _idle_carts(cutoff: datetime):
+    # С позициями, и ни одна позиция не менялась после cutoff (в БД-режиме
+    # изменения позиций не трогают Cart.updated_at).
+    return Cart.objects.filter(
+        updated_at__lt=cutoff
+    ).filter(
+        Exists(CartItem.objects.filter(cart=OuterRef("pk")))
+    ).exclude(
+        Exists(CartItem.objects.filter(cart=OuterRef("pk"), updated_at__gte=cutoff))
+    )
+
+
+def _next_batch(cutoff: datetime, after: Optional[tuple[datetime, int]], size: int) -> list[tuple]:
+    queryset = _idle_carts(cutoff)
+    if after is not None:
+        updated_at, cart_id = after
+        queryset = queryset.filter(Q(updated_at__gt=updated_at) | Q(updated_at=updated_at, id__gt=cart_id))
+    return list(
+        queryset.order_by("updated_at", "id").values_list("id", "user_id", "updated_at")[:size]
+    )
+
+
+def _compact(cart_ids: list[int], cutoff: datetime) -> tuple[int, int]:
+    """Одна короткая транзакция на пачку: архив активных корзин и удаление их позиций."""
+    with transaction.atomic():
+        # Корзины, которые прямо сейчас меняют (или уже ожили), пропускаем.
+        carts = {
+            cart_id: (user_id, updated_at, is_active)
+            for cart_id, user_id, updated_at, is_active in _idle_carts(cutoff)
+            .filter(pk__in=cart_ids)
+            .select_for_update(skip_locked=True, of=("self",))
+            .values_list("id", "user_id", "updated_at", "is_active")
+        }
+        # Корзины в Redis (HotCartStore) пропускаем — проверка после блокировки строк.
+        hot = HotCartStore.cached_user_ids([user_id for user_id, _, _ in carts.values()])
+        carts = {cart_id: cart for cart_id, cart in carts.items() if cart[0] not in hot}
+        if not carts:
+            return 0, 0
+
+        lines: dict[int, list[dict]] = {cart_id: [] for cart_id in carts}
+        for cart_id, book_id, quantity, price in CartItem.objects.filter(
+            cart_id__in=carts
+        ).values_list("cart_id", "book_id", "quantity", "book__price"):
+            lines[cart_id].append({"book_id": book_id, "quantity": quantity, "price": price})
+
+        # Позиции неактивной (оформленной) корзины уже есть в заказе — их просто удаляем.
+        AbandonedCart.objects.bulk_create([
+            AbandonedCart(
+                user_id=user_id,
+                items=lines[cart_id],
+                total_items=sum(line["quantity"] for line in lines[cart_id]),
+                total_price=sum(line["quantity"] * line["price"] for line in lines[cart_id]),
+                last_activity_at=updated_at,
+            )
+            for cart_id, (user_id, updated_at, is_active) in carts.items()
+            if is_active
+        ])
+        deleted, _ = CartItem.objects.filter(cart_id__in=carts).delete()
+
+        # Корзину, загруженную в Redis уже после проверки, хеш держал бы с удалёнными позициями.
+        for user_id, _, _ in carts.values():
+            transaction.on_commit(partial(HotCartStore.invalidate, user_id))
+
+    return len(carts), deleted
+
+
+def compact_idle_carts(*, cutoff: datetime, batch_size: int, max_batches: int) -> dict[str, float]:
+    """
+    Архивирует корзины без изменений с cutoff и удаляет их позиции из cart_item.
+
+    Зачем:
+    Позиции брошенных и оформленных корзин копились навсегда и замедляли админку
+    и запросы к корзинам. Обход — keyset по (updated_at, id) пачками по batch_size,
+    каждая пачка — своя короткая транзакция с SKIP LOCKED, поэтому работа идёт
+    под обычной нагрузкой. За запуск — не больше max_batches пачек.
+
+    Корзины, которые сейчас в Redis (HotCartStore), пропускаются: у них могут
+    быть несброшенные изменения. Проверка идёт внутри транзакции пачки, после
+    блокировки строк, а хеши архивированных корзин сбрасываются после коммита —
+    на случай загрузки в Redis между проверкой и коммитом.
+    """
+    started = time.monotonic()
+    carts = items = batches = 0
+    after = None
+
+    while batches < max_batches:
+        batch = _next_batch(cutoff, after, batch_size)
+        if not batch:
+            break
+        batches += 1
+        after = batch[-1][2], batch[-1][0]
+
+        compacted, deleted = _compact([cart_id for cart_id, _, _ in batch], cutoff)
+        carts += compacted
+        items += deleted
+
+        if len(batch) < batch_size:
+            break
+
+    elapsed = time.monotonic() - started
+    return {
+        "carts": carts,
+        "items": items,
+        "batches": batches,
+        "seconds": round(elapsed, 3),
+        "carts_per_second": round(carts / elapsed, 1) if elapsed else 0.0,
+    }
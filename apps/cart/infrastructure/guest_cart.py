@@ -0,0 +1,198 @@
+import secrets
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.books.infrastructure.models import Book
+from apps.cart.infrastructure.hot_cart import (CREATED, PRICE, QUANTITY, UPDATED, HotCart, _from_ms,
+                                               _now_ms, refresh_prices)
+from apps.cart.infrastructure.models import CartItem
+from commons.services.redis_client import get_redis_client
+
+KEY_TEMPLATE = "guest-cart:{}"
+COOKIE_SALT = "apps.cart.guest"
+
+# Хеш гостевой корзины — те же поля, что у HotCartStore: <prefix>:<book_id>.
+# ARGV[1] — TTL новой корзины, ARGV[2] — TTL существующей, ARGV[3] — now (мс), ARGV[4] — book_id.
+# Корзина, которую создали и больше не трогали, живёт GUEST_CART_NEW_TTL, а не GUEST_CART_TTL.
+EXPIRE_SNIPPET = """
+local ttl = ARGV[2]
+if existed == 0 then ttl = ARGV[1] end
+redis.call('EXPIRE', KEYS[1], ttl)
+"""
+
+ADD_SCRIPT = """
+local existed = redis.call('EXISTS', KEYS[1])
+local book = ARGV[4]
+local current = tonumber(redis.call('HGET', KEYS[1], 'q:' .. book) or '0')
+local total = current + tonumber(ARGV[5])
+if total > tonumber(ARGV[6]) then return {0, current} end
+redis.call('HSET', KEYS[1], 'q:' .. book, total, 'p:' .. book, ARGV[7], 'u:' .. book, ARGV[3])
+redis.call('HSETNX', KEYS[1], 'c:' .. book, ARGV[3])
+""" + EXPIRE_SNIPPET + """
+return {1, current}
+"""
+
+SET_SCRIPT = """
+local existed = redis.call('EXISTS', KEYS[1])
+local book = ARGV[4]
+redis.call('HSET', KEYS[1], 'q:' .. book, ARGV[5], 'p:' .. book, ARGV[6], 'u:' .. book, ARGV[3])
+redis.call('HSETNX', KEYS[1], 'c:' .. book, ARGV[3])
+""" + EXPIRE_SNIPPET + """
+return 1
+"""
+
+CLEAR_SCRIPT = """
+local count = 0
+for _, field in ipairs(redis.call('HKEYS', KEYS[1])) do
+    if string.sub(field, 1, 2) == 'q:' then count = count + 1 end
+end
+redis.call('DEL', KEYS[1])
+return count
+"""
+
+
+def new_guest_token() -> str:
+    return secrets.token_urlsafe(24)
+
+
+def get_guest_token(request) -> Optional[str]:
+    """Токен гостевой корзины из подписанной cookie; подделанная или чужая подпись — None."""
+    return request.get_signed_cookie(
+        settings.GUEST_CART_COOKIE,
+        default=None,
+        salt=COOKIE_SALT,
+        max_age=settings.GUEST_CART_TTL,
+    )
+
+
+def set_guest_token(response, token: str) -> None:
+    # Продлевается при каждом изменении — вместе с TTL корзины в кеше.
+    response.set_signed_cookie(
+        settings.GUEST_CART_COOKIE,
+        token,
+        salt=COOKIE_SALT,
+        max_age=settings.GUEST_CART_TTL,
+        secure=settings.SESSION_COOKIE_SECURE,
+        httponly=True,
+        samesite=settings.GUEST_CART_COOKIE_SAMESITE,
+    )
+
+
+def delete_guest_token(response) -> None:
+    response.delete_cookie(settings.GUEST_CART_COOKIE, samesite=settings.GUEST_CART_COOKIE_SAMESITE)
+
+
+class GuestCartStore:
+    """
+    Корзина анонимного пользователя в хеше Redis по токену из подписанной cookie.
+
+    Зачем:
+    Без неё фронтенд держал теневую корзину в local storage и после входа
+    повторял её запросом /cart/add/ на каждую книгу. Теперь корзина гостя
+    на сервере, а при входе сливается в корзину пользователя одним
+    CartRepository.merge_guest_cart.
+
+    Поля хеша как у HotCartStore (q/p/c/u:<book_id>), изменения — атомарные
+    Lua-скрипты: параллельные add одного гостя не теряют друг друга, а остаток
+    проверяется по количеству в хеше. Корзина живёт GUEST_CART_TTL секунд
+    с последнего изменения (новая, которую больше не меняли, — GUEST_CART_NEW_TTL).
+    Цена — снимок на момент добавления, при чтении берётся из карточки книги.
+    """
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return cache.make_key(KEY_TEMPLATE.format(token))
+
+    @staticmethod
+    def _client():
+        client = get_redis_client()
+        if client is None:
+            raise RuntimeError("Cart store is unavailable")
+        return client
+
+    @staticmethod
+    def _run(token: str, script: str, *args):
+        run = GuestCartStore._client().register_script(script)
+        return run(
+            keys=[GuestCartStore._key(token)],
+            args=[settings.GUEST_CART_NEW_TTL, settings.GUEST_CART_TTL, _now_ms(), *args],
+        )
+
+    @staticmethod
+    def get_lines(token: str) -> dict[int, tuple]:
+        """{book_id: (quantity, price, created_at, updated_at)}."""
+        state = GuestCartStore._client().hgetall(GuestCartStore._key(token))
+        values = {field.decode(): value for field, value in state.items()}
+
+        lines = {}
+        for field, value in values.items():
+            if not field.startswith(f"{QUANTITY}:"):
+                continue
+            book_id = int(field[2:])
+            lines[book_id] = (
+                int(value),
+                int(values[f"{PRICE}:{book_id}"]),
+                _from_ms(values[f"{CREATED}:{book_id}"]),
+                _from_ms(values[f"{UPDATED}:{book_id}"]),
+            )
+        return lines
+
+    @staticmethod
+    def get_quantities(token: str) -> dict[int, int]:
+        return {book_id: line[0] for book_id, line in GuestCartStore.get_lines(token).items()}
+
+    @staticmethod
+    def get_cart(token: str) -> HotCart:
+        lines = GuestCartStore.get_lines(token)
+        now = _from_ms(_now_ms())
+
+        items = []
+        for book_id, (quantity, price, created_at, updated_at) in lines.items():
+            item = CartItem(
+                book_id=book_id,
+                quantity=quantity,
+                created_at=created_at,
+                updated_at=updated_at,
+            )
+            item.book = Book(id=book_id, price=price)
+            items.append(item)
+
+        refresh_prices(items)
+        # Как ordering CartItem: новые сверху.
+        items.sort(key=lambda item: item.created_at, reverse=True)
+
+        return HotCart(
+            id=None,
+            is_active=True,
+            created_at=min((item.created_at for item in items), default=now),
+            updated_at=max((item.updated_at for item in items), default=now),
+            items=items,
+        )
+
+    @staticmethod
+    def get_item(token: str, book_id: int) -> Optional[CartItem]:
+        cart = GuestCartStore.get_cart(token)
+        return next((item for item in cart.items if item.book_id == book_id), None)
+
+    @staticmethod
+    def add_item(token: str, book: Book, quantity: int) -> tuple[bool, int]:
+        """Прибавляет quantity, если сумма не больше остатка; возвращает (добавлено, количество до)."""
+        added, current = GuestCartStore._run(token, ADD_SCRIPT, book.pk, quantity, book.in_stock, book.price)
+        return bool(added), int(current)
+
+    @staticmethod
+    def set_quantity(token: str, book: Book, quantity: int) -> CartItem:
+        GuestCartStore._run(token, SET_SCRIPT, book.pk, quantity, book.price)
+        return GuestCartStore.get_item(token, book.pk)
+
+    @staticmethod
+    def remove_item(token: str, book_id: int) -> bool:
+        client = GuestCartStore._client()
+        fields = [f"{prefix}:{book_id}" for prefix in (QUANTITY, PRICE, CREATED, UPDATED)]
+        return client.hdel(GuestCartStore._key(token), *fields) > 0
+
+    @staticmethod
+    def clear(token: str) -> int:
+        return GuestCartStore._client().register_script(CLEAR_SCRIPT)(keys=[GuestCartStore._key(token)])
@@ -0,0 +1,473 @@
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Tuple
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework.exceptions import ValidationError
+
+from apps.books.infrastructure.models import Book
+from apps.books.interface.book_cards import get_book_cards
+from apps.cart.infrastructure.models import Cart, CartItem
+from apps.cart.infrastructure.summary_cache import invalidate_cart_summary
+from commons.services.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+CART_KEY = "cart:{}"
+DIRTY_KEY = "cart:dirty"
+FLUSH_SCHEDULED_KEY = "cart:flush-scheduled"
+
+# Поля хеша корзины: служебные + по пять на книгу (<prefix>:<book_id>).
+LOADED = "loaded"
+QUANTITY, PRICE, CREATED, UPDATED, ITEM_ID = "q", "p", "c", "u", "i"
+
+# Хеш загружается из БД, только если его ещё нет: параллельная мутация не перезаписывается.
+LOAD_SCRIPT = """
+if redis.call('HEXISTS', KEYS[1], 'loaded') == 1 then return 0 end
+redis.call('DEL', KEYS[1])
+redis.call('HSET', KEYS[1], unpack(ARGV, 2))
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return 1
+"""
+
+# Мутации: nil — хеша нет (вытеснен), корзину нужно загрузить из БД и повторить.
+# ARGV[1] — user_id (в множество «грязных» корзин), ARGV[2] — TTL, ARGV[3] — now (мс).
+ADD_SCRIPT = """
+if redis.call('HEXISTS', KEYS[1], 'loaded') == 0 then return nil end
+local book = ARGV[4]
+local current = tonumber(redis.call('HGET', KEYS[1], 'q:' .. book) or '0')
+local total = current + tonumber(ARGV[5])
+if total > tonumber(ARGV[6]) then return {0, current} end
+redis.call('HSET', KEYS[1], 'q:' .. book, total, 'p:' .. book, ARGV[7], 'u:' .. book, ARGV[3], 'updated', ARGV[3])
+redis.call('HSETNX', KEYS[1], 'c:' .. book, ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+redis.call('SADD', KEYS[2], ARGV[1])
+return {1, current}
+"""
+
+SET_SCRIPT = """
+if redis.call('HEXISTS', KEYS[1], 'loaded') == 0 then return nil end
+local book = ARGV[4]
+local current = tonumber(redis.call('HGET', KEYS[1], 'q:' .. book) or '0')
+redis.call('HSET', KEYS[1], 'q:' .. book, ARGV[5], 'p:' .. book, ARGV[6], 'u:' .. book, ARGV[3], 'updated', ARGV[3])
+redis.call('HSETNX', KEYS[1], 'c:' .. book, ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+redis.call('SADD', KEYS[2], ARGV[1])
+return current
+"""
+
+REMOVE_SCRIPT = """
+if redis.call('HEXISTS', KEYS[1], 'loaded') == 0 then return nil end
+local book = ARGV[4]
+local removed = redis.call('HDEL', KEYS[1], 'q:' .. book, 'p:' .. book, 'c:' .. book, 'u:' .. book, 'i:' .. book)
+if removed > 0 then
+    redis.call('HSET', KEYS[1], 'updated', ARGV[3])
+    redis.call('SADD', KEYS[2], ARGV[1])
+end
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return removed
+"""
+
+CLEAR_SCRIPT = """
+if redis.call('HEXISTS', KEYS[1], 'loaded') == 0 then return nil end
+local count = 0
+for _, field in ipairs(redis.call('HKEYS', KEYS[1])) do
+    local prefix = string.sub(field, 1, 2)
+    if prefix == 'q:' then count = count + 1 end
+    if prefix == 'q:' or prefix == 'p:' or prefix == 'c:' or prefix == 'u:' or prefix == 'i:' then
+        redis.call('HDEL', KEYS[1], field)
+    end
+end
+redis.call('HSET', KEYS[1], 'updated', ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+redis.call('SADD', KEYS[2], ARGV[1])
+return count
+"""
+
+# Пачка изменений (CartRepository.apply_batch): ARGV[4..] — по пять на строку
+# (book_id, op, quantity, in_stock, price). Строки применяются по порядку,
+# результат — по два числа на строку: статус (1 — применена, 0 — не хватает
+# остатка, -1 — книги нет в корзине) и количество до строки.
+BATCH_SCRIPT = """
+if redis.call('HEXISTS', KEYS[1], 'loaded') == 0 then return nil end
+local results = {}
+local changed = false
+for i = 4, #ARGV, 5 do
+    local book, op, quantity, stock = ARGV[i], ARGV[i + 1], tonumber(ARGV[i + 2]), tonumber(ARGV[i + 3])
+    local current = tonumber(redis.call('HGET', KEYS[1], 'q:' .. book) or '0')
+    local target = quantity
+    if op == 'add' then target = current + quantity end
+    if op == 'merge' then target = math.max(current, math.min(current + quantity, stock)) end
+    if op == 'remove' then target = 0 end
+
+    if op == 'remove' and current == 0 then
+        table.insert(results, -1)
+    elseif target > stock then
+        table.insert(results, 0)
+    elseif target == 0 then
+        redis.call('HDEL', KEYS[1], 'q:' .. book, 'p:' .. book, 'c:' .. book, 'u:' .. book, 'i:' .. book)
+        table.insert(results, 1)
+        changed = true
+    else
+        redis.call('HSET', KEYS[1], 'q:' .. book, target, 'p:' .. book, ARGV[i + 4], 'u:' .. book, ARGV[3])
+        redis.call('HSETNX', KEYS[1], 'c:' .. book, ARGV[3])
+        table.insert(results, 1)
+        changed = true
+    end
+    table.insert(results, current)
+end
+if changed then
+    redis.call('HSET', KEYS[1], 'updated', ARGV[3])
+    redis.call('SADD', KEYS[2], ARGV[1])
+end
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return results
+"""
+
+# id позиций, созданных при сбросе в БД, — только для книг, которые всё ещё в корзине.
+ITEM_IDS_SCRIPT = """
+for i = 1, #ARGV, 2 do
+    if redis.call('HEXISTS', KEYS[1], 'q:' .. ARGV[i]) == 1 then
+        redis.call('HSET', KEYS[1], 'i:' .. ARGV[i], ARGV[i + 1])
+    end
+end
+return 0
+"""
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def _to_ms(value: datetime) -> int:
+    return int(value.timestamp() * 1000)
+
+
+def _from_ms(value: bytes | int) -> datetime:
+    return datetime.fromtimestamp(int(value) / 1000, tz=timezone.utc)
+
+
+def refresh_prices(items: list[CartItem]) -> None:
+    """
+    Цены позиций не из БД — из карточек книг под текущей версией каталога.
+
+    Цена, сохранённая вместе с позицией, — снимок на момент добавления;
+    она остаётся, если карточки нет (книга скрыта).
+    """
+    cards = get_book_cards(item.book_id for item in items)
+    for item in items:
+        card = cards.get(item.book_id)
+        if card is not None:
+            item.book.price = card["price"]
+
+
+class HotCart:
+    """
+    Корзина из Redis (HotCartStore, GuestCartStore) — те же атрибуты,
+    что читает CartSerializer у модели Cart.
+
+    items — несохранённые CartItem с book=Book(id, price): цена и карточка книги —
+    из кеша book_cards, поэтому сериализация не ходит в БД.
+    """
+
+    def __init__(self, *, id: int, is_active: bool, created_at: datetime, updated_at: datetime, items: list[CartItem]):
+        self.id = id
+        self.is_active = is_active
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.items = items
+
+    @property
+    def total_items(self) -> int:
+        return sum(item.quantity for item in self.items)
+
+    @property
+    def total_price(self) -> int:
+        return sum(item.subtotal for item in self.items)
+
+
+class HotCartStore:
+    """
+    Корзина пользователя в хеше Redis — источник истины для чтения и изменений.
+
+    Зачем:
+    Бейдж и страница корзины запрашиваются на каждом экране; каждый такой запрос
+    шёл в Postgres несколькими запросами (корзина, позиции, книги, агрегат total_items).
+    Теперь чтение — один HGETALL. Изменения пишутся в хеш атомарно (Lua), пользователь
+    попадает в множество «грязных» корзин, а задача flush_hot_carts пачкой переносит
+    их в Cart/CartItem (write-behind) через CART_FLUSH_DELAY секунд.
+
+    Хеш живёт CART_STORE_TTL секунд с последнего обращения. Если он пропал
+    (вытеснение, перезапуск Redis) — корзина заново загружается из БД.
+    Несброшенные изменения в этом случае теряются (не дольше CART_FLUSH_DELAY).
+
+    Без Redis (кеш не django-redis) хранилище выключено и корзина работает через БД.
+    """
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return settings.CART_STORE_ENABLED and get_redis_client() is not None
+
+    @staticmethod
+    def _key(user_id: int) -> str:
+        return cache.make_key(CART_KEY.format(user_id))
+
+    # Чтение
+
+    @staticmethod
+    def get_cart(user: User) -> HotCart:
+        client = get_redis_client()
+        state = client.hgetall(HotCartStore._key(user.pk))
+        if LOADED.encode() not in state:
+            state = HotCartStore._load(client, user)
+        cart = HotCartStore._parse(state)
+        refresh_prices(cart.items)
+        return cart
+
+    @staticmethod
+    def _load(client, user: User) -> dict[bytes, bytes]:
+        cart, _ = Cart.objects.get_or_create(user=user)
+        items = CartItem.objects.filter(cart=cart).select_related("book").only(
+            "id", "book_id", "quantity", "created_at", "updated_at", "book__price"
+        )
+
+        state = {
+            LOADED: 1,
+            "id": cart.pk,
+            "active": int(cart.is_active),
+            "created": _to_ms(cart.created_at),
+            "updated": _to_ms(cart.updated_at),
+        }
+        for item in items:
+            state.update({
+                f"{QUANTITY}:{item.book_id}": item.quantity,
+                f"{PRICE}:{item.book_id}": item.book.price,
+                f"{CREATED}:{item.book_id}": _to_ms(item.created_at),
+                f"{UPDATED}:{item.book_id}": _to_ms(item.updated_at),
+                f"{ITEM_ID}:{item.book_id}": item.pk,
+            })
+
+        args = [settings.CART_STORE_TTL]
+        for field, value in state.items():
+            args.extend((field, value))
+        client.register_script(LOAD_SCRIPT)(keys=[HotCartStore._key(user.pk)], args=args)
+
+        return {field.encode(): str(value).encode() for field, value in state.items()}
+
+    @staticmethod
+    def _parse(state: dict[bytes, bytes]) -> HotCart:
+        values = {field.decode(): value for field, value in state.items()}
+        cart_id = int(values["id"])
+
+        items = []
+        for field, value in values.items():
+            if not field.startswith(f"{QUANTITY}:"):
+                continue
+            book_id = int(field[2:])
+            item_id = values.get(f"{ITEM_ID}:{book_id}")
+            item = CartItem(
+                id=int(item_id) if item_id else None,
+                cart_id=cart_id,
+                book_id=book_id,
+                quantity=int(value),
+                created_at=_from_ms(values[f"{CREATED}:{book_id}"]),
+                updated_at=_from_ms(values[f"{UPDATED}:{book_id}"]),
+            )
+            item.book = Book(id=book_id, price=int(values[f"{PRICE}:{book_id}"]))
+            items.append(item)
+
+        # Как ordering CartItem: новые сверху.
+        items.sort(key=lambda item: item.created_at, reverse=True)
+
+        return HotCart(
+            id=cart_id,
+            is_active=values["active"] == b"1",
+            created_at=_from_ms(values["created"]),
+            updated_at=_from_ms(values["updated"]),
+            items=items,
+        )
+
+    # Изменения
+
+    @staticmethod
+    def _mutate(user: User, script: str, *args):
+        """Выполняет мутацию; если хеша нет — загружает корзину из БД и повторяет один раз."""
+        client = get_redis_client()
+        keys = [HotCartStore._key(user.pk), cache.make_key(DIRTY_KEY)]
+        run = client.register_script(script)
+
+        for _ in range(2):
+            result = run(keys=keys, args=[user.pk, settings.CART_STORE_TTL, _now_ms(), *args])
+            if result is not None:
+                HotCartStore._schedule_flush(client)
+                return result
+            HotCartStore._load(client, user)
+
+        raise RuntimeError("Cart store is unavailable")
+
+    @staticmethod
+    def _schedule_flush(client) -> None:
+        # Одна отложенная задача на окно CART_FLUSH_DELAY — изменения всех пользователей за окно уходят пачкой.
+        if client.set(cache.make_key(FLUSH_SCHEDULED_KEY), 1, nx=True, ex=settings.CART_FLUSH_DELAY):
+            transaction.on_commit(HotCartStore._enqueue_flush)
+
+    @staticmethod
+    def _enqueue_flush() -> None:
+        from apps.cart.infrastructure.tasks import flush_hot_carts
+
+        try:
+            flush_hot_carts.apply_async(countdown=settings.CART_FLUSH_DELAY)
+        except Exception:
+            # Изменения уже в Redis; их заберёт периодический flush_hot_carts (beat).
+            logger.warning("Failed to enqueue cart flush", exc_info=True)
+
+    @staticmethod
+    def _item(user: User, book: Book) -> CartItem:
+        cart = HotCartStore.get_cart(user)
+        return next(item for item in cart.items if item.book_id == book.pk)
+
+    @staticmethod
+    def add_item(user: User, book: Book, quantity: int = 1) -> Tuple[CartItem, bool]:
+        added, current = HotCartStore._mutate(
+            user, ADD_SCRIPT, book.pk, quantity, book.in_stock, book.price
+        )
+
+        if not added:
+            if current:
+                raise ValidationError(
+                    f"Cannot add {quantity} more copies. "
+                    f"In stock: {book.in_stock}, already in cart: {current}."
+                )
+            raise ValidationError(
+                f"Only {book.in_stock} copies available."
+            )
+
+        return HotCartStore._item(user, book), current == 0
+
+    @staticmethod
+    def set_quantity(user: User, book: Book, quantity: int) -> CartItem:
+        HotCartStore._mutate(user, SET_SCRIPT, book.pk, quantity, book.price)
+        return HotCartStore._item(user, book)
+
+    @staticmethod
+    def get_quantity(user: User, book_id: int) -> int:
+        cart = HotCartStore.get_cart(user)
+        return next((item.quantity for item in cart.items if item.book_id == book_id), 0)
+
+    @staticmethod
+    def remove_item(user: User, book_id: int) -> bool:
+        return HotCartStore._mutate(user, REMOVE_SCRIPT, book_id) > 0
+
+    @staticmethod
+    def clear(user: User) -> int:
+        return HotCartStore._mutate(user, CLEAR_SCRIPT)
+
+    @staticmethod
+    def apply_batch(user: User, lines: list[tuple[int, str, int, Book | None]]) -> list[tuple[int, int]]:
+        """
+        Применяет строки (book_id, op, quantity, book) одним скриптом — атомарно
+        и с проверкой остатка по количеству в хеше. Возвращает (статус, количество до строки).
+        """
+        args = []
+        for book_id, op, quantity, book in lines:
+            args.extend((book_id, op, quantity, book.in_stock if book else 0, book.price if book else 0))
+
+        result = HotCartStore._mutate(user, BATCH_SCRIPT, *args)
+        return list(zip(result[::2], result[1::2]))
+
+    @staticmethod
+    def invalidate(user_id: int) -> None:
+        """Сбрасывает хеш: следующее чтение загрузит корзину из БД (после изменений в обход хранилища)."""
+        invalidate_cart_summary(user_id)
+        client = get_redis_client()
+        if client is not None:
+            client.delete(HotCartStore._key(user_id))
+
+    # Сброс в БД (write-behind)
+
+    @staticmethod
+    def flush(user_id: int) -> None:
+        """
+        Приводит Cart/CartItem пользователя к состоянию хеша.
+
+        Меняются только отличающиеся строки: новые и изменённые позиции — один
+        bulk_create с update_conflicts, удалённые — один DELETE.
+        """
+        client = get_redis_client()
+        key = HotCartStore._key(user_id)
+        state = client.hgetall(key)
+        if LOADED.encode() not in state:
+            return
+
+        cart = HotCartStore._parse(state)
+        items = {item.book_id: item for item in cart.items}
+
+        with transaction.atomic():
+            existing_books = set(Book.objects.filter(id__in=items).values_list("id", flat=True))
+            stored = {
+                item.book_id: item
+                for item in CartItem.objects.filter(cart_id=cart.id).only("id", "book_id", "quantity")
+            }
+
+            CartItem.objects.filter(cart_id=cart.id).exclude(book_id__in=existing_books).delete()
+            # Активность корзины видна в БД — по ней compact_idle_carts ищет брошенные.
+            Cart.objects.filter(pk=cart.id).update(updated_at=cart.updated_at)
+
+            changed = [
+                CartItem(cart_id=cart.id, book_id=book_id, quantity=item.quantity)
+                for book_id, item in items.items()
+                if book_id in existing_books
+                and (book_id not in stored or stored[book_id].quantity != item.quantity)
+            ]
+            if changed:
+                CartItem.objects.bulk_create(
+                    changed,
+                    update_conflicts=True,
+                    unique_fields=["cart", "book"],
+                    update_fields=["quantity", "updated_at"],
+                )
+
+        # id новых позиций — в хеш, чтобы ответы отдавали их так же, как из БД.
+        item_ids = {book_id: item.pk for book_id, item in stored.items()}
+        item_ids.update({item.book_id: item.pk for item in changed if item.pk})
+        args = []
+        for book_id, item in items.items():
+            if item.pk is None and book_id in existing_books and item_ids.get(book_id):
+                args.extend((book_id, item_ids[book_id]))
+        if args:
+            client.register_script(ITEM_IDS_SCRIPT)(keys=[key], args=args)
+
+    @staticmethod
+    def cached_user_ids(user_ids: list[int]) -> set[int]:
+        """Пользователи, чья корзина сейчас в Redis (её читали или меняли в пределах CART_STORE_TTL)."""
+        if not user_ids or not HotCartStore.is_enabled():
+            return set()
+
+        pipe = get_redis_client().pipeline(transaction=False)
+        for user_id in user_ids:
+            pipe.exists(HotCartStore._key(user_id))
+        return {user_id for user_id, exists in zip(user_ids, pipe.execute()) if exists}
+
+    @staticmethod
+    def flush_dirty(limit: int) -> int:
+        """Сбрасывает в БД до limit «грязных» корзин; упавшие возвращаются в очередь."""
+        client = get_redis_client()
+        dirty_key = cache.make_key(DIRTY_KEY)
+        user_ids = client.spop(dirty_key, limit) or []
+
+        flushed = 0
+        for user_id in user_ids:
+            try:
+                HotCartStore.flush(int(user_id))
+                flushed += 1
+            except Exception:
+                logger.exception("Failed to flush cart of user %s", user_id)
+                client.sadd(dirty_key, user_id)
+
+        return flushed
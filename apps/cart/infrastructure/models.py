@@ -19,6 +19,10 @@ class Cart(AbstractDateTimeModel):
     class Meta:
         verbose_name = _("Cart")
         verbose_name_plural = _("Carts")
+        indexes = [
+            # Keyset-обход простаивающих корзин (compact_idle_carts).
+            models.Index(fields=["updated_at", "id"]),
+        ]
 
     def __str__(self):
         return f"Cart of {self.user.nickname}"
@@ -29,6 +33,10 @@ class Cart(AbstractDateTimeModel):
             total=Sum('quantity')
         )['total'] or 0
 
+    @property
+    def total_price(self) -> int:
+        return sum(item.subtotal for item in self.items.all())
+
 
 class CartItem(AbstractDateTimeModel):
     cart = models.ForeignKey(
@@ -62,3 +70,34 @@ class CartItem(AbstractDateTimeModel):
     @property
     def subtotal(self) -> float:
         return self.book.price * self.quantity
+
+
+class AbandonedCart(AbstractDateTimeModel):
+    """
+    Снимок брошенной корзины, позиции которой удалила compact_idle_carts.
+
+    Зачем:
+    CartItem простаивающих корзин копились навсегда. Состав корзины остаётся
+    здесь одной строкой (для напоминаний и аналитики), а cart_item — маленькой.
+    """
+
+    user = models.ForeignKey(
+        to=settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="abandoned_carts",
+    )
+    # [{"book_id": 1, "quantity": 2, "price": 500}, ...] — цены на момент архивации.
+    items = models.JSONField(default=list)
+    total_items = models.PositiveIntegerField(default=0)
+    total_price = models.PositiveIntegerField(default=0)
+    last_activity_at = models.DateTimeField(
+        help_text=_("Last change of the cart before it was archived")
+    )
+
+    class Meta:
+        verbose_name = _("Abandoned Cart")
+        verbose_name_plural = _("Abandoned Carts")
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"Abandoned cart of {self.user_id} ({self.total_items})"
@@ -5,7 +5,10 @@ from django.db import transaction
 from rest_framework.exceptions import ValidationError
 
 from apps.books.infrastructure.models import Book
+from apps.cart.infrastructure.guest_cart import GuestCartStore
+from apps.cart.infrastructure.hot_cart import HotCartStore
 from apps.cart.infrastructure.models import CartItem
+from apps.cart.infrastructure.summary_cache import invalidate_cart_summary
 from apps.cart.infrastructure.selectors import (
     get_or_create_cart,
     get_cart_item,
@@ -13,8 +16,50 @@ from apps.cart.infrastructure.selectors import (
 
 User = get_user_model()
 
+# Операции строки пакетного изменения корзины (apply_batch).
+OP_ADD, OP_SET, OP_REMOVE = "add", "set", "remove"
+BATCH_OPS = (OP_ADD, OP_SET, OP_REMOVE)
+# Только для merge_guest_cart: как add, но количество урезается до остатка.
+OP_MERGE = "merge"
+
+# Статусы строки — те же числа возвращает BATCH_SCRIPT в HotCartStore.
+BATCH_APPLIED, BATCH_OUT_OF_STOCK, BATCH_NOT_IN_CART = 1, 0, -1
+
+
+def _plan_batch_line(op: str, quantity: int, current: int, in_stock: int) -> Tuple[int, int]:
+    if op == OP_REMOVE:
+        return (BATCH_APPLIED, 0) if current else (BATCH_NOT_IN_CART, current)
+
+    if op == OP_MERGE:
+        target = max(current, min(current + quantity, in_stock))
+    elif op == OP_ADD:
+        target = current + quantity
+    else:
+        target = quantity
+    if target > in_stock:
+        return BATCH_OUT_OF_STOCK, current
+    return BATCH_APPLIED, target
+
+
+def _batch_line_error(line: dict, book: Optional[Book], status: int, current: int) -> str:
+    if status == BATCH_NOT_IN_CART:
+        return "Item not found in cart"
+    if line['op'] == OP_ADD and current:
+        return (
+            f"Cannot add {line['quantity']} more copies. "
+            f"In stock: {book.in_stock}, already in cart: {current}."
+        )
+    return f"Only {book.in_stock} copies available."
+
 
 class CartRepository:
+    """
+    Изменения корзины.
+
+    При включённом HotCartStore корзина меняется в Redis (и позже сбрасывается в БД
+    задачей flush_hot_carts); из БД читается только книга — остаток и цена.
+    Каждое изменение сбрасывает кешированную сводку корзины (get_cart_summary).
+    """
 
     @staticmethod
     @transaction.atomic
@@ -22,6 +67,12 @@ class CartRepository:
         if quantity < 1:
             raise ValidationError("Quantity must be at least 1")
 
+        invalidate_cart_summary(user.pk)
+
+        if HotCartStore.is_enabled():
+            book = Book.objects.only("id", "price", "in_stock").get(id=book_id, is_active=True)
+            return HotCartStore.add_item(user, book, quantity)
+
         book = Book.objects.select_for_update().get(id=book_id, is_active=True)
 
         cart = get_or_create_cart(user)
@@ -59,6 +110,21 @@ class CartRepository:
 
         book_name = book.safe_translation_getter('name', any_language=True)
 
+        invalidate_cart_summary(user.pk)
+
+        if HotCartStore.is_enabled():
+            if quantity > book.in_stock:
+                current = HotCartStore.get_quantity(user, book_id)
+                if current:
+                    raise ValidationError(
+                        f"Cannot add {quantity} more copies of '{book_name}'. "
+                        f"In stock: {book.in_stock}, already in cart: {current}."
+                    )
+                raise ValidationError(
+                    f"Only {book.in_stock} copies of '{book_name}' available."
+                )
+            return HotCartStore.set_quantity(user, book, quantity)
+
         cart = get_or_create_cart(user)
         existing_item = get_cart_item(user, book_id)
 
@@ -86,6 +152,11 @@ class CartRepository:
     @staticmethod
     @transaction.atomic
     def remove_item(user: User, book_id: int) -> bool:
+        invalidate_cart_summary(user.pk)
+
+        if HotCartStore.is_enabled():
+            return HotCartStore.remove_item(user, book_id)
+
         cart_item = get_cart_item(user, book_id)
 
         if cart_item:
@@ -96,9 +167,184 @@ class CartRepository:
     @staticmethod
     @transaction.atomic
     def clear_cart(user: User) -> int:
+        invalidate_cart_summary(user.pk)
+
+        if HotCartStore.is_enabled():
+            return HotCartStore.clear(user)
+
         from apps.cart.infrastructure.models import Cart
         cart = Cart.objects.filter(user=user, is_active=True).first()
         if not cart:
             return 0
         deleted_count, _ = cart.items.all().delete()
         return deleted_count
+
+    @staticmethod
+    @transaction.atomic
+    def apply_batch(user: User, lines: list[dict]) -> list[dict]:
+        """
+        Применяет пачку изменений корзины {book_id, quantity, op}; возвращает ошибки строк.
+
+        Зачем:
+        «Повторить заказ» и «восстановить корзину» вызывали /cart/add/ на каждую книгу,
+        и каждый вызов заново валидировал и блокировал книгу. Здесь книги читаются
+        (и блокируются) одним запросом, позиции — одним, изменения пишутся одним
+        upsert и одним DELETE (с HotCartStore — одним Lua-скриптом).
+
+        Строки применяются по порядку; строка с ошибкой пропускается, остальные применяются.
+        """
+        invalidate_cart_summary(user.pk)
+        hot = HotCartStore.is_enabled()
+
+        books = Book.objects.filter(
+            id__in={line['book_id'] for line in lines},
+            is_active=True
+        ).only('id', 'price', 'in_stock', 'is_adult')
+        if not hot:
+            books = books.select_for_update()
+        books = {book.pk: book for book in books}
+
+        user_age = getattr(user, 'age', 0)
+        errors, valid = [], []
+        for index, line in enumerate(lines):
+            book = books.get(line['book_id'])
+            # Убрать из корзины можно и скрытую книгу.
+            if line['op'] != OP_REMOVE:
+                if book is None:
+                    errors.append({'index': index, 'book_id': line['book_id'], 'error': "Book not found or inactive"})
+                    continue
+                if book.is_adult and user_age < 18:
+                    errors.append({'index': index, 'book_id': line['book_id'], 'error': "You must be 18+ to add this book"})
+                    continue
+            valid.append((index, line, book))
+
+        if not valid:
+            return errors
+
+        if hot:
+            results = HotCartStore.apply_batch(
+                user, [(line['book_id'], line['op'], line['quantity'], book) for _, line, book in valid]
+            )
+        else:
+            results = CartRepository._apply_batch_to_db(user, valid)
+
+        for (index, line, book), (status, current) in zip(valid, results):
+            if status != BATCH_APPLIED:
+                errors.append({
+                    'index': index,
+                    'book_id': line['book_id'],
+                    'error': _batch_line_error(line, book, status, current)
+                })
+
+        errors.sort(key=lambda error: error['index'])
+        return errors
+
+    @staticmethod
+    @transaction.atomic
+    def merge_guest_cart(user: User, token: str) -> int:
+        """
+        Сливает гостевую корзину в корзину пользователя при входе; возвращает число перенесённых книг.
+
+        Зачем:
+        Раньше фронтенд после входа повторял теневую корзину запросом на каждую книгу.
+        Слияние — одна пачка apply_batch: количество — сумма гостевого и уже лежащего
+        в корзине, урезанная до остатка; скрытые книги и 18+ для несовершеннолетних
+        пропускаются. Гостевая корзина удаляется после коммита.
+        """
+        quantities = GuestCartStore.get_quantities(token)
+        if not quantities:
+            return 0
+
+        errors = CartRepository.apply_batch(user, [
+            {'book_id': book_id, 'quantity': quantity, 'op': OP_MERGE}
+            for book_id, quantity in quantities.items()
+        ])
+        transaction.on_commit(lambda: GuestCartStore.clear(token))
+        return len(quantities) - len(errors)
+
+    @staticmethod
+    def _apply_batch_to_db(user: User, valid: list) -> list[Tuple[int, int]]:
+        cart = get_or_create_cart(user)
+        stored = dict(CartItem.objects.filter(cart=cart).values_list('book_id', 'quantity'))
+        quantities = dict(stored)
+
+        results = []
+        for _, line, book in valid:
+            current = quantities.get(line['book_id'], 0)
+            status, target = _plan_batch_line(
+                line['op'], line['quantity'], current, book.in_stock if book else 0
+            )
+            if status == BATCH_APPLIED:
+                quantities[line['book_id']] = target
+            results.append((status, current))
+
+        changed = [
+            CartItem(cart=cart, book_id=book_id, quantity=quantity)
+            for book_id, quantity in quantities.items()
+            if quantity and quantity != stored.get(book_id)
+        ]
+        if changed:
+            CartItem.objects.bulk_create(
+                changed,
+                update_conflicts=True,
+                unique_fields=['cart', 'book'],
+                update_fields=['quantity', 'updated_at'],
+            )
+
+        removed = [book_id for book_id in stored if not quantities.get(book_id)]
+        if removed:
+            CartItem.objects.filter(cart=cart, book_id__in=removed).delete()
+
+        return results
+
+
+class GuestCartRepository:
+    """
+    Изменения гостевой корзины (GuestCartStore) по токену из cookie —
+    те же проверки и сообщения, что у CartRepository.
+    """
+
+    @staticmethod
+    def add_item(token: str, book_id: int, quantity: int = 1) -> Tuple[CartItem, bool]:
+        if quantity < 1:
+            raise ValidationError("Quantity must be at least 1")
+
+        book = Book.objects.only("id", "price", "in_stock").get(id=book_id, is_active=True)
+
+        # Проверка остатка и прибавление — одним скриптом, параллельные add не теряются.
+        added, current = GuestCartStore.add_item(token, book, quantity)
+        if not added:
+            raise ValidationError(
+                _batch_line_error({'op': OP_ADD, 'quantity': quantity}, book, BATCH_OUT_OF_STOCK, current)
+            )
+
+        return GuestCartStore.get_item(token, book_id), current == 0
+
+    @staticmethod
+    def update_quantity(token: str, book_id: int, quantity: int) -> Optional[CartItem]:
+        if quantity < 1:
+            raise ValidationError("Quantity must be at least 1")
+
+        book = Book.objects.get(id=book_id, is_active=True)
+
+        if quantity > book.in_stock:
+            book_name = book.safe_translation_getter('name', any_language=True)
+            current = GuestCartStore.get_quantities(token).get(book_id, 0)
+            if current:
+                raise ValidationError(
+                    f"Cannot add {quantity} more copies of '{book_name}'. "
+                    f"In stock: {book.in_stock}, already in cart: {current}."
+                )
+            raise ValidationError(
+                f"Only {book.in_stock} copies of '{book_name}' available."
+            )
+
+        return GuestCartStore.set_quantity(token, book, quantity)
+
+    @staticmethod
+    def remove_item(token: str, book_id: int) -> bool:
+        return GuestCartStore.remove_item(token, book_id)
+
+    @staticmethod
+    def clear_cart(token: str) -> int:
+        return GuestCartStore.clear(token)
@@ -1,10 +1,15 @@
 from typing import Optional
 
-from django.db import models
-from django.db.models import QuerySet, Sum, Prefetch
+from django.db.models import Count, F, QuerySet, Sum, Prefetch
 from django.contrib.auth import get_user_model
 
+from apps.cart.infrastructure.guest_cart import GuestCartStore
+from apps.cart.infrastructure.hot_cart import HotCart, HotCartStore
 from apps.cart.infrastructure.models import Cart, CartItem
+from apps.cart.infrastructure.summary_cache import (
+    get_cached_cart_summary,
+    set_cached_cart_summary,
+)
 
 User = get_user_model()
 
@@ -19,12 +24,9 @@ def get_cart_with_items(user: User) -> Optional[Cart]:
         return Cart.objects.prefetch_related(
             Prefetch(
                 'items',
+                # Книга — только ради цены; карточки книг берутся из кеша (book_cards).
                 queryset=CartItem.objects.select_related(
                     'book'
-                ).prefetch_related(
-                    'book__translations',
-                    'book__category',
-                    'book__author'
                 ).order_by('-created_at')
             )
         ).filter(is_active=True, user=user).first()
@@ -32,6 +34,39 @@ def get_cart_with_items(user: User) -> Optional[Cart]:
         return None
 
 
+def get_cart_for_checkout(user: User) -> Optional[Cart]:
+    """
+    Корзина из БД для оформления заказа.
+
+    Зачем:
+    Заказ строится по Cart/CartItem с блокировкой книг, а HotCartStore сбрасывает
+    изменения в БД отложенно — поэтому сначала синхронно сбрасываем корзину пользователя.
+    """
+    if HotCartStore.is_enabled():
+        HotCartStore.flush(user.pk)
+    return get_cart_with_items(user)
+
+
+def get_current_cart(user: User) -> Optional[Cart | HotCart]:
+    """
+    Активная корзина для чтения: из HotCartStore (Redis), если он включён, иначе из БД.
+
+    Оба варианта читаются CartSerializer одинаково.
+    """
+    if HotCartStore.is_enabled():
+        cart = HotCartStore.get_cart(user)
+        return cart if cart.is_active else None
+    return get_cart_with_items(user)
+
+
+def get_guest_cart(token: Optional[str]) -> Optional[HotCart]:
+    """Гостевая корзина по токену из cookie; нет токена или корзина пуста — None."""
+    if not token:
+        return None
+    cart = GuestCartStore.get_cart(token)
+    return cart if cart.items else None
+
+
 def get_cart_items(user: User) -> QuerySet[CartItem]:
     cart = get_or_create_cart(user)
 
@@ -39,10 +74,6 @@ def get_cart_items(user: User) -> QuerySet[CartItem]:
         cart=cart
     ).select_related(
         'book'
-    ).prefetch_related(
-        'book__translations',
-        'book__category__translations',
-        'book__author'
     ).order_by('-created_at')
 
 
@@ -74,15 +105,56 @@ def get_cart_item(user: User, book_id: int) -> Optional[CartItem]:
 
 
 def get_cart_summary(user: User) -> dict:
-    cart = get_or_create_cart(user)
+    """
+    Сводка корзины для бейджа: количество экземпляров, книг и сумма.
 
-    summary = cart.items.aggregate(
+    Зачем:
+    Эндпоинт опрашивается на каждой странице. Сводка кешируется на пользователя
+    и сбрасывается каждым изменением корзины (CartRepository), поэтому
+    обычно это один GET из кеша. Промах считается одним SQL-запросом
+    (или из HotCartStore, если он включён).
+    """
+    summary = get_cached_cart_summary(user.pk)
+    if summary is not None:
+        return summary
+
+    if HotCartStore.is_enabled():
+        cart = HotCartStore.get_cart(user)
+        items = cart.items if cart.is_active else []
+        summary = {
+            'total_items': sum(item.quantity for item in items),
+            'unique_books': len(items),
+            'total_price': sum(item.subtotal for item in items)
+        }
+    else:
+        summary = _aggregate_cart_summary(user)
+
+    set_cached_cart_summary(user.pk, summary)
+    return summary
+
+
+def _aggregate_cart_summary(user: User) -> dict:
+    totals = CartItem.objects.filter(
+        cart__user=user,
+        cart__is_active=True
+    ).aggregate(
         total_items=Sum('quantity'),
-        unique_books=models.Count('id')
+        unique_books=Count('book_id', distinct=True),
+        total_price=Sum(F('quantity') * F('book__price'))
     )
 
     return {
-        'total_items': summary['total_items'] or 0,
-        'unique_books': summary['unique_books'] or 0,
-        'total_price': summary['total_price'] or 0
+        'total_items': totals['total_items'] or 0,
+        'unique_books': totals['unique_books'] or 0,
+        'total_price': totals['total_price'] or 0
+    }
+
+
+def get_guest_cart_summary(token: Optional[str]) -> dict:
+    cart = get_guest_cart(token)
+    items = cart.items if cart else []
+    return {
+        'total_items': sum(item.quantity for item in items),
+        'unique_books': len(items),
+        'total_price': sum(item.subtotal for item in items)
     }
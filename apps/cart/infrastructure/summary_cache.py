@@ -0,0 +1,34 @@
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from commons.services.cache_versions import CATALOG, get_cache_versions
+
+KEY_TEMPLATE = "cart-summary:{}:{}"
+
+
+def _key(user_id: int) -> str:
+    # Сумма зависит от цен книг: новая версия каталога — новый ключ.
+    (version,) = get_cache_versions(CATALOG)
+    return KEY_TEMPLATE.format(user_id, version)
+
+
+def get_cached_cart_summary(user_id: int) -> Optional[dict]:
+    return cache.get(_key(user_id))
+
+
+def set_cached_cart_summary(user_id: int, summary: dict) -> None:
+    cache.set(_key(user_id), summary, settings.CART_SUMMARY_TIMEOUT)
+
+
+def invalidate_cart_summary(user_id: int) -> None:
+    """
+    Сбрасывает сводку корзины после коммита транзакции.
+
+    Зачем:
+    Если удалить раньше, параллельный запрос сводки успеет положить в кеш
+    ещё не изменённую корзину.
+    """
+    transaction.on_commit(lambda: cache.delete(_key(user_id)))
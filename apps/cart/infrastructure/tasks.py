@@ -0,0 +1,53 @@
+import logging
+
+from datetime import timedelta
+
+from celery import shared_task
+from django.conf import settings
+from django.utils import timezone
+
+from apps.cart.infrastructure.compaction import compact_idle_carts
+from apps.cart.infrastructure.hot_cart import HotCartStore
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def flush_hot_carts() -> int:
+    """
+    Write-behind: переносит изменённые корзины из Redis в Cart/CartItem.
+
+    Запускается отложенно после изменения корзины (одна задача на окно CART_FLUSH_DELAY)
+    и периодически (Celery beat) — на случай, если отложенная задача не была поставлена.
+    """
+    if not HotCartStore.is_enabled():
+        return 0
+
+    flushed = 0
+    while True:
+        count = HotCartStore.flush_dirty(limit=settings.CART_FLUSH_BATCH)
+        flushed += count
+        if count < settings.CART_FLUSH_BATCH:
+            break
+
+    if flushed:
+        logger.info("Flushed %s carts to the database", flushed)
+    return flushed
+
+
+@shared_task
+def compact_carts() -> dict[str, float]:
+    """
+    Periodic (Celery beat): корзины без изменений CART_IDLE_DAYS дней
+    архивируются в AbandonedCart, их позиции удаляются.
+    """
+    stats = compact_idle_carts(
+        cutoff=timezone.now() - timedelta(days=settings.CART_IDLE_DAYS),
+        batch_size=settings.CART_COMPACT_BATCH,
+        max_batches=settings.CART_COMPACT_MAX_BATCHES,
+    )
+    logger.info(
+        "Compacted %s carts (%s items) in %s batches, %.1fs, %.1f carts/s",
+        stats["carts"], stats["items"], stats["batches"], stats["seconds"], stats["carts_per_second"],
+    )
+    return stats
@@ -5,7 +5,9 @@ from apps.cart.api.serializers import (
     CartSerializer,
     AddToCartSerializer,
     CartItemSerializer,
-    UpdateCartItemSerializer
+    UpdateCartItemSerializer,
+    CartBatchSerializer,
+    CartBatchResultSerializer,
 )
 
 
@@ -291,3 +293,52 @@ cart_summary_schema = {
         401: response_401,
     },
 }
+
+cart_batch_schema = {
+    "tags": ["Cart"],
+    "summary": "Пакетное изменение корзины",
+    "description": (
+        "Применяет список изменений {book_id, quantity, op} по порядку в одной транзакции: "
+        "add — добавить к текущему количеству, set — установить (0 удаляет), remove — удалить позицию. "
+        "Книги, остаток и ограничение 18+ проверяются одним запросом. "
+        "Строка с ошибкой пропускается, остальные применяются; "
+        "ответ — итоговая корзина и ошибки по строкам."
+    ),
+    "request": CartBatchSerializer,
+    "responses": {
+        200: OpenApiResponse(
+            response=CartBatchResultSerializer,
+            description="Изменения применены (кроме строк из errors).",
+            examples=[
+                OpenApiExample(
+                    name="Повтор заказа с ошибкой в одной строке",
+                    value={
+                        "cart": {
+                            "id": 1,
+                            "items": [
+                                {
+                                    "id": 3,
+                                    "book": {"id": 5, "name": "Clean Code", "price": 500},
+                                    "quantity": 2,
+                                    "subtotal": 1000,
+                                    "created_at": "2026-01-01T10:00:00Z",
+                                    "updated_at": "2026-01-01T11:00:00Z",
+                                },
+                            ],
+                            "total_items": 2,
+                            "total_price": 1000,
+                            "is_active": True,
+                            "created_at": "2026-01-01T10:00:00Z",
+                            "updated_at": "2026-01-01T11:00:00Z",
+                        },
+                        "errors": [
+                            {"index": 1, "book_id": 7, "error": "Only 1 copies available."},
+                        ],
+                    },
+                ),
+            ],
+        ),
+        400: OpenApiResponse(description="Невалидный список изменений."),
+        401: response_401,
+    },
+}
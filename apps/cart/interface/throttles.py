@@ -0,0 +1,7 @@
+from rest_framework.throttling import AnonRateThrottle
+
+
+class GuestCartThrottle(AnonRateThrottle):
+    # Каждое изменение гостевой корзины без cookie создаёт новый ключ в Redis:
+    # отдельный лимит на IP для анонимных изменений (GUEST_CART_RATE).
+    scope = "guest_cart"
@@ -1,5 +1,7 @@
+from django.utils.translation import get_language
 from rest_framework.exceptions import NotFound
 from rest_framework.generics import RetrieveAPIView
+from rest_framework.response import Response
 
 from apps.company.api.serializers import (AboutCompanySerializer,
                                           CompanySerializer,
@@ -9,9 +11,31 @@ from apps.company.infrastructure.selectors import (
     get_about_company_object,
     get_contact_object
 )
+from commons.interfaces.conditional import ConditionalGetMixin
+from commons.services.cache_versions import COMPANY
+from commons.services.local_cache import TwoTierCache
 
+company_cache = TwoTierCache((COMPANY,))
 
-class CompanyAPIView(RetrieveAPIView):
+
+# Данные компании меняются раз в месяцы, а читаются на каждой странице.
+# Сериализованный ответ лежит в LRU процесса перед Redis (TwoTierCache):
+# в устойчивом состоянии ни БД, ни Redis не трогаются — ни для ETag, ни для тела.
+# Инвалидация — версией COMPANY из apps.company.infrastructure.signals.
+class CompanyContentMixin(ConditionalGetMixin):
+    cache_version_groups = (COMPANY,)
+    conditional_timestamp_field = None
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(self._retrieve_cached, request, *args, **kwargs)
+
+    def _retrieve_cached(self, request, *args, **kwargs):
+        key = f"company:{type(self).__name__}:{get_language()}"
+        data = company_cache.get_or_set(key, lambda: self.get_serializer(self.get_object()).data)
+        return Response(data)
+
+
+class CompanyAPIView(CompanyContentMixin, RetrieveAPIView):
     serializer_class = CompanySerializer
 
     def get_object(self):
@@ -21,7 +45,7 @@ class CompanyAPIView(RetrieveAPIView):
         return obj
 
 
-class AboutCompanyAPIView(RetrieveAPIView):
+class AboutCompanyAPIView(CompanyContentMixin, RetrieveAPIView):
     serializer_class = AboutCompanySerializer
 
     def get_object(self):
@@ -31,7 +55,7 @@ class AboutCompanyAPIView(RetrieveAPIView):
         return obj
 
 
-class ContactDetailAPIView(RetrieveAPIView):
+class ContactDetailAPIView(CompanyContentMixin, RetrieveAPIView):
     serializer_class = ContactDetailSerializer
 
     def get_object(self):
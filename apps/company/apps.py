@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CompanyConfig(AppConfig):
     name = "apps.company"
     label = "company"
+
+    def ready(self):
+        import apps.company.infrastructure.signals
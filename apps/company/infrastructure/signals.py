@@ -0,0 +1,30 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from apps.company.infrastructure.models import (AboutCompany, Company,
+                                                ContactDetail, SocialMedia)
+from commons.services.cache_versions import COMPANY, bump_cache_version_on_commit
+
+
+def company_cache_version_signal(sender, **kwargs):
+    """Любое изменение данных компании — новая версия (ETag и кеш ответов)."""
+    bump_cache_version_on_commit(COMPANY)
+
+
+for model in (Company, AboutCompany):
+    for signal in (post_save, post_delete):
+        signal.connect(company_cache_version_signal, sender=model, dispatch_uid=f"company_version_{model.__name__}")
+        signal.connect(
+            company_cache_version_signal,
+            sender=model._parler_meta.root.model,
+            dispatch_uid=f"company_version_{model.__name__}_translation",
+        )
+
+for model in (ContactDetail, SocialMedia):
+    for signal in (post_save, post_delete):
+        signal.connect(company_cache_version_signal, sender=model, dispatch_uid=f"company_version_{model.__name__}")
+
+m2m_changed.connect(
+    company_cache_version_signal,
+    sender=ContactDetail.social_media.through,
+    dispatch_uid="company_version_contact_social_media",
+)
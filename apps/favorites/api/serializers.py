@@ -1,12 +1,14 @@
 from rest_framework import serializers
 
 from apps.books.infrastructure.models import Book
+from apps.books.interface.book_cards import (BookCardField,
+                                            BookCardListSerializer,
+                                            BookCardsMixin)
 from apps.favorites.infrastructure.models import Favorite
-from apps.books.api.serializers import BookListSerializer
 
 
-class FavoriteSerializer(serializers.ModelSerializer):
-    book = BookListSerializer(read_only=True)
+class FavoriteSerializer(BookCardsMixin, serializers.ModelSerializer):
+    book = BookCardField()
 
     class Meta:
         model = Favorite
@@ -16,6 +18,7 @@ class FavoriteSerializer(serializers.ModelSerializer):
             'created_at'
         ]
         read_only_fields = ['id', 'created_at']
+        list_serializer_class = BookCardListSerializer
 
 
 class AddToFavoritesSerializer(serializers.Serializer):
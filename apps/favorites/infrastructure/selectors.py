@@ -1,26 +1,21 @@
 from django.db.models import QuerySet
 from django.contrib.auth import get_user_model
 
+from apps.books.infrastructure.models import Book, BookCategory
 from apps.favorites.infrastructure.models import Favorite
+from commons.models.translations import translations_prefetch
 
 User = get_user_model()
 
 
 def get_user_favorites(user: User) -> QuerySet[Favorite]:
+    # Книги не загружаются: карточки берутся из кеша по book_id (book_cards).
     return Favorite.objects.filter(
         user=user
-    ).select_related(
-        'book'
-    ).prefetch_related(
-        'book__translations',
-        'book__category__translations',
-        'book__author'
     ).order_by('-created_at')
 
 
 def get_favorite_books(user: User) -> QuerySet:
-    from apps.books.infrastructure.models import Book
-
     favorite_book_ids = Favorite.objects.filter(
         user=user
     ).values_list('book_id', flat=True)
@@ -29,8 +24,8 @@ def get_favorite_books(user: User) -> QuerySet:
         id__in=favorite_book_ids,
         is_active=True
     ).prefetch_related(
-        'translations',
-        'category__translations',
+        translations_prefetch(Book),
+        translations_prefetch(BookCategory, 'category__translations'),
         'author'
     )
 
@@ -2,6 +2,8 @@ from django.conf import settings
 from rest_framework import serializers
 
 from apps.gallery.infrastructure.models import Gallery, GalleryItem
+from commons.interfaces.projections import ListProjection, model_file_url
+from commons.interfaces.translated_fields import TranslatedCharField
 from commons.interfaces.urlfile_path import FileResponseField
 
 
@@ -78,7 +80,7 @@ class GalleryItemSerializer(serializers.ModelSerializer):
 
 
 class GalleryListSerializer(serializers.ModelSerializer):
-    name = serializers.CharField()
+    name = TranslatedCharField()
     cover = FileResponseField()
 
     class Meta:
@@ -95,3 +97,16 @@ class GalleryDetailSerializer(serializers.ModelSerializer):
     class Meta:
         model = Gallery
         fields = ("id", "slug", "name", "description", "cover", "order", "items")
+
+
+class GalleryListProjection(ListProjection):
+    field_sources = {
+        "id": ("id",),
+        "slug": ("slug",),
+        "name": ("translated_name",),
+        "cover": ("cover",),
+        "order": ("order",),
+    }
+
+    def get_cover(self, row):
+        return model_file_url(Gallery, "cover", row["cover"])
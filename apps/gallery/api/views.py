@@ -5,7 +5,12 @@ from rest_framework.viewsets import ReadOnlyModelViewSet
 from drf_spectacular.utils import extend_schema
 
 from apps.gallery.interface.paginations import CustomGalleryPagination
+from commons.interfaces.conditional import ConditionalGetMixin
+from commons.interfaces.projections import ProjectionListMixin
+from commons.interfaces.response_cache import CachedResponseMixin
+from commons.services.cache_versions import CATALOG
 from apps.gallery.api.serializers import (
+    GalleryListProjection,
     GalleryListSerializer,
     GalleryDetailSerializer,
     GalleryItemSerializer,
@@ -23,8 +28,12 @@ from apps.gallery.infrastructure.selectors import (
 
 
 @extend_schema(tags=["Gallery"])
-class GalleryViewSet(ReadOnlyModelViewSet):
+class GalleryViewSet(
+    ConditionalGetMixin, CachedResponseMixin, ProjectionListMixin, ReadOnlyModelViewSet
+):
     pagination_class = CustomGalleryPagination
+    list_projection_class = GalleryListProjection
+    cache_version_groups = (CATALOG,)
     lookup_field = "slug"
     # permission_classes = [IsAuthenticated]
 
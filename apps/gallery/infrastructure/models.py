@@ -3,6 +3,7 @@ from django.utils.translation import gettext_lazy as _
 from parler.models import TranslatableModel, TranslatedFields
 
 from commons.models.abstract_models import AbstractDateTimeModel
+from commons.models.translations import LanguageScopedManager
 
 
 class Gallery(TranslatableModel, AbstractDateTimeModel):
@@ -21,6 +22,8 @@ class Gallery(TranslatableModel, AbstractDateTimeModel):
     order = models.PositiveSmallIntegerField(default=0)
     is_active = models.BooleanField(default=True)
 
+    objects = LanguageScopedManager()
+
     class Meta:
         verbose_name = _("Gallery")
         verbose_name_plural = _("Galleries")
@@ -7,7 +7,7 @@ def get_active_galleries():
     return (
         Gallery.objects
         .filter(is_active=True)
-        .prefetch_related("translations")
+        .with_translated("name")
         .order_by("order")
     )
 
@@ -28,10 +28,8 @@ def get_active_gallery_by_slug(*, slug: str):
     return (
         Gallery.objects
         .filter(is_active=True, slug=slug)
-        .prefetch_related(
-            "translations",
-            Prefetch("items", queryset=active_items_qs),
-        )
+        .prefetch_translations()
+        .prefetch_related(Prefetch("items", queryset=active_items_qs))
         .first()
     )
 
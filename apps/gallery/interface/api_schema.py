@@ -1,6 +1,9 @@
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiResponse, OpenApiExample, OpenApiParameter
 
+from apps.gallery.api.serializers import GalleryListProjection
+from commons.interfaces.projections import sparse_fields_parameters
+
 # ──────────────────────────────────────────────
 # Переиспользуемые ответы
 # ──────────────────────────────────────────────
@@ -110,7 +113,7 @@ gallery_items_example = OpenApiExample(
 gallery_list_schema = {
     "summary": "Список альбомов галереи",
     "description": "Постраничный список активных альбомов без вложенных медиафайлов.",
-    "parameters": pagination_params,
+    "parameters": [*pagination_params, *sparse_fields_parameters(GalleryListProjection)],
     "responses": {
         200: OpenApiResponse(description="Список альбомов.", examples=[gallery_list_example]),
         401: response_401,
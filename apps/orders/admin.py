@@ -1 +1,3 @@
-from apps.orders.infrastructure.admin import OrderAdmin, OrderItemAdmin
+from apps.orders.infrastructure.admin import (AuthorDailySalesAdmin, BookDailySalesAdmin,
+                                              CategoryDailySalesAdmin, DailySalesAdmin, OrderAdmin,
+                                              OrderItemAdmin)
@@ -1,10 +1,13 @@
 from rest_framework.routers import DefaultRouter
 
-from apps.orders.api.views import OrderViewSet
+from apps.orders.api.views import OrderViewSet, SalesReportViewSet
 
 
 #   GET  /orders/           → list
 #   GET  /orders/{id}/      → retrieve
 #   POST /orders/purchase/  → purchase (@action)
+#   GET  /orders/{id}/status/ → order_status (@action)
+#   GET  /reports/{daily,books,categories,authors}/ → отчёты по продажам (админы)
 router = DefaultRouter()
 router.register(r"orders", OrderViewSet, basename="order")
+router.register(r"reports", SalesReportViewSet, basename="sales-report")
@@ -1,15 +1,16 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
 from rest_framework import serializers
 
 from apps.orders.infrastructure.models import Order, OrderItem
 
 
 class OrderItemSerializer(serializers.ModelSerializer):
-    book_slug = serializers.SlugRelatedField(
-        source="book",
-        read_only=True,
-        slug_field="slug",
-    )
-    book_name = serializers.CharField(source="book.name")
+    # Из снимка книги на момент покупки (OrderItem.book_snapshot) — без запросов к книге.
+    book_slug = serializers.CharField(read_only=True)
+    book_name = serializers.CharField(read_only=True)
     total_price = serializers.DecimalField(
         max_digits=10,
         decimal_places=2,
@@ -37,6 +38,7 @@ class OrderSerializer(serializers.ModelSerializer):
         fields = (
             "id",
             "status",
+            "failure_reason",
             "total_price",
             "items",
             "created_at",
@@ -45,3 +47,40 @@ class OrderSerializer(serializers.ModelSerializer):
 
     def get_created_at_display(self, obj) -> str:
         return obj.created_at.strftime("%H:%M %d.%m.%Y")
+
+
+class OrderStatusSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    status = serializers.ChoiceField(choices=Order.StatusChoices.choices)
+    failure_reason = serializers.CharField(allow_blank=True)
+
+
+class SalesReportQuerySerializer(serializers.Serializer):
+    # Без дат — последние 30 дней по сегодня; limit — только для рейтингов.
+    date_from = serializers.DateField(required=False)
+    date_to = serializers.DateField(required=False)
+    order_by = serializers.ChoiceField(choices=("revenue", "quantity"), default="revenue")
+    limit = serializers.IntegerField(min_value=1, max_value=500, default=settings.ORDER_REPORT_LIMIT)
+
+    def validate(self, attrs):
+        attrs["date_to"] = attrs.get("date_to") or timezone.localdate()
+        attrs["date_from"] = attrs.get("date_from") or attrs["date_to"] - timedelta(days=29)
+        if attrs["date_from"] > attrs["date_to"]:
+            raise serializers.ValidationError({"date_from": "date_from must not be after date_to."})
+        return attrs
+
+
+class DailySalesSerializer(serializers.Serializer):
+    date = serializers.DateField()
+    orders_count = serializers.IntegerField()
+    quantity = serializers.IntegerField()
+    revenue = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+
+class SalesRankingSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    slug = serializers.CharField()
+    name = serializers.CharField()
+    quantity = serializers.IntegerField()
+    revenue = serializers.DecimalField(max_digits=14, decimal_places=2)
+    orders_count = serializers.IntegerField()
@@ -1,18 +1,26 @@
+from django.conf import settings
+from django.db import IntegrityError
+from drf_spectacular.utils import extend_schema
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import NotFound
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-from apps.cart.infrastructure.selectors import get_cart_with_items
-from apps.orders.api.serializers import OrderSerializer
+from apps.cart.infrastructure.selectors import get_cart_for_checkout
+from apps.orders.api.serializers import (DailySalesSerializer, OrderSerializer, OrderStatusSerializer,
+                                         SalesRankingSerializer, SalesReportQuerySerializer)
 from apps.orders.interface.paginations import CustomOrdersPagination
 from apps.orders.infrastructure.repositories import OrderRepository
-from apps.orders.infrastructure.selectors import get_user_orders, get_user_order_detail
+from apps.orders.infrastructure.selectors import (get_daily_sales, get_sales_ranking,
+                                                  get_user_order_by_idempotency_key, get_user_orders,
+                                                  get_user_order_detail, get_user_order_status)
+from apps.orders.interface.api_schema import daily_sales_schema, sales_ranking_schema
+from commons.interfaces.idempotency import HEADER, REPLAYED_HEADER, IdempotentMixin, idempotency_key_parameter
 
 
-class OrderViewSet(viewsets.GenericViewSet):
+class OrderViewSet(IdempotentMixin, viewsets.GenericViewSet):
     serializer_class = OrderSerializer
     permission_classes = [IsAuthenticated]
     pagination_class = CustomOrdersPagination
@@ -33,17 +41,72 @@ class OrderViewSet(viewsets.GenericViewSet):
 
         return Response(serializer.data)
 
+    @extend_schema(
+        parameters=[idempotency_key_parameter],
+        responses={201: OrderSerializer, 202: OrderSerializer},
+        description=(
+            "Оформляет заказ из корзины. В асинхронном режиме (ORDER_ASYNC_CHECKOUT) "
+            "возвращает 202 с заказом в статусе queued; итог — GET /orders/{id}/status/."
+        ),
+    )
     @action(detail=False, methods=["post"], url_path="purchase", url_name="purchase")
     def purchase(self, request: Request) -> Response:
-        cart = get_cart_with_items(user=request.user)
+        # С Idempotency-Key повтор отдаёт первый ответ, не блокируя книги заново.
+        return self.idempotent_response(self._purchase, request)
 
-        order = OrderRepository().create_order_from_cart(
-            user=request.user,
-            cart=cart,
+    def _purchase(self, request: Request) -> Response:
+        # Ключ хранится в заказе: повтор находит его и без записи в кеше (истекла, сбой до неё).
+        key = request.headers.get(HEADER) or None
+        if key:
+            order = get_user_order_by_idempotency_key(user_id=request.user.pk, key=key)
+            if order is not None:
+                return self._purchase_response(order, replayed=True)
+
+        cart = get_cart_for_checkout(user=request.user)
+        checkout = (
+            OrderRepository().enqueue_order_from_cart
+            if settings.ORDER_ASYNC_CHECKOUT
+            else OrderRepository().create_order_from_cart
         )
 
+        try:
+            order = checkout(user=request.user, cart=cart, idempotency_key=key)
+        except IntegrityError:
+            # Параллельный дубль с тем же ключом закоммитил заказ первым.
+            order = key and get_user_order_by_idempotency_key(user_id=request.user.pk, key=key)
+            if not order:
+                raise
+            return self._purchase_response(order, replayed=True)
+
+        return self._purchase_response(order)
+
+    def _purchase_response(self, order, *, replayed: bool = False) -> Response:
         serializer = self.get_serializer(order)
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
+        response = Response(
+            serializer.data,
+            status=status.HTTP_202_ACCEPTED if settings.ORDER_ASYNC_CHECKOUT else status.HTTP_201_CREATED,
+        )
+        if replayed:
+            response.headers[REPLAYED_HEADER] = "true"
+        return response
+
+    @extend_schema(responses=OrderStatusSerializer)
+    @action(detail=True, methods=["get"], url_path="status", url_name="status")
+    def order_status(self, request: Request, pk: int = None) -> Response:
+        """
+        Статус заказа для опроса после асинхронного оформления.
+
+        Читается из кеша, который обновляет обработчик очереди, — без запроса к БД.
+        """
+        order_status = get_user_order_status(
+            order_id=int(pk),
+            user_id=request.user.pk,
+        ) if str(pk).isdigit() else None
+
+        if order_status is None:
+            raise NotFound(detail="Order not found.")
+
+        return Response(OrderStatusSerializer(order_status).data)
 
     def _get_order_or_404(self, *, order_id: int):
         """
@@ -60,4 +123,51 @@ class OrderViewSet(viewsets.GenericViewSet):
         if order is None:
             raise NotFound(detail="Order not found.")
 
-        return order
\ No newline at end of file
+        return order
+
+
+class SalesReportViewSet(viewsets.ViewSet):
+    """
+    Endpoints (только администраторы, из дневных свёрток продаж):
+    - GET /reports/daily/      - заказы и выручка по дням
+    - GET /reports/books/      - лучшие книги
+    - GET /reports/categories/ - лучшие категории
+    - GET /reports/authors/    - лучшие авторы
+    """
+
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(**daily_sales_schema)
+    @action(detail=False, methods=["get"], url_path="daily")
+    def daily(self, request: Request) -> Response:
+        query = self._get_query(request)
+        rows = get_daily_sales(
+            date_from=query["date_from"],
+            date_to=query["date_to"],
+        )
+        return Response(DailySalesSerializer(rows, many=True).data)
+
+    @extend_schema(**sales_ranking_schema("книги"))
+    @action(detail=False, methods=["get"], url_path="books")
+    def books(self, request: Request) -> Response:
+        return self._ranking(request, "books")
+
+    @extend_schema(**sales_ranking_schema("категории"))
+    @action(detail=False, methods=["get"], url_path="categories")
+    def categories(self, request: Request) -> Response:
+        return self._ranking(request, "categories")
+
+    @extend_schema(**sales_ranking_schema("авторы"))
+    @action(detail=False, methods=["get"], url_path="authors")
+    def authors(self, request: Request) -> Response:
+        return self._ranking(request, "authors")
+
+    def _ranking(self, request: Request, ranking: str) -> Response:
+        rows = get_sales_ranking(ranking=ranking, **self._get_query(request))
+        return Response(SalesRankingSerializer(rows, many=True).data)
+
+    @staticmethod
+    def _get_query(request: Request) -> dict:
+        query = SalesReportQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        return query.validated_data
@@ -1,6 +1,7 @@
 from django.contrib import admin
 
-from apps.orders.infrastructure.models import Order, OrderItem
+from apps.orders.infrastructure.models import (AuthorDailySales, BookDailySales, CategoryDailySales,
+                                               DailySales, Order, OrderItem)
 
 
 @admin.register(Order)
@@ -17,3 +18,47 @@ class OrderItemAdmin(admin.ModelAdmin):
 
     def has_add_permission(self, request):
         return False
+
+
+class DailySalesAdminMixin:
+    """Свёртки продаж только для чтения: их пересчитывает задача rollup_sales."""
+
+    date_hierarchy = "date"
+    list_filter = ("date",)
+    ordering = ("-date", "-revenue")
+    list_per_page = 50
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(DailySales)
+class DailySalesAdmin(DailySalesAdminMixin, admin.ModelAdmin):
+    list_display = ("date", "orders_count", "quantity", "revenue")
+
+
+@admin.register(BookDailySales)
+class BookDailySalesAdmin(DailySalesAdminMixin, admin.ModelAdmin):
+    list_display = ("date", "book", "quantity", "revenue", "orders_count")
+    list_select_related = ("book",)
+    search_fields = ("book__translations__name",)
+
+
+@admin.register(CategoryDailySales)
+class CategoryDailySalesAdmin(DailySalesAdminMixin, admin.ModelAdmin):
+    list_display = ("date", "category", "quantity", "revenue", "orders_count")
+    list_select_related = ("category",)
+    search_fields = ("category__translations__name",)
+
+
+@admin.register(AuthorDailySales)
+class AuthorDailySalesAdmin(DailySalesAdminMixin, admin.ModelAdmin):
+    list_display = ("date", "author", "quantity", "revenue", "orders_count")
+    list_select_related = ("author",)
+    search_fields = ("author__translations__name",)
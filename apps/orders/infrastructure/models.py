@@ -1,16 +1,22 @@
 from django.db import models
 from django.conf import settings
-from django.utils.translation import gettext_lazy as _
+from django.utils.translation import get_language, gettext_lazy as _
 
+from apps.authors.infrastructure.models import Author
 from apps.books.infrastructure import Book
+from apps.books.infrastructure.models import BookCategory
 from commons.models.abstract_models import AbstractDateTimeModel
 
 
 class Order(AbstractDateTimeModel):
     class StatusChoices(models.TextChoices):
+        # queued/failed — только асинхронное оформление (ORDER_ASYNC_CHECKOUT):
+        # заказ ждёт обработчика или не прошёл проверку остатка.
+        QUEUED = "queued", _("Queued")
         PENDING = "pending", _("Pending")
         PAID = "paid", _("Paid")
         CANCELLED = "cancelled", _("Cancelled")
+        FAILED = "failed", _("Failed")
 
     user = models.ForeignKey(
         to=settings.AUTH_USER_MODEL,
@@ -26,11 +32,35 @@ class Order(AbstractDateTimeModel):
         max_digits=12,
         decimal_places=2
     )
+    failure_reason = models.CharField(
+        max_length=255,
+        blank=True,
+        default="",
+    )
+    # Idempotency-Key запроса purchase: пишется в той же транзакции, что и заказ,
+    # поэтому повтор находит заказ и после истечения записи в кеше или сбоя до неё.
+    idempotency_key = models.CharField(
+        max_length=255,
+        null=True,
+        blank=True,
+        editable=False,
+    )
 
     class Meta:
         verbose_name = _("Order")
         verbose_name_plural = _("Orders")
         ordering = ("-created_at",)
+        indexes = [
+            # Выборка заказов, изменённых после watermark свёртки продаж.
+            models.Index(fields=["updated_at"]),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "idempotency_key"],
+                condition=models.Q(idempotency_key__isnull=False),
+                name="orders_order_user_idempotency_key_uniq",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"Order #{self.pk} -- {self.user} -- {self.status}"
@@ -49,6 +79,9 @@ class OrderItem(AbstractDateTimeModel):
     )
     quantity = models.PositiveSmallIntegerField(default=1)
     price = models.DecimalField(max_digits=12, decimal_places=2)
+    # Книга на момент покупки: {"name": {<язык>: ...}, "slug", "image", "price"}.
+    # История заказов читает её, а не книгу с переводами, и не меняется при переименовании книги.
+    book_snapshot = models.JSONField(default=dict, blank=True)
 
     class Meta:
         verbose_name = _("Order Item")
@@ -61,3 +94,114 @@ class OrderItem(AbstractDateTimeModel):
     @property
     def total_price(self):
         return self.price * self.quantity
+
+    @property
+    def book_name(self) -> str:
+        names = self.book_snapshot.get("name")
+        if not names:
+            # Позиция до появления снимка (до backfill_order_snapshots).
+            return self.book.name
+
+        fallbacks = settings.PARLER_LANGUAGES["default"]["fallbacks"]
+        for language_code in (get_language(), *fallbacks):
+            if names.get(language_code):
+                return names[language_code]
+        return next((name for name in names.values() if name), "")
+
+    @property
+    def book_slug(self) -> str:
+        return self.book_snapshot.get("slug") or self.book.slug
+
+
+class AbstractDailySales(models.Model):
+    # Строки пересчитывает только apps.orders.infrastructure.rollups; отчёты читают их,
+    # не трогая Order/OrderItem. Учитываются заказы в статусах SALES_STATUSES.
+    date = models.DateField()
+    quantity = models.PositiveIntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    orders_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        abstract = True
+        ordering = ("-date",)
+
+
+class DailySales(AbstractDailySales):
+    class Meta(AbstractDailySales.Meta):
+        verbose_name = _("Daily Sales")
+        verbose_name_plural = _("Daily Sales")
+        constraints = [
+            models.UniqueConstraint(fields=["date"], name="orders_dailysales_date_uniq"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.date}: {self.revenue}"
+
+
+class BookDailySales(AbstractDailySales):
+    book = models.ForeignKey(
+        to=Book,
+        on_delete=models.CASCADE,
+        related_name="daily_sales",
+    )
+
+    class Meta(AbstractDailySales.Meta):
+        verbose_name = _("Book Daily Sales")
+        verbose_name_plural = _("Book Daily Sales")
+        unique_together = ("date", "book")
+
+    def __str__(self) -> str:
+        return f"{self.date} -- {self.book_id}: {self.quantity}"
+
+
+class CategoryDailySales(AbstractDailySales):
+    # Книга в нескольких категориях учитывается в каждой из них целиком.
+    category = models.ForeignKey(
+        to=BookCategory,
+        on_delete=models.CASCADE,
+        related_name="daily_sales",
+    )
+
+    class Meta(AbstractDailySales.Meta):
+        verbose_name = _("Category Daily Sales")
+        verbose_name_plural = _("Category Daily Sales")
+        unique_together = ("date", "category")
+
+    def __str__(self) -> str:
+        return f"{self.date} -- {self.category_id}: {self.quantity}"
+
+
+class AuthorDailySales(AbstractDailySales):
+    # Книга нескольких авторов учитывается у каждого из них целиком.
+    author = models.ForeignKey(
+        to=Author,
+        on_delete=models.CASCADE,
+        related_name="daily_sales",
+    )
+
+    class Meta(AbstractDailySales.Meta):
+        verbose_name = _("Author Daily Sales")
+        verbose_name_plural = _("Author Daily Sales")
+        unique_together = ("date", "author")
+
+    def __str__(self) -> str:
+        return f"{self.date} -- {self.author_id}: {self.quantity}"
+
+
+class SalesRollupWatermark(models.Model):
+    """
+    До какого Order.updated_at заказы уже учтены в *DailySales.
+
+    Одна строка на имя свёртки; следующий запуск берёт только заказы, изменённые после неё.
+    """
+
+    name = models.CharField(max_length=50, unique=True)
+    processed_until = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = _("Sales Rollup Watermark")
+        verbose_name_plural = _("Sales Rollup Watermarks")
+
+    def __str__(self) -> str:
+        return f"{self.name} @ {self.processed_until}"
@@ -1,19 +1,65 @@
+import logging
+from decimal import Decimal
+from typing import Iterable, Optional
+
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db import transaction
 from django.db.models import F
+from django.db.models.functions import Now
 from rest_framework.exceptions import ValidationError
 
 from apps.books.infrastructure import Book
+from apps.cart.infrastructure.hot_cart import HotCartStore
 from apps.cart.infrastructure.models import Cart
 from apps.orders.infrastructure.models import Order, OrderItem
+from apps.orders.infrastructure.status_cache import set_order_status_on_commit
+from commons.services.cache_versions import STOCK, bump_cache_version_on_commit
+
+logger = logging.getLogger(__name__)
 
 User = get_user_model()
 
 
+def build_book_snapshots(book_ids: Iterable[int]) -> dict[int, dict]:
+    """
+    Снимки книг для OrderItem.book_snapshot: названия на всех языках, slug и путь картинки.
+    Два запроса на любое число книг; цену за штуку добавляет with_price.
+    """
+    book_ids = set(book_ids)
+    snapshots = {
+        book_id: {"name": {}, "slug": slug, "image": image or ""}
+        for book_id, slug, image in Book.objects.filter(id__in=book_ids).values_list("id", "slug", "image")
+    }
+
+    translations = Book._parler_meta.root.model.objects.filter(master_id__in=book_ids)
+    for book_id, language_code, name in translations.values_list("master_id", "language_code", "name"):
+        snapshots[book_id]["name"][language_code] = name
+
+    return snapshots
+
+
+def with_price(snapshot: dict, price) -> dict:
+    return {**snapshot, "price": f"{Decimal(price):.2f}"}
+
+
+def checkout_partition(book_ids: Iterable[int]) -> int:
+    """
+    Партиция (очередь checkout-<n>) асинхронного оформления заказа — по младшему id книги.
+
+    По порядку (одним воркером очереди) идут только заказы с одинаковой младшей книгой,
+    в том числе все заказы из одной книги — типичный случай распродажи. Заказы, у которых
+    общая книга не младшая, могут попасть в разные очереди: тогда они ждут друг друга
+    на select_for_update в process_queued_order (книги блокируются по id, без взаимных
+    блокировок), и остаток списывается верно, но порядок между ними не гарантирован.
+    """
+    return min(book_ids) % settings.ORDER_CHECKOUT_PARTITIONS
+
+
 class OrderRepository:
 
     @transaction.atomic
-    def create_order_from_cart(self, *, user: User, cart) -> Order:
+    def create_order_from_cart(self, *, user: User, cart, idempotency_key: Optional[str] = None) -> Order:
         self._validate_cart_not_empty(cart)
 
         # Block books before working with them
@@ -23,11 +69,9 @@ class OrderRepository:
         }
 
         # Check in stock count (доп. проверка)
-        for item in cart.items.all():
-            book = locked_books[item.book_id]
-            if item.quantity > book.in_stock:
-                book_name = book.safe_translation_getter('name', any_language=True) or f"Book #{book.id}"
-                raise ValidationError({"detail": f"'{book_name}' has only {book.in_stock} copies left."})
+        shortage = self._find_shortage(items=cart.items.all(), locked_books=locked_books)
+        if shortage:
+            raise ValidationError({"detail": shortage})
 
         total_price = self._calculate_total(cart)
 
@@ -35,14 +79,97 @@ class OrderRepository:
             user=user,
             total_price=total_price,
             status=Order.StatusChoices.PENDING,
+            idempotency_key=idempotency_key,
+        )
+
+        self._create_order_items(order=order, cart=cart)
+        self._decrement_stock(items=cart.items.all())
+        self._deactivate_cart(cart=cart)
+
+        return order
+
+    @transaction.atomic
+    def enqueue_order_from_cart(self, *, user: User, cart, idempotency_key: Optional[str] = None) -> Order:
+        """
+        Асинхронное оформление (ORDER_ASYNC_CHECKOUT): заказ в статусе queued без блокировок.
+
+        Зачем:
+        На старте продаж популярной книги запросы purchase выстраивались в очередь
+        на select_for_update, и веб-воркеры стояли на блокировках БД. Здесь заказ
+        фиксирует состав и цены корзины, а остаток проверяет и списывает
+        process_queued_order в Celery — по очереди на партицию книг.
+        """
+        self._validate_cart_not_empty(cart)
+
+        order = Order.objects.create(
+            user=user,
+            total_price=self._calculate_total(cart),
+            status=Order.StatusChoices.QUEUED,
+            idempotency_key=idempotency_key,
         )
 
         self._create_order_items(order=order, cart=cart)
-        self._decrement_stock(cart=cart)
         self._deactivate_cart(cart=cart)
+        set_order_status_on_commit(order)
+
+        partition = checkout_partition(item.book_id for item in cart.items.all())
+        transaction.on_commit(lambda: self._enqueue_checkout(order.pk, partition))
 
         return order
 
+    @transaction.atomic
+    def process_queued_order(self, *, order_id: int) -> Optional[Order]:
+        """
+        Проверяет остаток и списывает его для заказа из очереди.
+
+        Не хватает остатка — заказ failed с причиной, корзина снова активна.
+        Повторная доставка задачи для уже обработанного заказа ничего не делает.
+        """
+        order = Order.objects.select_for_update().filter(
+            pk=order_id, status=Order.StatusChoices.QUEUED
+        ).first()
+        if order is None:
+            return None
+
+        items = list(order.items.all())
+        locked_books = {
+            b.id: b
+            for b in Book.objects.select_for_update().filter(id__in=[item.book_id for item in items]).order_by("id")
+        }
+
+        shortage = self._find_shortage(items=items, locked_books=locked_books)
+        if shortage:
+            order.status = Order.StatusChoices.FAILED
+            order.failure_reason = shortage
+            self._reactivate_cart(user_id=order.user_id)
+        else:
+            self._decrement_stock(items=items)
+            order.status = Order.StatusChoices.PENDING
+
+        order.save(update_fields=["status", "failure_reason", "updated_at"])
+        set_order_status_on_commit(order)
+
+        return order
+
+    @staticmethod
+    def _enqueue_checkout(order_id: int, partition: int) -> None:
+        from apps.orders.infrastructure.tasks import process_checkout
+
+        try:
+            process_checkout.apply_async(args=[order_id], queue=f"checkout-{partition}")
+        except Exception:
+            # Заказ остаётся queued; его подберёт периодический requeue_stale_checkouts.
+            logger.warning("Failed to enqueue checkout of order %s", order_id, exc_info=True)
+
+    @staticmethod
+    def _find_shortage(*, items, locked_books: dict) -> Optional[str]:
+        for item in items:
+            book = locked_books[item.book_id]
+            if item.quantity > book.in_stock:
+                book_name = book.safe_translation_getter('name', any_language=True) or f"Book #{book.id}"
+                return f"'{book_name}' has only {book.in_stock} copies left."
+        return None
+
     @staticmethod
     def _validate_cart_not_empty(cart) -> None:
         if cart is None or not cart.items.all():
@@ -54,14 +181,17 @@ class OrderRepository:
 
     @staticmethod
     def _create_order_items(*, order: Order, cart) -> None:
+        items = cart.items.all()
+        snapshots = build_book_snapshots(item.book_id for item in items)
         order_items = [
             OrderItem(
                 order=order,
                 book_id=item.book_id,
                 quantity=item.quantity,
                 price=item.book.price,
+                book_snapshot=with_price(snapshots[item.book_id], item.book.price),
             )
-            for item in cart.items.all()
+            for item in items
         ]
 
         OrderItem.objects.bulk_create(order_items)
@@ -69,10 +199,52 @@ class OrderRepository:
     @staticmethod
     def _deactivate_cart(*, cart) -> None:
         Cart.objects.filter(pk=cart.pk).update(is_active=False)
+        # Корзина в Redis перечитается из БД уже неактивной.
+        transaction.on_commit(lambda: HotCartStore.invalidate(cart.user_id))
 
     @staticmethod
-    def _decrement_stock(*, cart) -> None:
-        for item in cart.items.all():
+    def _reactivate_cart(*, user_id: int) -> None:
+        # Позиции корзины после оформления не удаляются — пользователь видит её снова.
+        Cart.objects.filter(user_id=user_id).update(is_active=True)
+        transaction.on_commit(lambda: HotCartStore.invalidate(user_id))
+
+    @staticmethod
+    def _decrement_stock(*, items) -> None:
+        for item in items:
             Book.objects.filter(pk=item.book_id).update(
-                in_stock=F("in_stock") - item.quantity
+                in_stock=F("in_stock") - item.quantity,
+                updated_at=Now(),
             )
+        # update() идёт мимо сигналов: закешированные ответы с in_stock устаревают
+        # со сменой версии STOCK (остальной кеш каталога от остатка не зависит).
+        bump_cache_version_on_commit(STOCK)
+
+
+class OrderItemSnapshotRepository:
+
+    @staticmethod
+    def backfill(*, batch_size: int = 500) -> int:
+        """
+        Заполняет book_snapshot позиций, оформленных до его появления.
+
+        Пачки по batch_size позиций (keyset по id), каждая — свой короткий запрос на обновление.
+        Цена в снимке — цена позиции; название, slug и картинка — текущие у книги.
+        """
+        updated = 0
+        last_id = 0
+        while True:
+            items = list(
+                OrderItem.objects.filter(id__gt=last_id, book_snapshot={})
+                .order_by("id")
+                .only("id", "book_id", "price")[:batch_size]
+            )
+            if not items:
+                return updated
+
+            snapshots = build_book_snapshots(item.book_id for item in items)
+            for item in items:
+                item.book_snapshot = with_price(snapshots[item.book_id], item.price)
+
+            OrderItem.objects.bulk_update(items, ["book_snapshot"])
+            updated += len(items)
+            last_id = items[-1].id
@@ -0,0 +1,153 @@
+import operator
+import time
+from datetime import date, datetime, timedelta
+from functools import reduce
+from typing import Iterable, Optional
+
+from django.db import transaction
+from django.db.models import Count, DecimalField, F, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from apps.orders.infrastructure.models import (AuthorDailySales, BookDailySales, CategoryDailySales,
+                                               DailySales, Order, OrderItem, SalesRollupWatermark)
+
+WATERMARK = "order-sales"
+
+# Продажа — заказ, который оформлен: queued ещё может не пройти, failed и cancelled не состоялись.
+SALES_STATUSES = (Order.StatusChoices.PENDING, Order.StatusChoices.PAID)
+
+REVENUE = Sum(F("price") * F("quantity"), output_field=DecimalField(max_digits=14, decimal_places=2))
+
+# Модель свёртки -> поле группировки в OrderItem (None — итог дня).
+ROLLUPS = (
+    (DailySales, None, None),
+    (BookDailySales, "book_id", "book_id"),
+    (CategoryDailySales, "category_id", "book__category"),
+    (AuthorDailySales, "author_id", "book__author"),
+)
+
+
+def _day_range(first: date, last: date) -> Q:
+    tz = timezone.get_current_timezone()
+    start = timezone.make_aware(datetime.combine(first, datetime.min.time()), tz)
+    end = timezone.make_aware(datetime.combine(last + timedelta(days=1), datetime.min.time()), tz)
+    return Q(order__created_at__gte=start, order__created_at__lt=end)
+
+
+def _days_filter(days: list[date]) -> Q:
+    # Подряд идущие дни — одним диапазоном по order.created_at, чтобы работал индекс.
+    ranges = []
+    first = last = days[0]
+    for day in days[1:]:
+        if day != last + timedelta(days=1):
+            ranges.append(_day_range(first, last))
+            first = day
+        last = day
+    ranges.append(_day_range(first, last))
+    return reduce(operator.or_, ranges)
+
+
+def _aggregate(days: list[date], group_by: Optional[str]) -> list[dict]:
+    queryset = OrderItem.objects.filter(
+        _days_filter(days),
+        order__status__in=SALES_STATUSES,
+    ).annotate(date=TruncDate("order__created_at"))
+
+    fields = ("date", "group") if group_by else ("date",)
+    if group_by:
+        queryset = queryset.annotate(group=F(group_by)).filter(group__isnull=False)
+
+    return list(
+        queryset.values(*fields)
+        .annotate(
+            # revenue раньше quantity: иначе F("quantity") в REVENUE возьмёт уже агрегат.
+            revenue=REVENUE,
+            quantity=Sum("quantity"),
+            orders_count=Count("order_id", distinct=True),
+        )
+        .order_by()
+    )
+
+
+def _rebuild_days(days: list[date]) -> int:
+    """
+    Пересчитывает свёртки за дни целиком: удаляет их строки и вставляет посчитанные заново.
+
+    Зачем целиком, а не прибавлять дельту заказа:
+    заказ меняет статус (queued -> pending/failed, отмена из админки), и дельта
+    посчитала бы его дважды или не вычла. Пересчёт дня идемпотентен — повторный
+    запуск после сбоя даёт тот же результат.
+    """
+    with transaction.atomic():
+        # Параллельные запуски считают и пишут одни и те же дни по очереди.
+        SalesRollupWatermark.objects.select_for_update().get(name=WATERMARK)
+
+        written = 0
+        for model, field, source in ROLLUPS:
+            rows = _aggregate(days, source)
+            model.objects.filter(date__in=days).delete()
+            objs = model.objects.bulk_create([
+                model(
+                    date=row["date"],
+                    quantity=row["quantity"],
+                    revenue=row["revenue"],
+                    orders_count=row["orders_count"],
+                    **({field: row["group"]} if field else {}),
+                )
+                for row in rows
+            ])
+            written += len(objs)
+
+    return written
+
+
+def _changed_days(since: Optional[datetime], until: datetime) -> list[date]:
+    queryset = Order.objects.filter(updated_at__lte=until)
+    if since is not None:
+        queryset = queryset.filter(updated_at__gt=since)
+
+    return sorted(
+        queryset.annotate(day=TruncDate("created_at"))
+        .values_list("day", flat=True)
+        .order_by()
+        .distinct()
+    )
+
+
+def _chunks(days: list[date], size: int) -> Iterable[list[date]]:
+    for start in range(0, len(days), size):
+        yield days[start:start + size]
+
+
+def refresh_sales_rollups(*, until: datetime, batch_days: int) -> dict[str, float]:
+    """
+    Инкрементальное обновление *DailySales.
+
+    Берёт заказы, изменённые после watermark (Order.updated_at), и пересчитывает
+    только их дни — по batch_days дней в транзакции. Watermark сдвигается до until
+    после последней пачки; если запуск упал раньше, следующий повторит те же дни.
+
+    until должен отставать от текущего времени на длину самой долгой транзакции
+    оформления: заказ, закоммиченный позже, с updated_at раньше until, иначе не попадёт в свёртку.
+    """
+    started = time.monotonic()
+    watermark, _ = SalesRollupWatermark.objects.get_or_create(name=WATERMARK)
+
+    days = _changed_days(watermark.processed_until, until)
+    rows = 0
+    for chunk in _chunks(days, batch_days):
+        rows += _rebuild_days(chunk)
+
+    with transaction.atomic():
+        watermark = SalesRollupWatermark.objects.select_for_update().get(name=WATERMARK)
+        # Опоздавший параллельный запуск не откатывает watermark назад.
+        if watermark.processed_until is None or watermark.processed_until < until:
+            watermark.processed_until = until
+            watermark.save(update_fields=["processed_until", "updated_at"])
+
+    return {
+        "days": len(days),
+        "rows": rows,
+        "seconds": round(time.monotonic() - started, 3),
+    }
@@ -1,18 +1,108 @@
-from apps.orders.infrastructure.models import Order
+from datetime import date
+from typing import Optional
 
+from django.db.models import Sum
 
+from apps.authors.infrastructure.models import Author
+from apps.books.infrastructure import Book
+from apps.books.infrastructure.models import BookCategory
+from apps.orders.infrastructure.models import (AuthorDailySales, BookDailySales, CategoryDailySales,
+                                               DailySales, Order)
+from apps.orders.infrastructure.status_cache import get_cached_order_status
+
+
+# Позиции читаются без книг: название и slug — из OrderItem.book_snapshot.
 def get_user_orders(*, user_id: int):
     return (
         Order.objects.filter(user_id=user_id)
-        .select_related("user")
-        .prefetch_related("items__book")
+        .prefetch_related("items")
     )
 
 
 def get_user_order_detail(*, order_id: int, user_id: int):
     return (
         Order.objects.filter(pk=order_id, user_id=user_id)
-        .select_related("user")
-        .prefetch_related("items__book")
+        .prefetch_related("items")
+        .first()
+    )
+
+
+def get_user_order_by_idempotency_key(*, user_id: int, key: str):
+    return (
+        Order.objects.filter(user_id=user_id, idempotency_key=key)
+        .prefetch_related("items")
         .first()
     )
+
+
+def get_user_order_status(*, order_id: int, user_id: int) -> Optional[dict]:
+    """Статус заказа для опроса: из кеша (его обновляет обработчик очереди), иначе из БД."""
+    cached = get_cached_order_status(order_id)
+    if cached is not None:
+        owner_id, status, failure_reason = cached
+        if owner_id != user_id:
+            return None
+    else:
+        row = (
+            Order.objects.filter(pk=order_id, user_id=user_id)
+            .values_list("status", "failure_reason")
+            .first()
+        )
+        if row is None:
+            return None
+        status, failure_reason = row
+
+    return {"id": order_id, "status": status, "failure_reason": failure_reason}
+
+
+# Отчёты по продажам читают только дневные свёртки (*DailySales), не Order/OrderItem.
+# Рейтинг -> (свёртка, поле группировки, модель для slug и названия).
+SALES_RANKINGS = {
+    "books": (BookDailySales, "book_id", Book),
+    "categories": (CategoryDailySales, "category_id", BookCategory),
+    "authors": (AuthorDailySales, "author_id", Author),
+}
+
+
+def get_daily_sales(*, date_from: date, date_to: date) -> list[dict]:
+    return list(
+        DailySales.objects.filter(date__range=(date_from, date_to))
+        .order_by("date")
+        .values("date", "orders_count", "quantity", "revenue")
+    )
+
+
+def get_sales_ranking(*, ranking: str, date_from: date, date_to: date, order_by: str, limit: int) -> list[dict]:
+    """
+    Лучшие книги, категории или авторы за период: суммы дневных строк свёртки,
+    плюс slug и название на текущем языке вторым запросом.
+    """
+    model, field, target = SALES_RANKINGS[ranking]
+    rows = list(
+        model.objects.filter(date__range=(date_from, date_to))
+        .values(field)
+        .annotate(
+            quantity=Sum("quantity"),
+            revenue=Sum("revenue"),
+            orders_count=Sum("orders_count"),
+        )
+        .order_by(f"-{order_by}", field)[:limit]
+    )
+
+    names = {
+        pk: (slug, name)
+        for pk, slug, name in target.objects.filter(pk__in=[row[field] for row in rows])
+        .with_translated("name")
+        .values_list("pk", "slug", "translated_name")
+    }
+    return [
+        {
+            "id": row[field],
+            "slug": names.get(row[field], ("", ""))[0],
+            "name": names.get(row[field], ("", ""))[1] or "",
+            "quantity": row["quantity"],
+            "revenue": row["revenue"],
+            "orders_count": row["orders_count"],
+        }
+        for row in rows
+    ]
@@ -0,0 +1,31 @@
+from typing import Optional
+
+from django.core.cache import cache
+from django.db import transaction
+
+from apps.orders.infrastructure.models import Order
+
+KEY_TEMPLATE = "order-status:{}"
+# Статус опрашивают, пока заказ в очереди; после этого запись не нужна.
+STATUS_TIMEOUT = 60 * 60
+
+
+def _key(order_id: int) -> str:
+    return KEY_TEMPLATE.format(order_id)
+
+
+def get_cached_order_status(order_id: int) -> Optional[tuple[int, str, str]]:
+    """(user_id, status, failure_reason) или None."""
+    return cache.get(_key(order_id))
+
+
+def set_order_status_on_commit(order: Order) -> None:
+    """
+    Кладёт статус заказа в кеш после коммита.
+
+    Зачем:
+    Клиент асинхронного оформления опрашивает статус часто; ответ из кеша
+    не ходит в БД, а после коммита в кеше не окажется статус откатившейся транзакции.
+    """
+    state = (order.user_id, order.status, order.failure_reason)
+    transaction.on_commit(lambda: cache.set(_key(order.pk), state, STATUS_TIMEOUT))
@@ -0,0 +1,71 @@
+import logging
+from datetime import timedelta
+
+from celery import shared_task
+from django.conf import settings
+from django.utils import timezone
+
+from apps.orders.infrastructure.models import Order, OrderItem
+from apps.orders.infrastructure.repositories import OrderRepository, checkout_partition
+from apps.orders.infrastructure.rollups import refresh_sales_rollups
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(acks_late=True)
+def process_checkout(order_id: int) -> str | None:
+    """
+    Асинхронное оформление заказа (ORDER_ASYNC_CHECKOUT).
+
+    Ставится в очередь checkout-<n> своей партиции книг; у каждой очереди
+    один воркер с concurrency=1, поэтому заказы одной книги идут по порядку
+    и не ждут блокировок друг друга.
+    """
+    order = OrderRepository().process_queued_order(order_id=order_id)
+    if order is None:
+        return None
+
+    logger.info("Checkout of order %s: %s", order.pk, order.status)
+    return order.status
+
+
+@shared_task
+def requeue_stale_checkouts() -> int:
+    """
+    Periodic (Celery beat): заново ставит заказы, которые слишком долго в queued
+    (задача не поставилась или потерялась вместе с воркером).
+    """
+    cutoff = timezone.now() - timedelta(seconds=settings.ORDER_CHECKOUT_REQUEUE_AFTER)
+    order_ids = list(
+        Order.objects.filter(status=Order.StatusChoices.QUEUED, updated_at__lt=cutoff)
+        .order_by("created_at")
+        .values_list("pk", flat=True)
+    )
+    if not order_ids:
+        return 0
+
+    books: dict[int, list[int]] = {}
+    for order_id, book_id in OrderItem.objects.filter(order_id__in=order_ids).values_list("order_id", "book_id"):
+        books.setdefault(order_id, []).append(book_id)
+
+    # Следующий перезапуск — не раньше чем через ORDER_CHECKOUT_REQUEUE_AFTER.
+    Order.objects.filter(pk__in=order_ids).update(updated_at=timezone.now())
+    for order_id in order_ids:
+        OrderRepository._enqueue_checkout(order_id, checkout_partition(books[order_id]))
+
+    logger.info("Requeued %s stale checkouts", len(order_ids))
+    return len(order_ids)
+
+
+@shared_task
+def rollup_sales() -> dict[str, float]:
+    """
+    Periodic (Celery beat): дописывает в дневные свёртки продаж (*DailySales)
+    заказы, изменённые после прошлого запуска.
+    """
+    stats = refresh_sales_rollups(
+        until=timezone.now() - timedelta(seconds=settings.ORDER_ROLLUP_LAG),
+        batch_days=settings.ORDER_ROLLUP_BATCH_DAYS,
+    )
+    logger.info("Rolled up sales: %s days, %s rows, %.1fs", stats["days"], stats["rows"], stats["seconds"])
+    return stats
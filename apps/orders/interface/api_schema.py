@@ -0,0 +1,30 @@
+from drf_spectacular.utils import OpenApiResponse
+
+from apps.orders.api.serializers import (DailySalesSerializer, SalesRankingSerializer,
+                                         SalesReportQuerySerializer)
+
+
+daily_sales_schema = dict(
+    summary="Продажи по дням",
+    description=(
+        "Заказы, проданные экземпляры и выручка за каждый день периода "
+        "(по умолчанию последние 30 дней). Только для администраторов. "
+        "Читается из дневных свёрток, которые задача rollup_sales обновляет "
+        "раз в ORDER_ROLLUP_INTERVAL_MINUTES, поэтому последние минуты в отчёт ещё не попали."
+    ),
+    parameters=[SalesReportQuerySerializer],
+    responses={200: OpenApiResponse(response=DailySalesSerializer(many=True))},
+)
+
+
+def sales_ranking_schema(subject: str) -> dict:
+    return dict(
+        summary=f"Лучшие {subject} по продажам",
+        description=(
+            f"{subject.capitalize()} с наибольшей выручкой (order_by=revenue) или числом "
+            "проданных экземпляров (order_by=quantity) за период. Только для администраторов; "
+            "читается из дневных свёрток, как и /reports/daily/."
+        ),
+        parameters=[SalesReportQuerySerializer],
+        responses={200: OpenApiResponse(response=SalesRankingSerializer(many=True))},
+    )
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from apps.orders.infrastructure.repositories import OrderItemSnapshotRepository
+
+
+class Command(BaseCommand):
+    help = (
+        "Fills OrderItem.book_snapshot for order items created before snapshots existed. "
+        "Until it runs, order history falls back to reading the book for such items."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        updated = OrderItemSnapshotRepository.backfill(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Backfilled {updated} order items."))
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-19 14:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders", "0002_order_queued_failed_status"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="orderitem",
+            name="book_snapshot",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
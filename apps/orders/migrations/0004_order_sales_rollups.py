@@ -0,0 +1,183 @@
+# Generated by Django 6.0.1 on 2026-10-19 14:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authors", "0003_alter_author_slug"),
+        ("books", "0006_bookcategory_active_books_counters"),
+        ("orders", "0003_orderitem_book_snapshot"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AuthorDailySales",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("quantity", models.PositiveIntegerField(default=0)),
+                (
+                    "revenue",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=14),
+                ),
+                ("orders_count", models.PositiveIntegerField(default=0)),
+                (
+                    "author",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_sales",
+                        to="authors.author",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Author Daily Sales",
+                "verbose_name_plural": "Author Daily Sales",
+                "ordering": ("-date",),
+                "abstract": False,
+                "unique_together": {("date", "author")},
+            },
+        ),
+        migrations.CreateModel(
+            name="BookDailySales",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("quantity", models.PositiveIntegerField(default=0)),
+                (
+                    "revenue",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=14),
+                ),
+                ("orders_count", models.PositiveIntegerField(default=0)),
+                (
+                    "book",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_sales",
+                        to="books.book",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Book Daily Sales",
+                "verbose_name_plural": "Book Daily Sales",
+                "ordering": ("-date",),
+                "abstract": False,
+                "unique_together": {("date", "book")},
+            },
+        ),
+        migrations.CreateModel(
+            name="CategoryDailySales",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("quantity", models.PositiveIntegerField(default=0)),
+                (
+                    "revenue",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=14),
+                ),
+                ("orders_count", models.PositiveIntegerField(default=0)),
+                (
+                    "category",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_sales",
+                        to="books.bookcategory",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Category Daily Sales",
+                "verbose_name_plural": "Category Daily Sales",
+                "ordering": ("-date",),
+                "abstract": False,
+                "unique_together": {("date", "category")},
+            },
+        ),
+        migrations.CreateModel(
+            name="DailySales",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("quantity", models.PositiveIntegerField(default=0)),
+                (
+                    "revenue",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=14),
+                ),
+                ("orders_count", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "Daily Sales",
+                "verbose_name_plural": "Daily Sales",
+                "ordering": ("-date",),
+                "abstract": False,
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("date",), name="orders_dailysales_date_uniq"
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="SalesRollupWatermark",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=50, unique=True)),
+                ("processed_until", models.DateTimeField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Sales Rollup Watermark",
+                "verbose_name_plural": "Sales Rollup Watermarks",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["updated_at"], name="orders_orde_updated_94e16c_idx"
+            ),
+        ),
+    ]
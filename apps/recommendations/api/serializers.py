@@ -1,33 +1,41 @@
 from rest_framework import serializers
 
+from apps.books.interface.book_cards import (BookCardListSerializer,
+                                            BookCardsMixin)
 from apps.recommendations.infrastructure.models import Recommendation, RecommendationBook
-from commons.interfaces.urlfile_path import FileResponseField
+from commons.interfaces.projections import ListProjection
+from commons.interfaces.translated_fields import (TranslatedCharField,
+                                                 TranslatedFileField)
+from commons.interfaces.urlfile_path import FileResponseField, build_file_url
 
 
-class RecommendationBookSerializer(serializers.ModelSerializer):
-    book_slug = serializers.SlugField(source="book.slug", read_only=True)
-
+class RecommendationBookSerializer(BookCardsMixin, serializers.ModelSerializer):
+    book_slug = serializers.SerializerMethodField()
     book_name = serializers.SerializerMethodField()
     book_image = serializers.SerializerMethodField()
 
     class Meta:
         model = RecommendationBook
         fields = ("book_slug", "book_name", "book_image", "order")
+        list_serializer_class = BookCardListSerializer
+
+    def get_book_slug(self, obj: RecommendationBook) -> str | None:
+        return (self.get_book_card(obj) or {}).get("slug")
 
     def get_book_name(self, obj: RecommendationBook) -> str | None:
-        return obj.book.safe_translation_getter("name", any_language=True)
+        return (self.get_book_card(obj) or {}).get("name")
 
     def get_book_image(self, obj: RecommendationBook) -> str | None:
         request = self.context.get("request")
-        image = obj.book.image or None
+        image = (self.get_book_card(obj) or {}).get("image")
         if image:
-            return request.build_absolute_uri(image.url)
+            return request.build_absolute_uri(image)
         return None
 
 
 class RecommendationListSerializer(serializers.ModelSerializer):
-    title = serializers.CharField()
-    image = FileResponseField()
+    title = TranslatedCharField()
+    image = TranslatedFileField()
 
     class Meta:
         model = Recommendation
@@ -64,3 +72,20 @@ class RecommendationDetailSerializer(serializers.ModelSerializer):
             "created_at",
             "is_active"
         )
+
+
+class RecommendationListProjection(ListProjection):
+    field_sources = {
+        "id": ("id",),
+        "title": ("translated_title",),
+        "image": ("translated_image",),
+        "slug": ("slug",),
+        "created_at": ("created_at",),
+        "is_active": ("is_active",),
+    }
+
+    def get_image(self, row):
+        return build_file_url(row["translated_image"])
+
+    def get_created_at(self, row):
+        return row["created_at"].isoformat()
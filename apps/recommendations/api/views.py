@@ -5,7 +5,12 @@ from rest_framework.exceptions import NotFound
 
 from apps.recommendations.interface.api_schema import recommendation_list_schema, recommendation_retrieve_schema
 from apps.recommendations.interface.paginations import CustomRecommendationPagination
+from commons.interfaces.conditional import ConditionalGetMixin
+from commons.interfaces.projections import ProjectionListMixin
+from commons.interfaces.response_cache import CachedResponseMixin
+from commons.services.cache_versions import CATALOG, RECOMMENDATIONS
 from apps.recommendations.api.serializers import (
+    RecommendationListProjection,
     RecommendationListSerializer,
     RecommendationDetailSerializer,
 )
@@ -15,8 +20,13 @@ from apps.recommendations.infrastructure.selectors import (
 )
 
 
-class RecommendationViewSet(ReadOnlyModelViewSet):
+class RecommendationViewSet(
+    ConditionalGetMixin, CachedResponseMixin, ProjectionListMixin, ReadOnlyModelViewSet
+):
     pagination_class = CustomRecommendationPagination
+    list_projection_class = RecommendationListProjection
+    cache_version_groups = (RECOMMENDATIONS, CATALOG)
+    conditional_timestamp_field = None
     lookup_field = "slug"
     # permission_classes = [IsAuthenticated]
 
@@ -4,6 +4,7 @@ from django.utils.translation import gettext_lazy as _
 from parler.models import TranslatableModel, TranslatedFields
 
 from apps.books.infrastructure.models import Book
+from commons.models.translations import LanguageScopedManager
 
 
 class Recommendation(TranslatableModel):
@@ -29,6 +30,8 @@ class Recommendation(TranslatableModel):
     )
     is_active = models.BooleanField(default=True)
 
+    objects = LanguageScopedManager()
+
     class Meta:
         verbose_name = _("Recommendation")
         verbose_name_plural = _("Recommendations")
@@ -7,13 +7,7 @@ def get_active_recommendations():
     return (
         Recommendation.objects
         .filter(is_active=True)
-        .prefetch_related(
-            "translations",
-            Prefetch(
-                "recommendation_books",
-                queryset=RecommendationBook.objects.select_related("book").order_by("order")
-            )
-        )
+        .with_translated("title", "image")
         .order_by("-created_at")
     )
 
@@ -22,12 +16,13 @@ def get_active_recommendation_by_slug(*, slug: str):
     return (
         Recommendation.objects
         .filter(is_active=True, slug=slug)
+        .prefetch_translations()
         .prefetch_related(
-            "translations",
+            # Книги подборки — карточки из кеша по book_id (book_cards).
             Prefetch(
                 "recommendation_books",
-                queryset=RecommendationBook.objects.select_related("book").order_by("order")
-            )
+                queryset=RecommendationBook.objects.order_by("order")
+            ),
         )
         .order_by("-created_at")
     ).first()
@@ -1,7 +1,8 @@
-from django.db.models.signals import pre_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
-from apps.recommendations.infrastructure.models import Recommendation
+from apps.recommendations.infrastructure.models import Recommendation, RecommendationBook
+from commons.services.cache_versions import RECOMMENDATIONS, bump_cache_version_on_commit
 from commons.services.slug_generation import generate_slug
 from commons.signals.media import connect_media_cleanup
 
@@ -11,5 +12,12 @@ def recommendation_slug_signal(sender, instance, **kwargs):
     generate_slug(instance, sender, "title")
 
 
+@receiver([post_save, post_delete], sender=Recommendation)
+@receiver([post_save, post_delete], sender=Recommendation._parler_meta.root.model)
+@receiver([post_save, post_delete], sender=RecommendationBook)
+def recommendation_cache_version_signal(sender, **kwargs):
+    bump_cache_version_on_commit(RECOMMENDATIONS)
+
+
 for obj in [Recommendation]:
     connect_media_cleanup(obj)
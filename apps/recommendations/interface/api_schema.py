@@ -5,6 +5,9 @@ from drf_spectacular.utils import (
     OpenApiParameter,
 )
 
+from apps.recommendations.api.serializers import RecommendationListProjection
+from commons.interfaces.projections import sparse_fields_parameters
+
 
 response_401 = OpenApiResponse(
     description="Не авторизован. Передайте JWT-токен в заголовке Authorization: Bearer <token>.",
@@ -113,7 +116,7 @@ recommendation_list_schema = {
         "Каждый элемент содержит заголовок, slug и обложку — "
         "без вложенных книг (для карточек в ленте)."
     ),
-    "parameters": pagination_params,
+    "parameters": [*pagination_params, *sparse_fields_parameters(RecommendationListProjection)],
     "responses": {
         200: OpenApiResponse(
             description="Постраничный список рекомендаций.",
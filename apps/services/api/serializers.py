@@ -1,23 +1,20 @@
 from rest_framework import serializers
 
 from apps.services.infrastructure.models import ServiceGroup, Service
-from commons.interfaces.urlfile_path import FileResponseField
+from commons.interfaces.projections import ListProjection
+from commons.interfaces.translated_fields import (TranslatedCharField,
+                                                 TranslatedFileField)
+from commons.interfaces.urlfile_path import FileResponseField, build_file_url
 
 
 class ServiceListSerializer(serializers.ModelSerializer):
-    name = serializers.CharField()
-    description = serializers.SerializerMethodField()
-    image = FileResponseField()
+    name = TranslatedCharField()
+    image = TranslatedFileField()
 
     class Meta:
         model = Service
         fields = ("id", "slug", "name", "image", "order")
 
-    def get_description(self, obj):
-        if obj.description:
-            return obj.description[:100] + "..."
-        return ""
-
 
 class ServiceDetailSerializer(serializers.ModelSerializer):
     name = serializers.CharField()
@@ -37,18 +34,12 @@ class ServiceDetailSerializer(serializers.ModelSerializer):
 
 class ServiceGroupListSerializer(serializers.ModelSerializer):
     name = serializers.CharField()
-    description = serializers.SerializerMethodField()
     image = FileResponseField()
 
     class Meta:
         model = ServiceGroup
         fields = ("id", "slug", "name", "image", "order")
 
-    def get_description(self, obj):
-        if obj.description:
-            return obj.description[:100] + "..."
-        return ""
-
 
 class ServiceGroupDetailSerializer(serializers.ModelSerializer):
     name = serializers.CharField()
@@ -63,3 +54,16 @@ class ServiceGroupDetailSerializer(serializers.ModelSerializer):
             "id", "slug", "name", "description",
             "image", "order", "services",
         )
+
+
+class ServiceListProjection(ListProjection):
+    field_sources = {
+        "id": ("id",),
+        "slug": ("slug",),
+        "name": ("translated_name",),
+        "image": ("translated_image",),
+        "order": ("order",),
+    }
+
+    def get_image(self, row):
+        return build_file_url(row["translated_image"])
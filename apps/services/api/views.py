@@ -5,7 +5,12 @@ from rest_framework.viewsets import ReadOnlyModelViewSet
 from drf_spectacular.utils import extend_schema
 
 from apps.services.interface.paginations import CustomServicePagination
+from commons.interfaces.conditional import ConditionalGetMixin
+from commons.interfaces.projections import ProjectionListMixin
+from commons.interfaces.response_cache import CachedResponseMixin
+from commons.services.cache_versions import CATALOG
 from apps.services.api.serializers import (
+    ServiceListProjection,
     ServiceGroupListSerializer,
     ServiceGroupDetailSerializer,
     ServiceListSerializer,
@@ -27,8 +32,9 @@ from apps.services.infrastructure.selectors import (
 
 
 @extend_schema(tags=["Service Groups"])
-class ServiceGroupViewSet(ReadOnlyModelViewSet):
+class ServiceGroupViewSet(ConditionalGetMixin, CachedResponseMixin, ReadOnlyModelViewSet):
     pagination_class = CustomServicePagination
+    cache_version_groups = (CATALOG,)
     lookup_field = "slug"
     # permission_classes = [IsAuthenticated]
 
@@ -72,8 +78,12 @@ class ServiceGroupViewSet(ReadOnlyModelViewSet):
 
 
 @extend_schema(tags=["Services"])
-class ServiceViewSet(ReadOnlyModelViewSet):
+class ServiceViewSet(
+    ConditionalGetMixin, CachedResponseMixin, ProjectionListMixin, ReadOnlyModelViewSet
+):
     pagination_class = CustomServicePagination
+    list_projection_class = ServiceListProjection
+    cache_version_groups = (CATALOG,)
     lookup_field = "slug"
     # permission_classes = [IsAuthenticated]
 
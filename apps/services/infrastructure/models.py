@@ -4,6 +4,7 @@ from django.utils.translation import gettext_lazy as _
 from parler.models import TranslatableModel, TranslatedFields
 
 from commons.models.abstract_models import AbstractDateTimeModel
+from commons.models.translations import LanguageScopedManager
 
 
 class ServiceGroup(TranslatableModel, AbstractDateTimeModel):
@@ -21,6 +22,8 @@ class ServiceGroup(TranslatableModel, AbstractDateTimeModel):
     order = models.PositiveSmallIntegerField(default=0, help_text=_("Порядок расположения группы."))
     is_active = models.BooleanField(default=True)
 
+    objects = LanguageScopedManager()
+
     class Meta:
         verbose_name = _("Service Group")
         verbose_name_plural = _("Service Groups")
@@ -51,6 +54,8 @@ class Service(TranslatableModel, AbstractDateTimeModel):
     order = models.PositiveSmallIntegerField(default=0, help_text=_("Порядок расположения сервиса."))
     is_active = models.BooleanField(default=True)
 
+    objects = LanguageScopedManager()
+
     class Meta:
         verbose_name = _("Service")
         verbose_name_plural = _("Services")
@@ -6,17 +6,15 @@ def get_active_service_groups():
     active_services_qs = (
         Service.objects
         .filter(is_active=True)
-        .prefetch_related("translations")
+        .prefetch_translations()
         .order_by("order")
     )
 
     return (
         ServiceGroup.objects
         .filter(is_active=True)
-        .prefetch_related(
-            "translations",
-            Prefetch("services", queryset=active_services_qs),
-        )
+        .prefetch_translations()
+        .prefetch_related(Prefetch("services", queryset=active_services_qs))
         .order_by("order")
     )
 
@@ -25,17 +23,15 @@ def get_active_service_group_by_slug(*, slug: str):
     active_services_qs = (
         Service.objects
         .filter(is_active=True)
-        .prefetch_related("translations")
+        .prefetch_translations()
         .order_by("order")
     )
 
     return (
         ServiceGroup.objects
         .filter(is_active=True, slug=slug)
-        .prefetch_related(
-            "translations",
-            Prefetch("services", queryset=active_services_qs),
-        )
+        .prefetch_translations()
+        .prefetch_related(Prefetch("services", queryset=active_services_qs))
         .first()
     )
 
@@ -45,7 +41,7 @@ def get_active_services():
         Service.objects
         .filter(is_active=True)
         .select_related("group")
-        .prefetch_related("translations", "group__translations")
+        .with_translated("name", "image")
         .order_by("group__order", "order")
     )
 
@@ -54,6 +50,6 @@ def get_active_services_by_group_slug(*, slug: str):
     return (
         Service.objects
         .filter(is_active=True, group__slug=slug)
-        .prefetch_related("translations")
+        .prefetch_translations()
         .order_by("order")
     )
@@ -1,6 +1,9 @@
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiResponse, OpenApiExample, OpenApiParameter
 
+from apps.services.api.serializers import ServiceListProjection
+from commons.interfaces.projections import sparse_fields_parameters
+
 
 response_401 = OpenApiResponse(
     description="Не авторизован. Передайте JWT-токен в заголовке Authorization: Bearer <token>.",
@@ -163,7 +166,7 @@ service_group_services_schema = {
 service_list_schema = {
     "summary": "Список всех сервисов",
     "description": "Плоский постраничный список всех активных сервисов без группировки.",
-    "parameters": pagination_params,
+    "parameters": [*pagination_params, *sparse_fields_parameters(ServiceListProjection)],
     "responses": {
         200: OpenApiResponse(description="Список сервисов.", examples=[service_list_example]),
         401: response_401,
@@ -0,0 +1 @@
+from apps.sync.infrastructure.admin import CatalogChangeAdmin, CatalogSnapshotAdmin
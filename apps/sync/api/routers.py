@@ -0,0 +1,7 @@
+from rest_framework.routers import DefaultRouter
+
+from apps.sync.api.views import SyncViewSet
+
+router = DefaultRouter()
+
+router.register(r"", SyncViewSet, basename="sync")
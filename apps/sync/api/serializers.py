@@ -0,0 +1,68 @@
+from rest_framework import serializers
+
+from apps.books.api.serializers import BookCategorySerializer
+from apps.company.api.serializers import (AboutCompanySerializer,
+                                          CompanySerializer,
+                                          ContactDetailSerializer)
+from apps.gallery.api.serializers import GalleryListSerializer
+from apps.recommendations.api.serializers import RecommendationListSerializer
+from apps.services.api.serializers import ServiceGroupListSerializer
+from apps.sync.infrastructure.models import CatalogSnapshot
+from commons.interfaces.urlfile_path import FileResponseField
+
+
+class CatalogChangesQuerySerializer(serializers.Serializer):
+    since = serializers.IntegerField(min_value=0, required=False)
+    limit = serializers.IntegerField(min_value=1, max_value=10000, default=5000)
+
+
+class EntityChangesSerializer(serializers.Serializer):
+    upserted = serializers.ListField(child=serializers.IntegerField())
+    deleted = serializers.ListField(child=serializers.IntegerField())
+
+
+class CatalogChangesSerializer(serializers.Serializer):
+    token = serializers.IntegerField()
+    has_more = serializers.BooleanField()
+    full_sync_required = serializers.BooleanField(default=False)
+    changes = serializers.DictField(child=EntityChangesSerializer())
+
+
+class CatalogSnapshotSerializer(serializers.ModelSerializer):
+    language = serializers.CharField(source="language_code")
+    url = FileResponseField(source="file", is_absolute_url=True)
+
+    class Meta:
+        model = CatalogSnapshot
+        fields = ("language", "url", "sha256", "size", "token", "created_at")
+
+
+class BookCategoryPageSerializer(serializers.Serializer):
+    count = serializers.IntegerField()
+    results = BookCategorySerializer(many=True)
+
+
+class ServiceGroupPageSerializer(serializers.Serializer):
+    count = serializers.IntegerField()
+    results = ServiceGroupListSerializer(many=True)
+
+
+class GalleryPageSerializer(serializers.Serializer):
+    count = serializers.IntegerField()
+    results = GalleryListSerializer(many=True)
+
+
+class RecommendationPageSerializer(serializers.Serializer):
+    count = serializers.IntegerField()
+    results = RecommendationListSerializer(many=True)
+
+
+# Только для схемы: ответ собирается из закешированных фрагментов (apps.sync.interface.bootstrap).
+class BootstrapSerializer(serializers.Serializer):
+    company = CompanySerializer(allow_null=True)
+    about_company = AboutCompanySerializer(allow_null=True)
+    contacts = ContactDetailSerializer(allow_null=True)
+    book_categories = BookCategoryPageSerializer()
+    service_groups = ServiceGroupPageSerializer()
+    galleries = GalleryPageSerializer()
+    recommendations = RecommendationPageSerializer()
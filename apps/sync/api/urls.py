@@ -0,0 +1,9 @@
+from django.urls import include, path
+
+from apps.sync.api.routers import router
+from apps.sync.api.views import BootstrapAPIView
+
+urlpatterns = (
+    path("bootstrap/", BootstrapAPIView.as_view(), name="sync-bootstrap"),
+    path("", include(router.urls)),
+)
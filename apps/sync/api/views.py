@@ -0,0 +1,83 @@
+from django.utils.cache import patch_vary_headers
+from drf_spectacular.utils import extend_schema
+from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.sync.api.serializers import (CatalogChangesQuerySerializer,
+                                       CatalogChangesSerializer,
+                                       CatalogSnapshotSerializer)
+from apps.sync.infrastructure.selectors import (get_catalog_changes,
+                                                get_latest_snapshots,
+                                                get_latest_sync_token)
+from apps.sync.interface.api_schema import (bootstrap_schema,
+                                            catalog_changes_schema,
+                                            catalog_snapshot_schema)
+from apps.sync.interface.bootstrap import (BOOTSTRAP_VERSION_GROUPS,
+                                           get_bootstrap_payload,
+                                           get_fragment_keys)
+from commons.interfaces.conditional import ConditionalGetMixin
+
+
+class SyncViewSet(viewsets.ViewSet):
+    """
+    Endpoints:
+    - GET /sync/changes/?since=<token> - изменения каталога после токена
+    - GET /sync/snapshots/               - манифест офлайн-снимков каталога
+    """
+
+    @extend_schema(**catalog_changes_schema)
+    @action(detail=False, methods=["get"], url_path="changes")
+    def changes(self, request: Request) -> Response:
+        query = CatalogChangesQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        since = query.validated_data.get("since")
+
+        if since is None:
+            data = {
+                "token": get_latest_sync_token(),
+                "has_more": False,
+                "full_sync_required": True,
+                "changes": {},
+            }
+        else:
+            data = get_catalog_changes(since=since, limit=query.validated_data["limit"])
+
+        return Response(CatalogChangesSerializer(data).data)
+
+    @extend_schema(**catalog_snapshot_schema)
+    @action(detail=False, methods=["get"], url_path="snapshots")
+    def snapshots(self, request: Request) -> Response:
+        snapshots = get_latest_snapshots(language_code=request.query_params.get("language"))
+        serializer = CatalogSnapshotSerializer(snapshots, many=True, context={"request": request})
+
+        response = Response(serializer.data)
+        response["Cache-Control"] = "public, max-age=60"
+        return response
+
+
+class BootstrapAPIView(ConditionalGetMixin, APIView):
+    """
+    GET /sync/bootstrap/ - стартовые данные сайта (компания, контакты, первые страницы списков)
+    """
+
+    cache_version_groups = BOOTSTRAP_VERSION_GROUPS
+    conditional_timestamp_field = None
+    response_cache_vary = ("Authorization",)
+
+    def get_response_cache_variant(self) -> str:
+        return "adult" if getattr(self.request.user, "age", 0) >= 18 else "minor"
+
+    @extend_schema(**bootstrap_schema)
+    def get(self, request: Request) -> Response:
+        return self.conditional_response(self._bootstrap, request)
+
+    def _bootstrap(self, request: Request) -> Response:
+        user_age = getattr(request.user, "age", 0)
+        keys = get_fragment_keys(request, user_age)
+
+        response = Response(get_bootstrap_payload(request, user_age, keys))
+        patch_vary_headers(response, self.response_cache_vary)
+        return response
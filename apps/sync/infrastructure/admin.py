@@ -0,0 +1,28 @@
+from django.contrib import admin
+
+from apps.sync.infrastructure.models import CatalogChange, CatalogSnapshot
+
+
+@admin.register(CatalogChange)
+class CatalogChangeAdmin(admin.ModelAdmin):
+    list_display = ["id", "entity", "object_id", "action", "created_at"]
+    list_filter = ["entity", "action"]
+    search_fields = ["object_id"]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(CatalogSnapshot)
+class CatalogSnapshotAdmin(admin.ModelAdmin):
+    list_display = ["id", "language_code", "token", "size", "sha256", "created_at"]
+    list_filter = ["language_code"]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
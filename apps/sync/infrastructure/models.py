@@ -0,0 +1,62 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class CatalogChange(models.Model):
+    """
+    Журнал изменений каталога для delta-синхронизации клиентов.
+
+    id записи и есть sync token: клиент хранит последний полученный id
+    и запрашивает всё, что записано после него.
+    """
+
+    class Entity(models.TextChoices):
+        BOOKS = "books", _("Books")
+        CATEGORIES = "categories", _("Categories")
+        AUTHORS = "authors", _("Authors")
+        GALLERIES = "galleries", _("Galleries")
+        SERVICE_GROUPS = "service_groups", _("Service groups")
+        SERVICES = "services", _("Services")
+
+    class Action(models.TextChoices):
+        UPSERT = "upsert", _("Upsert")
+        DELETE = "delete", _("Delete")
+
+    id = models.BigAutoField(primary_key=True)
+    entity = models.CharField(max_length=20, choices=Entity.choices)
+    object_id = models.PositiveBigIntegerField()
+    action = models.CharField(max_length=10, choices=Action.choices)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("Catalog change")
+        verbose_name_plural = _("Catalog changes")
+        ordering = ("id",)
+
+    def __str__(self):
+        return f"#{self.pk} {self.action} {self.entity}:{self.object_id}"
+
+
+class CatalogSnapshot(models.Model):
+    """
+    Готовый сжатый снимок каталога на одном языке.
+
+    Файл лежит в MEDIA_ROOT под именем с sha256 содержимого — его можно
+    кешировать на CDN навсегда. token — последний CatalogChange на момент
+    сборки: после скачивания клиент продолжает delta-sync с него.
+    """
+
+    language_code = models.CharField(max_length=15, db_index=True)
+    token = models.PositiveBigIntegerField()
+    file = models.FileField(upload_to="snapshots/", max_length=255)
+    sha256 = models.CharField(max_length=64)
+    size = models.PositiveBigIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("Catalog snapshot")
+        verbose_name_plural = _("Catalog snapshots")
+        ordering = ("-id",)
+
+    def __str__(self):
+        return f"{self.language_code} @ {self.token}"
@@ -0,0 +1,88 @@
+from typing import Iterable
+
+from django.db import connection, transaction
+
+from apps.sync.infrastructure.models import CatalogChange
+from commons.services.cache_versions import CATALOG, bump_cache_version_on_commit
+
+# Ключ pg_advisory_xact_lock, которым сериализуются записи в журнал.
+JOURNAL_LOCK_KEY = 0x5C4A7A10
+
+
+class CatalogChangeRepository:
+    """
+    Запись в журнал изменений каталога.
+
+    Пишем в той же транзакции, что и само изменение: откат сохранения
+    откатывает и запись в журнале, клиенты не увидят фантомных id.
+    После коммита увеличивается версия кеша каталога — закешированные ответы API устаревают.
+
+    id записи — sync token, а id выдаются при вставке, не при коммите. Поэтому каждая
+    транзакция перед вставкой берёт lock_journal: пока она не закоммичена, никто не получит
+    id больше, и видимые id журнала всегда сплошной префикс — клиент с токеном N
+    не пропустит запись с меньшим id, закоммиченную позже.
+    """
+
+    @staticmethod
+    def lock_journal() -> None:
+        # Держится до конца транзакции; каталог меняют админка и импорт, очередь им не мешает.
+        if connection.vendor != "postgresql":
+            return
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_xact_lock(%s)", [JOURNAL_LOCK_KEY])
+
+    @staticmethod
+    @transaction.atomic(savepoint=False)
+    def record(*, entity: str, object_id: int, is_active: bool = True) -> None:
+        CatalogChangeRepository.lock_journal()
+        CatalogChange.objects.create(
+            entity=entity,
+            object_id=object_id,
+            action=CatalogChange.Action.UPSERT if is_active else CatalogChange.Action.DELETE,
+        )
+        bump_cache_version_on_commit(CATALOG)
+
+    @staticmethod
+    @transaction.atomic(savepoint=False)
+    def record_deleted(*, entity: str, object_id: int) -> None:
+        CatalogChangeRepository.lock_journal()
+        CatalogChange.objects.create(
+            entity=entity,
+            object_id=object_id,
+            action=CatalogChange.Action.DELETE,
+        )
+        bump_cache_version_on_commit(CATALOG)
+
+    @staticmethod
+    @transaction.atomic(savepoint=False)
+    def record_many(*, entity: str, object_ids: Iterable[int], action: str = CatalogChange.Action.UPSERT) -> None:
+        CatalogChangeRepository.lock_journal()
+        CatalogChange.objects.bulk_create(
+            [CatalogChange(entity=entity, object_id=object_id, action=action) for object_id in set(object_ids)]
+        )
+        bump_cache_version_on_commit(CATALOG)
+
+    @staticmethod
+    @transaction.atomic(savepoint=False)
+    def record_current_state(*, entity: str, model, object_ids: Iterable[int]) -> None:
+        """
+        Запись по текущему is_active объектов: upsert для активных, delete для скрытых и удалённых.
+
+        Для изменений, пришедших не с самого объекта (перевод, элемент галереи, связь книги):
+        иначе upsert после деактивации в том же сохранении вернул бы скрытый объект клиентам.
+        """
+        object_ids = set(object_ids)
+        if not object_ids:
+            return
+
+        active = dict(model._base_manager.filter(pk__in=object_ids).values_list("pk", "is_active"))
+        CatalogChangeRepository.lock_journal()
+        CatalogChange.objects.bulk_create([
+            CatalogChange(
+                entity=entity,
+                object_id=object_id,
+                action=CatalogChange.Action.UPSERT if active.get(object_id) else CatalogChange.Action.DELETE,
+            )
+            for object_id in sorted(object_ids)
+        ])
+        bump_cache_version_on_commit(CATALOG)
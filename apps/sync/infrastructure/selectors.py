@@ -0,0 +1,52 @@
+from typing import Any
+
+from django.db.models import Max, QuerySet
+
+from apps.sync.infrastructure.models import CatalogChange, CatalogSnapshot
+
+
+def get_latest_sync_token() -> int:
+    return CatalogChange.objects.aggregate(token=Max("id"))["token"] or 0
+
+
+def get_catalog_changes(*, since: int, limit: int) -> dict[str, Any]:
+    """
+    Собирает изменения каталога после токена since.
+
+    Несколько записей об одном объекте схлопываются — побеждает последняя,
+    так что клиент получает id либо в upserted, либо в deleted.
+    Если изменений больше limit, has_more=True и клиент продолжает с нового token.
+    """
+    changes = list(
+        CatalogChange.objects.filter(id__gt=since)
+        .order_by("id")
+        .values_list("id", "entity", "object_id", "action")[: limit + 1]
+    )
+
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+
+    latest: dict[tuple[str, int], str] = {}
+    for _, entity, object_id, action in changes:
+        latest[(entity, object_id)] = action
+
+    result = {entity: {"upserted": [], "deleted": []} for entity in CatalogChange.Entity.values}
+    for (entity, object_id), action in latest.items():
+        key = "upserted" if action == CatalogChange.Action.UPSERT else "deleted"
+        result[entity][key].append(object_id)
+
+    return {
+        "token": changes[-1][0] if changes else since,
+        "has_more": has_more,
+        "changes": result,
+    }
+
+
+def get_latest_snapshots(*, language_code: str | None = None) -> QuerySet:
+    """Последний снимок на каждый язык — один запрос через DISTINCT ON."""
+    qs = CatalogSnapshot.objects.order_by("language_code", "-id").distinct("language_code")
+
+    if language_code:
+        qs = qs.filter(language_code=language_code)
+
+    return qs
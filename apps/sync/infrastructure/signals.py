@@ -0,0 +1,117 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from apps.authors.infrastructure.models import Author
+from apps.books.infrastructure.models import Book, BookCategory
+from apps.gallery.infrastructure.models import Gallery, GalleryItem
+from apps.services.infrastructure.models import Service, ServiceGroup
+from apps.sync.infrastructure.models import CatalogChange
+from apps.sync.infrastructure.repositories import CatalogChangeRepository
+
+Entity = CatalogChange.Entity
+
+TRACKED_MODELS = {
+    Book: Entity.BOOKS,
+    BookCategory: Entity.CATEGORIES,
+    Author: Entity.AUTHORS,
+    Gallery: Entity.GALLERIES,
+    ServiceGroup: Entity.SERVICE_GROUPS,
+    Service: Entity.SERVICES,
+}
+
+
+def connect_change_tracking(model_cls, entity: str):
+    """
+    Пишет в журнал любые сохранения и удаления модели и её переводов.
+
+    is_active=False для клиента равносилен удалению — запись уходит как delete.
+    Переводы parler можно сохранить отдельно от мастер-объекта,
+    поэтому слушаем и translation-модель.
+    """
+
+    def on_save(sender, instance, raw=False, **kwargs):
+        if raw:
+            return
+        CatalogChangeRepository.record(
+            entity=entity,
+            object_id=instance.pk,
+            is_active=getattr(instance, "is_active", True),
+        )
+
+    def on_delete(sender, instance, **kwargs):
+        CatalogChangeRepository.record_deleted(entity=entity, object_id=instance.pk)
+
+    def on_translation_change(sender, instance, raw=False, **kwargs):
+        if raw:
+            return
+        CatalogChangeRepository.record_current_state(
+            entity=entity,
+            model=model_cls,
+            object_ids=[instance.master_id],
+        )
+
+    uid = f"catalog_change_{entity}"
+    post_save.connect(on_save, sender=model_cls, weak=False, dispatch_uid=uid)
+    post_delete.connect(on_delete, sender=model_cls, weak=False, dispatch_uid=uid)
+
+    translation_model = model_cls._parler_meta.root.model
+    post_save.connect(on_translation_change, sender=translation_model, weak=False, dispatch_uid=uid)
+    post_delete.connect(on_translation_change, sender=translation_model, weak=False, dispatch_uid=uid)
+
+
+for model, model_entity in TRACKED_MODELS.items():
+    connect_change_tracking(model, model_entity)
+
+
+def _gallery_item_changed(sender, instance: GalleryItem, raw=False, **kwargs):
+    """Элементы отдаются внутри галереи — их изменение = изменение галереи."""
+    if raw:
+        return
+    CatalogChangeRepository.record_current_state(
+        entity=Entity.GALLERIES,
+        model=Gallery,
+        object_ids=[instance.gallery_id],
+    )
+
+
+post_save.connect(_gallery_item_changed, sender=GalleryItem, dispatch_uid="catalog_change_gallery_item")
+post_delete.connect(_gallery_item_changed, sender=GalleryItem, dispatch_uid="catalog_change_gallery_item")
+
+
+def _book_relations_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Смена авторов/категорий книги меняет её карточку.
+
+    При reverse (category.books.clear()) затронутые книги известны только
+    до очистки, поэтому их id запоминаются на pre_clear.
+    """
+    if action == "pre_clear" and reverse:
+        instance._sync_cleared_book_ids = list(
+            sender.objects.filter(**{f"{_through_field_name(sender, instance)}_id": instance.pk})
+            .values_list("book_id", flat=True)
+        )
+        return
+
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if not reverse:
+        CatalogChangeRepository.record(entity=Entity.BOOKS, object_id=instance.pk, is_active=instance.is_active)
+        return
+
+    book_ids = pk_set if action != "post_clear" else getattr(instance, "_sync_cleared_book_ids", ())
+    CatalogChangeRepository.record_current_state(entity=Entity.BOOKS, model=Book, object_ids=book_ids or ())
+
+
+def _through_field_name(through, instance) -> str:
+    for field in through._meta.get_fields():
+        if getattr(field, "related_model", None) is type(instance):
+            return field.name
+    raise LookupError(f"{through} has no relation to {type(instance)}")
+
+
+for relation in (Book.category, Book.author):
+    m2m_changed.connect(
+        _book_relations_changed,
+        sender=relation.through,
+        dispatch_uid=f"catalog_change_{relation.through._meta.model_name}",
+    )
@@ -0,0 +1,212 @@
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Iterable
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db.models import F
+from parler.utils.i18n import get_active_language_choices
+
+from apps.authors.infrastructure.models import Author
+from apps.books.infrastructure.models import Book, BookCategory
+from apps.services.infrastructure.models import Service, ServiceGroup
+from apps.sync.infrastructure.models import CatalogSnapshot
+from commons.utils.iterables import chunked
+
+SNAPSHOT_DIR = "snapshots"
+BOOKS_CHUNK_SIZE = 2000
+
+
+def build_snapshot_payload(*, language_code: str, token: int) -> dict[str, Any]:
+    """
+    Собирает каталог на одном языке: книги (без 18+), авторов, категории с количеством книг и дерево услуг.
+
+    Книги ссылаются на авторов и категории по id — имена лежат один раз
+    в списках authors/categories, а не повторяются в каждой книге.
+    Переводы берутся пачками с fallback-языками parler, без N+1.
+    """
+    return {
+        "language": language_code,
+        "token": token,
+        "books": list(_iter_books(language_code)),
+        "authors": _get_authors(language_code),
+        "categories": _get_categories(language_code),
+        "service_groups": _get_service_groups(language_code),
+    }
+
+
+def write_snapshot(*, language_code: str, token: int, payload: dict[str, Any]) -> CatalogSnapshot:
+    """
+    Сжимает снимок и атомарно кладёт его в MEDIA_ROOT/snapshots/.
+
+    Зачем атомарно:
+    Файл сначала пишется во временный в той же папке и переименовывается
+    через os.replace — CDN и клиенты никогда не увидят недописанный gzip.
+    mtime=0 делает gzip детерминированным: одинаковый каталог даёт то же имя файла.
+    """
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+    content = gzip.compress(raw, mtime=0)
+    sha256 = hashlib.sha256(content).hexdigest()
+
+    name = f"{SNAPSHOT_DIR}/catalog-{language_code}-{sha256[:16]}.json.gz"
+    path = Path(settings.MEDIA_ROOT) / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if not path.exists():
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as tmp:
+            tmp.write(content)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.chmod(tmp.name, 0o644)
+        os.replace(tmp.name, path)
+
+    return CatalogSnapshot.objects.create(
+        language_code=language_code,
+        token=token,
+        file=name,
+        sha256=sha256,
+        size=len(content),
+    )
+
+
+def prune_snapshots(*, keep: int) -> int:
+    """Удаляет старые снимки, оставляя keep последних на каждый язык."""
+    removed = 0
+    languages = CatalogSnapshot.objects.values_list("language_code", flat=True).distinct()
+
+    for language_code in languages:
+        stale = list(CatalogSnapshot.objects.filter(language_code=language_code)[keep:])
+        if not stale:
+            continue
+
+        CatalogSnapshot.objects.filter(pk__in=[snapshot.pk for snapshot in stale]).delete()
+        still_used = set(
+            CatalogSnapshot.objects.filter(file__in=[snapshot.file.name for snapshot in stale])
+            .values_list("file", flat=True)
+        )
+        for snapshot in stale:
+            if snapshot.file.name not in still_used:
+                snapshot.file.delete(save=False)
+        removed += len(stale)
+
+    return removed
+
+
+def _translations(model, fields: tuple[str, ...], language_code: str, master_ids: Iterable[int] | None = None):
+    """
+    Возвращает {master_id: {field: value}} на языке language_code,
+    а при отсутствии перевода — на fallback-языке (как safe_translation_getter).
+    """
+    languages = get_active_language_choices(language_code)
+    priority = {lang: index for index, lang in enumerate(languages)}
+
+    qs = model._parler_meta.root.model.objects.filter(language_code__in=languages)
+    if master_ids is not None:
+        qs = qs.filter(master_id__in=master_ids)
+
+    result: dict[int, dict[str, Any]] = {}
+    ranks: dict[int, int] = {}
+    for master_id, lang, *values in qs.values_list("master_id", "language_code", *fields):
+        if master_id not in ranks or priority[lang] < ranks[master_id]:
+            ranks[master_id] = priority[lang]
+            result[master_id] = dict(zip(fields, values))
+
+    return result
+
+
+def _media_url(name: str | None) -> str | None:
+    return default_storage.url(name) if name else None
+
+
+def _related_ids(field, book_ids: list[int]) -> dict[int, list[int]]:
+    through = field.remote_field.through
+    source = field.m2m_field_name()
+    target = field.m2m_reverse_field_name()
+
+    result: dict[int, list[int]] = {}
+    for book_id, target_id in (
+        through.objects.filter(**{f"{source}_id__in": book_ids, f"{target}__is_active": True})
+        .values_list(f"{source}_id", f"{target}_id")
+    ):
+        result.setdefault(book_id, []).append(target_id)
+
+    return result
+
+
+def _iter_books(language_code: str):
+    rows = (
+        Book.objects.filter(is_active=True, is_adult=False)
+        .order_by("id")
+        .values("id", "slug", "price", "in_stock", "image")
+        .iterator(chunk_size=BOOKS_CHUNK_SIZE)
+    )
+
+    for batch in chunked(rows, BOOKS_CHUNK_SIZE):
+        book_ids = [row["id"] for row in batch]
+        names = _translations(Book, ("name",), language_code, book_ids)
+        authors = _related_ids(Book.author.field, book_ids)
+        categories = _related_ids(Book.category.field, book_ids)
+
+        for row in batch:
+            yield {
+                "id": row["id"],
+                "slug": row["slug"],
+                "name": names.get(row["id"], {}).get("name"),
+                "price": row["price"],
+                "in_stock": row["in_stock"],
+                "image": _media_url(row["image"]),
+                "authors": authors.get(row["id"], []),
+                "categories": categories.get(row["id"], []),
+            }
+
+
+def _get_authors(language_code: str) -> list[dict[str, Any]]:
+    names = _translations(Author, ("name",), language_code)
+    return [
+        {"id": row["id"], "slug": row["slug"], "name": names.get(row["id"], {}).get("name"),
+         "image": _media_url(row["image"])}
+        for row in Author.objects.filter(is_active=True).order_by("id").values("id", "slug", "image")
+    ]
+
+
+def _get_categories(language_code: str) -> list[dict[str, Any]]:
+    names = _translations(BookCategory, ("name",), language_code)
+    categories = (
+        BookCategory.objects.filter(is_active=True)
+        .annotate(books_count=F("active_books_count") - F("active_adult_books_count"))
+        .order_by("-created_at")
+        .values("id", "slug", "image", "books_count")
+    )
+    return [
+        {"id": row["id"], "slug": row["slug"], "name": names.get(row["id"], {}).get("name"),
+         "image": _media_url(row["image"]), "books_count": row["books_count"]}
+        for row in categories
+    ]
+
+
+def _get_service_groups(language_code: str) -> list[dict[str, Any]]:
+    group_translations = _translations(ServiceGroup, ("name", "image"), language_code)
+    service_translations = _translations(Service, ("name", "image"), language_code)
+
+    services_by_group: dict[int, list[dict[str, Any]]] = {}
+    for row in Service.objects.filter(is_active=True).order_by("order").values("id", "slug", "order", "group_id"):
+        translated = service_translations.get(row["id"], {})
+        services_by_group.setdefault(row["group_id"], []).append(
+            {"id": row["id"], "slug": row["slug"], "name": translated.get("name"),
+             "image": _media_url(translated.get("image")), "order": row["order"]}
+        )
+
+    groups = []
+    for row in ServiceGroup.objects.filter(is_active=True).order_by("order").values("id", "slug", "order"):
+        translated = group_translations.get(row["id"], {})
+        groups.append(
+            {"id": row["id"], "slug": row["slug"], "name": translated.get("name"),
+             "image": _media_url(translated.get("image")), "order": row["order"],
+             "services": services_by_group.get(row["id"], [])}
+        )
+
+    return groups
@@ -0,0 +1,49 @@
+import logging
+import time
+
+from celery import shared_task
+from django.conf import settings
+
+from apps.sync.infrastructure.models import CatalogSnapshot
+from apps.sync.infrastructure.selectors import get_latest_sync_token
+from apps.sync.infrastructure.snapshots import (build_snapshot_payload,
+                                                prune_snapshots,
+                                                write_snapshot)
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def build_catalog_snapshots(force: bool = False) -> dict[str, int]:
+    """
+    Periodic (Celery beat) сборка снимков каталога на всех языках.
+
+    Токен берётся ДО сборки: изменения, попавшие в каталог во время сборки,
+    клиент всё равно получит через delta-sync с этого токена.
+    Если журнал изменений не сдвинулся — снимок не пересобирается.
+    """
+    token = get_latest_sync_token()
+    built = {}
+
+    for language in settings.PARLER_LANGUAGES[None]:
+        language_code = language["code"]
+        latest = CatalogSnapshot.objects.filter(language_code=language_code).first()
+
+        if latest and latest.token == token and not force:
+            logger.info("Catalog snapshot %s is up to date (token %s)", language_code, token)
+            continue
+
+        started = time.monotonic()
+        payload = build_snapshot_payload(language_code=language_code, token=token)
+        snapshot = write_snapshot(language_code=language_code, token=token, payload=payload)
+        built[language_code] = snapshot.pk
+
+        logger.info(
+            "Catalog snapshot %s built: %s books, %s bytes, %.1fs",
+            language_code, len(payload["books"]), snapshot.size, time.monotonic() - started,
+        )
+
+    if built:
+        prune_snapshots(keep=settings.CATALOG_SNAPSHOT_KEEP)
+
+    return built
@@ -0,0 +1,90 @@
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiExample, OpenApiParameter, OpenApiResponse
+
+from apps.sync.api.serializers import (BootstrapSerializer,
+                                       CatalogChangesSerializer,
+                                       CatalogSnapshotSerializer)
+
+
+catalog_changes_schema = dict(
+    summary="Изменения каталога после sync token",
+    description=(
+        "Возвращает id созданных/изменённых (upserted) и удалённых или деактивированных (deleted) "
+        "книг, категорий, авторов, галерей и услуг после переданного токена. "
+        "Без since клиент получает текущий token и full_sync_required=true: "
+        "нужно один раз скачать каталог целиком и дальше синхронизироваться по token. "
+        "При has_more=true запрос повторяется с новым token."
+    ),
+    parameters=[
+        OpenApiParameter(
+            name="since",
+            type=OpenApiTypes.INT,
+            required=False,
+            description="Токен из предыдущего ответа.",
+        ),
+        OpenApiParameter(
+            name="limit",
+            type=OpenApiTypes.INT,
+            required=False,
+            description="Максимум записей журнала за один ответ (по умолчанию 5000).",
+        ),
+    ],
+    responses={
+        200: OpenApiResponse(
+            response=CatalogChangesSerializer,
+            examples=[
+                OpenApiExample(
+                    name="Изменения",
+                    value={
+                        "token": 1842,
+                        "has_more": False,
+                        "full_sync_required": False,
+                        "changes": {
+                            "books": {"upserted": [12, 57], "deleted": [3]},
+                            "categories": {"upserted": [], "deleted": []},
+                            "authors": {"upserted": [8], "deleted": []},
+                            "galleries": {"upserted": [], "deleted": []},
+                            "service_groups": {"upserted": [], "deleted": []},
+                            "services": {"upserted": [], "deleted": [4]},
+                        },
+                    },
+                ),
+            ],
+        ),
+        400: OpenApiResponse(description="Невалидный since или limit."),
+    },
+)
+
+
+catalog_snapshot_schema = dict(
+    summary="Манифест офлайн-снимков каталога",
+    description=(
+        "Последний gzip JSON снимок каталога на каждом языке: ссылка на файл, sha256, размер и token. "
+        "Файлы неизменяемые (хеш в имени) и кешируются на CDN. После загрузки снимка клиент "
+        "продолжает синхронизацию через /sync/changes/?since=<token>."
+    ),
+    parameters=[
+        OpenApiParameter(
+            name="language",
+            type=OpenApiTypes.STR,
+            required=False,
+            description="Вернуть снимок только для одного языка (tk, ru, en).",
+        ),
+    ],
+    responses={200: CatalogSnapshotSerializer(many=True)},
+)
+
+
+bootstrap_schema = dict(
+    summary="Стартовые данные сайта одним запросом",
+    description=(
+        "Компания, «о компании», контакты и первые страницы категорий книг, групп услуг, "
+        "галерей и рекомендаций — то, что фронтенд запрашивает при загрузке. "
+        "Списки отдаются как count + results первой страницы, дальше клиент листает обычные эндпоинты. "
+        "Поддерживает If-None-Match (304)."
+    ),
+    responses={
+        200: BootstrapSerializer,
+        304: OpenApiResponse(description="Данные не изменились."),
+    },
+)
@@ -0,0 +1,165 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.utils import translation
+
+from apps.books.api.serializers import BookCategoryProjection
+from apps.books.infrastructure.selectors import get_active_categories
+from apps.books.interface.paginations import CustomBooksPagination
+from apps.company.api.serializers import (AboutCompanySerializer,
+                                          CompanySerializer,
+                                          ContactDetailSerializer)
+from apps.company.infrastructure.selectors import (get_about_company_object,
+                                                   get_company_object,
+                                                   get_contact_object)
+from apps.gallery.api.serializers import GalleryListProjection
+from apps.gallery.infrastructure.selectors import get_active_galleries
+from apps.gallery.interface.paginations import CustomGalleryPagination
+from apps.recommendations.api.serializers import RecommendationListProjection
+from apps.recommendations.infrastructure.selectors import get_active_recommendations
+from apps.recommendations.interface.paginations import CustomRecommendationPagination
+from apps.services.api.serializers import ServiceGroupListSerializer
+from apps.services.infrastructure.selectors import get_active_service_groups
+from apps.services.interface.paginations import CustomServicePagination
+from commons.services.cache_versions import (CATALOG, COMPANY, RECOMMENDATIONS,
+                                             get_cache_versions)
+
+
+class Fragment:
+    """
+    Часть ответа bootstrap: группы версий, от которых она зависит, и как её собрать.
+
+    by_age — содержимое разное для младше/старше 18 (количество книг в категориях).
+    """
+
+    __slots__ = ("groups", "build", "by_age")
+
+    def __init__(self, groups: tuple[str, ...], build: Callable[[Any, int], Any], *, by_age: bool = False):
+        self.groups = groups
+        self.build = build
+        self.by_age = by_age
+
+
+def _first_page(count: int, results: list) -> dict[str, Any]:
+    # Первая страница списка без ссылок next/previous — дальше клиент листает обычный эндпоинт.
+    return {"count": count, "results": results}
+
+
+def _company(request, user_age: int):
+    obj = get_company_object()
+    return CompanySerializer(obj).data if obj else None
+
+
+def _about_company(request, user_age: int):
+    obj = get_about_company_object()
+    return AboutCompanySerializer(obj).data if obj else None
+
+
+def _contacts(request, user_age: int):
+    obj = get_contact_object()
+    return ContactDetailSerializer(obj).data if obj else None
+
+
+def _book_categories(request, user_age: int):
+    queryset = get_active_categories(user_age=user_age)
+    rows = BookCategoryProjection.project(queryset)[: CustomBooksPagination.page_size]
+    return _first_page(queryset.count(), BookCategoryProjection(rows, context={"request": request}).data)
+
+
+def _service_groups(request, user_age: int):
+    queryset = get_active_service_groups()
+    page = queryset[: CustomServicePagination.page_size]
+    return _first_page(queryset.count(), ServiceGroupListSerializer(page, many=True).data)
+
+
+def _galleries(request, user_age: int):
+    queryset = get_active_galleries()
+    rows = GalleryListProjection.project(queryset)[: CustomGalleryPagination.page_size]
+    return _first_page(queryset.count(), GalleryListProjection(rows, context={"request": request}).data)
+
+
+def _recommendations(request, user_age: int):
+    queryset = get_active_recommendations()
+    rows = RecommendationListProjection.project(queryset)[: CustomRecommendationPagination.page_size]
+    return _first_page(
+        queryset.count(), RecommendationListProjection(rows, context={"request": request}).data
+    )
+
+
+# Порядок ключей = порядок в ответе.
+FRAGMENTS: dict[str, Fragment] = {
+    "company": Fragment((COMPANY,), _company),
+    "about_company": Fragment((COMPANY,), _about_company),
+    "contacts": Fragment((COMPANY,), _contacts),
+    "book_categories": Fragment((CATALOG,), _book_categories, by_age=True),
+    "service_groups": Fragment((CATALOG,), _service_groups),
+    "galleries": Fragment((CATALOG,), _galleries),
+    "recommendations": Fragment((RECOMMENDATIONS, CATALOG), _recommendations),
+}
+
+BOOTSTRAP_VERSION_GROUPS = (CATALOG, RECOMMENDATIONS, COMPANY)
+
+
+def get_fragment_keys(request, user_age: int) -> dict[str, str]:
+    """
+    Ключи кеша фрагментов для языка, хоста и возраста запроса.
+
+    В ключ входят номера версий групп фрагмента: изменение компании
+    не сбрасывает категории и наоборот.
+    """
+    versions = dict(zip(BOOTSTRAP_VERSION_GROUPS, get_cache_versions(*BOOTSTRAP_VERSION_GROUPS)))
+    language = translation.get_language()
+    host = request.get_host()
+    age_group = "adult" if user_age >= 18 else "minor"
+
+    keys = {}
+    for name, fragment in FRAGMENTS.items():
+        stamps = ".".join(str(versions[group]) for group in fragment.groups)
+        variant = age_group if fragment.by_age else ""
+        keys[name] = f"bootstrap:{name}:{language}:{host}:{variant}:{stamps}"
+    return keys
+
+
+def get_bootstrap_payload(request, user_age: int, keys: dict[str, str]) -> dict[str, Any]:
+    """
+    Собирает bootstrap из фрагментов: все читаются одним cache.get_many,
+    недостающие считаются (параллельно, если их несколько) и кладутся одним set_many.
+    """
+    cached = cache.get_many(list(keys.values()))
+    payload = {name: cached[key] for name, key in keys.items() if key in cached}
+
+    missing = [name for name in keys if name not in payload]
+    if missing:
+        built = _build_fragments(request, user_age, missing)
+        cache.set_many({keys[name]: data for name, data in built.items()}, settings.RESPONSE_CACHE_TIMEOUT)
+        payload.update(built)
+
+    return {name: payload[name] for name in keys}
+
+
+def _build_fragments(request, user_age: int, names: list[str]) -> dict[str, Any]:
+    """
+    Фрагменты независимы, поэтому на холодном кеше запросы к БД идут параллельно
+    (не больше BOOTSTRAP_WORKERS потоков) — ответ ждёт самый долгий фрагмент, а не их сумму.
+    """
+    workers = min(settings.BOOTSTRAP_WORKERS, len(names))
+    if workers <= 1:
+        return {name: FRAGMENTS[name].build(request, user_age) for name in names}
+
+    language = translation.get_language()
+
+    def build(name: str):
+        try:
+            # Язык активируется на поток — переводы parler берутся для языка запроса.
+            with translation.override(language):
+                return FRAGMENTS[name].build(request, user_age)
+        finally:
+            # У каждого потока своё соединение с БД; закрываем, чтобы не оставлять висеть.
+            connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bootstrap") as executor:
+        futures = {name: executor.submit(build, name) for name in names}
+        return {name: future.result() for name, future in futures.items()}
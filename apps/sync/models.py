@@ -0,0 +1,3 @@
+from apps.sync.infrastructure.models import CatalogChange, CatalogSnapshot
+
+__all__ = ("CatalogChange", "CatalogSnapshot")
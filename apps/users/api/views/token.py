@@ -1,7 +1,17 @@
+import logging
+
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from rest_framework_simplejwt.views import TokenObtainPairView
 
+from apps.cart.infrastructure.guest_cart import delete_guest_token, get_guest_token
+from apps.cart.infrastructure.repositories import CartRepository
 from apps.users.api.serializers import CustomTokenObtainPairSerializer
 
+logger = logging.getLogger(__name__)
+
 
 class CustomTokenObtainPairView(TokenObtainPairView):
     """
@@ -10,6 +20,31 @@ class CustomTokenObtainPairView(TokenObtainPairView):
     Использует кастомный сериализатор для:
     - Проверки активации email
     - Добавления данных пользователя в ответ
+
+    После успешного входа гостевая корзина (cookie) сливается в корзину пользователя.
+    Слияние не должно мешать входу: при ошибке она пишется в лог, а cookie остаётся,
+    чтобы слить корзину при следующем входе.
     """
 
     serializer_class = CustomTokenObtainPairSerializer
+
+    def post(self, request: Request, *args, **kwargs) -> Response:
+        serializer = self.get_serializer(data=request.data)
+
+        try:
+            serializer.is_valid(raise_exception=True)
+        except TokenError as e:
+            raise InvalidToken(e.args[0]) from e
+
+        response = Response(serializer.validated_data, status=status.HTTP_200_OK)
+
+        guest_token = get_guest_token(request)
+        if guest_token:
+            try:
+                CartRepository.merge_guest_cart(serializer.user, guest_token)
+            except Exception:
+                logger.warning("Guest cart merge failed for user %s", serializer.user.pk, exc_info=True)
+            else:
+                delete_guest_token(response)
+
+        return response
@@ -0,0 +1,84 @@
+import hashlib
+from datetime import datetime
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+from django.utils.translation import get_language
+
+from commons.interfaces.response_cache import VersionedResponseMixin
+
+
+# Conditional GET: ETag/Last-Modified и 304 до запуска selectors и сериализаторов.
+# Комментарий, а не docstring: drf-spectacular взял бы его в описание эндпоинтов.
+#
+# Валидаторы дешёвые:
+# - для querysets — Max(updated_at) и Count одним агрегатом по тому же фильтру
+#   (аннотации переводов в агрегат не попадают);
+# - для синглтонов и моделей без updated_at — только номера версий групп.
+# Номера версий (cache_version_groups) входят в ETag всегда: они меняются и тогда,
+# когда updated_at не меняется (перевод, M2M авторов, имя автора в карточке книги, update()).
+# Поэтому у представлений с группами версий Last-Modified не отдаётся: Django проверяет
+# If-Modified-Since без If-None-Match, и клиент получил бы 304 на устаревшее содержимое.
+class ConditionalGetMixin(VersionedResponseMixin):
+    conditional_timestamp_field: str | None = "updated_at"
+
+    def get_conditional_queryset(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        if lookup_url_kwarg in self.kwargs:
+            queryset = queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        return queryset
+
+    def get_conditional_state(self) -> tuple[tuple, datetime | None]:
+        """Части ETag из БД и Last-Modified (только без групп версий)."""
+        if self.conditional_timestamp_field is None:
+            return (), None
+
+        state = self.get_conditional_queryset().aggregate(
+            last_modified=Max(self.conditional_timestamp_field),
+            total=Count("pk"),
+        )
+        last_modified = None if self.get_cache_version_groups() else state["last_modified"]
+        return (state["total"], state["last_modified"]), last_modified
+
+    def get_etag(self, request, state: tuple) -> str:
+        parts = (
+            request.get_full_path(),
+            get_language(),
+            request.accepted_media_type,
+            self.get_response_cache_variant(),
+            *self.get_cache_version_stamps(),
+            *state,
+        )
+        # Слабый ETag: одно и то же содержимое отдаётся как br, gzip или без сжатия.
+        return "W/" + quote_etag(hashlib.sha256("|".join(map(str, parts)).encode()).hexdigest()[:32])
+
+    def conditional_response(self, handler, request, *args, **kwargs):
+        state, last_modified = self.get_conditional_state()
+        etag = self.get_etag(request, state)
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is not None:
+            # 304 несёт те же валидаторы и Vary, что и полный ответ.
+            patch_vary_headers(response, (*self.response_cache_vary, "Accept-Encoding"))
+            self._set_validators(response, etag, timestamp)
+            return response
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            self._set_validators(response, etag, timestamp)
+        return response
+
+    @staticmethod
+    def _set_validators(response, etag: str, timestamp: int | None) -> None:
+        response.headers["ETag"] = etag
+        if timestamp is not None:
+            response.headers["Last-Modified"] = http_date(timestamp)
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(super().retrieve, request, *args, **kwargs)
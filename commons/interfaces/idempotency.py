@@ -0,0 +1,140 @@
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework import status
+from rest_framework.response import Response
+
+HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+
+PENDING = "pending"
+WAIT_INTERVAL = 0.1
+
+idempotency_key_parameter = OpenApiParameter(
+    name=HEADER,
+    type=OpenApiTypes.STR,
+    location=OpenApiParameter.HEADER,
+    required=False,
+    description=(
+        "Уникальный ключ попытки (например UUID). Повтор с тем же ключом "
+        "не выполняет действие заново, а возвращает первый ответ."
+    ),
+)
+
+
+# Заголовок Idempotency-Key для небезопасных action-ов.
+# Комментарий, а не docstring: drf-spectacular взял бы его в описание эндпоинтов.
+#
+# Зачем:
+# Мобильные клиенты повторяют POST по таймауту. Без ключа каждый повтор заново
+# выполняет действие (для покупки — блокировки книг и списание остатка).
+# С ключом первый успешный ответ хранится в кеше IDEMPOTENCY_TTL секунд:
+# - повтор получает сохранённый ответ (заголовок Idempotent-Replayed) без обращения к БД;
+# - параллельный дубль ждёт результат первого запроса до IDEMPOTENCY_WAIT_TIMEOUT секунд,
+#   затем получает 409;
+# - тот же ключ с другим телом запроса — 422.
+# Ключ действует в пределах пользователя и action-а. Ошибка (исключение) не сохраняется:
+# клиент может исправить причину и повторить с тем же ключом.
+class IdempotentMixin:
+    def get_idempotency_cache_key(self, request, key: str) -> str:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return f"idempotency:{self.basename}:{self.action}:{request.user.pk}:{digest}"
+
+    @staticmethod
+    def get_request_fingerprint(request) -> str:
+        body = json.dumps(request.data, sort_keys=True, default=str)
+        return hashlib.sha256(f"{request.method}|{request.path}|{body}".encode()).hexdigest()
+
+    def idempotent_response(self, handler, request, *args, **kwargs):
+        key = request.headers.get(HEADER)
+        if not key:
+            return handler(request, *args, **kwargs)
+        if len(key) > MAX_KEY_LENGTH:
+            return Response(
+                {"detail": f"{HEADER} must be at most {MAX_KEY_LENGTH} characters."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        cache_key = self.get_idempotency_cache_key(request, key)
+        fingerprint = self.get_request_fingerprint(request)
+
+        # Второй круг — если первый запрос упал и освободил ключ, пока мы ждали.
+        for _ in range(2):
+            if cache.add(cache_key, (PENDING, fingerprint), settings.IDEMPOTENCY_LOCK_TIMEOUT):
+                return self._run(handler, cache_key, fingerprint, request, *args, **kwargs)
+
+            record = self._wait_for_result(cache_key, fingerprint)
+            if record is not None:
+                return self._replay(record, fingerprint)
+
+        return self._in_progress()
+
+    @staticmethod
+    def _run(handler, cache_key: str, fingerprint: str, request, *args, **kwargs) -> Response:
+        try:
+            response = handler(request, *args, **kwargs)
+        except Exception:
+            cache.delete(cache_key)
+            raise
+
+        if response.status_code < 500:
+            cache.set(
+                cache_key,
+                (fingerprint, response.status_code, response.data),
+                settings.IDEMPOTENCY_TTL,
+            )
+        else:
+            cache.delete(cache_key)
+        return response
+
+    @staticmethod
+    def _wait_for_result(cache_key: str, fingerprint: str):
+        """Сохранённый результат; None — ключ освободился. Чужой или незавершённый запрос отдаётся как есть."""
+        deadline = time.monotonic() + settings.IDEMPOTENCY_WAIT_TIMEOUT
+        record = cache.get(cache_key)
+
+        while (
+            record is not None
+            and record[0] == PENDING
+            and record[1] == fingerprint
+            and time.monotonic() < deadline
+        ):
+            time.sleep(WAIT_INTERVAL)
+            record = cache.get(cache_key)
+
+        return record
+
+    @staticmethod
+    def _replay(record: tuple, fingerprint: str) -> Response:
+        if record[0] == PENDING:
+            if record[1] != fingerprint:
+                return IdempotentMixin._mismatch()
+            return IdempotentMixin._in_progress()
+
+        stored_fingerprint, status_code, data = record
+        if stored_fingerprint != fingerprint:
+            return IdempotentMixin._mismatch()
+
+        response = Response(data, status=status_code)
+        response.headers[REPLAYED_HEADER] = "true"
+        return response
+
+    @staticmethod
+    def _in_progress() -> Response:
+        return Response(
+            {"detail": f"A request with this {HEADER} is still in progress."},
+            status=status.HTTP_409_CONFLICT,
+        )
+
+    @staticmethod
+    def _mismatch() -> Response:
+        return Response(
+            {"detail": f"{HEADER} was already used with a different request."},
+            status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
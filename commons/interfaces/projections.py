@@ -0,0 +1,183 @@
+from operator import itemgetter
+from typing import Any, Callable, Iterable
+
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from commons.interfaces.urlfile_path import build_file_url
+
+
+def model_file_url(model, field: str, name: str | None) -> str | None:
+    """URL файла из values()-строки — так же, как FileResponseField для FieldFile."""
+    if not name:
+        return None
+    return build_file_url(model._meta.get_field(field).storage.url(name))
+
+
+def model_absolute_file_url(model, field: str, name: str | None, request=None) -> str | None:
+    """URL файла из values()-строки — так же, как стандартный ImageField/FileField DRF."""
+    if not name:
+        return None
+    url = model._meta.get_field(field).storage.url(name)
+    return request.build_absolute_uri(url) if request is not None else url
+
+
+def _split_param(value: str | None) -> list[str]:
+    return [name.strip() for name in (value or "").split(",") if name.strip()]
+
+
+class ListProjection:
+    """
+    Лёгкая альтернатива ModelSerializer для read-only списков.
+
+    Зачем:
+    ModelSerializer на каждую строку создаёт экземпляр модели, обходит
+    десятки Field-объектов и вызывает get_attribute/to_representation.
+    Проекция берёт плоские values()-словари (аннотации with_translated
+    уже посчитаны в SQL) и собирает тот же JSON одним проходом.
+
+    Подкласс задаёт field_sources — поле ответа -> values()-колонки, из которых оно
+    собирается (порядок ключей = порядок полей в JSON). Поле с одной колонкой берётся
+    как есть, для остальных объявляется get_<field>(row), как у SerializerMethodField.
+    expandable_fields — дополнительные поля, которые отдаются только по ?expand=.
+
+    Без fields JSON обязан совпадать с парным ModelSerializer —
+    это проверяет команда benchmark_list_serializers.
+    """
+
+    __slots__ = ("rows", "context", "fields")
+
+    field_sources: dict[str, tuple[str, ...]] = {}
+    expandable_fields: dict[str, tuple[str, ...]] = {}
+
+    def __init__(
+        self,
+        rows: Iterable[dict[str, Any]],
+        *,
+        context: dict[str, Any] | None = None,
+        fields: Iterable[str] | None = None,
+    ):
+        self.rows = rows
+        self.context = context or {}
+        self.fields = tuple(fields) if fields is not None else tuple(self.field_sources)
+
+    @classmethod
+    def select_fields(cls, fields: str | None = None, expand: str | None = None) -> tuple[str, ...]:
+        """
+        Поля ответа по query-параметрам ?fields=id,name&expand=in_stock.
+
+        Без fields — все поля по умолчанию. Неизвестные имена — ValidationError (400).
+        """
+        requested = _split_param(fields)
+        expanded = _split_param(expand)
+
+        errors = {}
+        unknown = [name for name in requested if name not in cls.field_sources and name not in cls.expandable_fields]
+        if unknown:
+            errors["fields"] = f"Unknown fields: {', '.join(unknown)}."
+        unknown = [name for name in expanded if name not in cls.expandable_fields]
+        if unknown:
+            errors["expand"] = f"Unknown fields: {', '.join(unknown)}."
+        if errors:
+            raise ValidationError(errors)
+
+        selected = requested or list(cls.field_sources)
+        return tuple(dict.fromkeys([*selected, *expanded]))
+
+    @classmethod
+    def columns(cls, fields: Iterable[str] | None = None) -> tuple[str, ...]:
+        """values()-колонки, нужные выбранным полям."""
+        sources = {**cls.field_sources, **cls.expandable_fields}
+        names = fields if fields is not None else cls.field_sources
+        return tuple(dict.fromkeys(column for name in names for column in sources[name]))
+
+    @classmethod
+    def project(cls, queryset, fields: Iterable[str] | None = None):
+        return queryset.values(*cls.columns(fields))
+
+    def _getters(self) -> list[tuple[str, Callable[[dict[str, Any]], Any]]]:
+        sources = {**self.field_sources, **self.expandable_fields}
+        getters = []
+        for name in self.fields:
+            getter = getattr(self, f"get_{name}", None)
+            if getter is None:
+                getter = itemgetter(sources[name][0])
+            getters.append((name, getter))
+        return getters
+
+    @property
+    def data(self) -> list[dict[str, Any]]:
+        getters = self._getters()
+        return [{name: getter(row) for name, getter in getters} for row in self.rows]
+
+
+def sparse_fields_parameters(projection_class: type[ListProjection]) -> list[OpenApiParameter]:
+    """OpenAPI-описание ?fields= и ?expand= для list-эндпоинта с проекцией."""
+    parameters = [
+        OpenApiParameter(
+            name="fields",
+            location=OpenApiParameter.QUERY,
+            required=False,
+            type=OpenApiTypes.STR,
+            description=(
+                "Поля ответа через запятую (по умолчанию все). Ненужные колонки и переводы "
+                f"не выбираются из БД. Доступно: {', '.join(projection_class.field_sources)}."
+            ),
+        ),
+    ]
+    if projection_class.expandable_fields:
+        parameters.append(
+            OpenApiParameter(
+                name="expand",
+                location=OpenApiParameter.QUERY,
+                required=False,
+                type=OpenApiTypes.STR,
+                description=(
+                    "Дополнительные поля через запятую: "
+                    f"{', '.join(projection_class.expandable_fields)}."
+                ),
+            )
+        )
+    return parameters
+
+
+# Подменяет list() ViewSet-а на values() + ListProjection.
+# Комментарий, а не docstring: drf-spectacular взял бы его в описание list-эндпоинтов.
+# get_serializer_class() не трогаем — схема по-прежнему строится из ModelSerializer
+# с тем же форматом ответа.
+class ProjectionListMixin:
+    list_projection_class: type[ListProjection] | None = None
+
+    def get_list_projection_class(self) -> type[ListProjection] | None:
+        return self.list_projection_class
+
+    def get_list_fields(self, projection_class: type[ListProjection] | None = None) -> tuple[str, ...]:
+        """Поля ответа по ?fields=/?expand=."""
+        projection_class = projection_class or self.get_list_projection_class()
+        params = self.request.query_params
+        return projection_class.select_fields(params.get("fields"), params.get("expand"))
+
+    def get_list_columns(self, projection_class: type[ListProjection] | None = None) -> tuple[str, ...]:
+        """values()-колонки для выбранных полей — selectors добавляют только нужные аннотации."""
+        projection_class = projection_class or self.get_list_projection_class()
+        return projection_class.columns(self.get_list_fields(projection_class))
+
+    def paginated_projection(self, queryset, projection_class: type[ListProjection] | None = None):
+        projection_class = projection_class or self.get_list_projection_class()
+        fields = self.get_list_fields(projection_class)
+        context = self.get_serializer_context()
+
+        queryset = projection_class.project(queryset, fields)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(projection_class(page, context=context, fields=fields).data)
+
+        return Response(projection_class(queryset, context=context, fields=fields).data)
+
+    def list(self, request, *args, **kwargs):
+        if self.get_list_projection_class() is None:
+            return super().list(request, *args, **kwargs)
+
+        return self.paginated_projection(self.filter_queryset(self.get_queryset()))
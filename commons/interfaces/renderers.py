@@ -0,0 +1,109 @@
+import math
+from decimal import Decimal
+
+import msgpack
+import orjson
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def _has_non_finite_float(data) -> bool:
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer на orjson: тот же media type и байт-в-байт тот же ответ.
+
+    Зачем:
+    На больших страницах (корзина с вложенными книгами, 100 книг в списке)
+    stdlib json заметная часть CPU запроса. orjson кодирует dict/list/str/int
+    в C, а всё остальное (Decimal, datetime, ленивые переводы gettext_lazy, UUID)
+    отдаёт в default стандартного JSONEncoder DRF — поэтому формат дат ("Z" для UTC),
+    Decimal -> float и строки переводов совпадают с JSONRenderer.
+
+    Отступы (?format=json; indent=4, Browsable API) и нестандартные настройки
+    UNICODE_JSON/COMPACT_JSON обслуживает обычный JSONRenderer.
+
+    Расхождение с JSONRenderer — запись float: orjson может записать то же число
+    иначе (1e-7 вместо 1e-07, 0.000025 вместо 2.5e-05, в части версий 1e20 вместо 1e+20).
+    Значение при этом то же. Совпадение остальных байтов проверяет команда benchmark_renderers.
+
+    NaN и Infinity orjson молча пишет как null. Такой ответ отдаётся обычному
+    JSONRenderer, и тот, как и раньше, бросает ошибку (STRICT_JSON) — невалидные данные
+    не превращаются в null незаметно.
+    """
+
+    json_default = staticmethod(JSONEncoder().default)
+
+    @classmethod
+    def default(cls, obj):
+        # Decimal("NaN") стал бы float nan и тоже null — пусть его обработает JSONRenderer.
+        if isinstance(obj, Decimal) and not obj.is_finite():
+            raise TypeError(f"Non-finite value {obj} is not JSON compliant")
+        return cls.json_default(obj)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        if (
+            self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=self.default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # Целые больше 64 бит и т.п. — пусть stdlib json отдаст результат или свою ошибку.
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Без null в ответе NaN/Infinity быть не может — обход данных только в этом случае.
+        if b"null" in ret and _has_non_finite_float(data):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Как и JSONRenderer, экранируем U+2028/U+2029 — ответ остаётся валидным JavaScript.
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+        return ret
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    Ответ в MessagePack (Accept: application/msgpack) — для мобильных клиентов.
+
+    Зачем:
+    На плохой связи клиенту важны размер ответа и скорость разбора: msgpack
+    компактнее JSON (целые и bool — 1 байт, без кавычек и экранирования),
+    а эндпоинты при этом не меняются — формат выбирается content negotiation.
+
+    Типы приводятся так же, как в JSON: Decimal -> float, datetime -> ISO-строка
+    ("Z" для UTC), ленивые переводы -> str (default стандартного JSONEncoder DRF).
+    """
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    default = staticmethod(JSONEncoder().default)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=self.default, use_bin_type=True, datetime=False)
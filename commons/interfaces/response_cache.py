@@ -0,0 +1,119 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.translation import get_language
+from rest_framework.response import Response
+
+from commons.services.cache_versions import get_cache_versions
+from commons.services.compression import (ENCODINGS, choose_encoding, compress,
+                                          decompress, is_compressible,
+                                          min_compress_size)
+
+IDENTITY = "identity"
+
+
+# Общее для кеширующих ViewSet-ов: группы версий, вариант ответа и Vary.
+# cache_version_groups — группы из commons.services.cache_versions, от данных которых
+# зависит ответ (get_cache_version_groups — если они зависят от action или запроса).
+# Номера версий читаются из кеша один раз за запрос.
+class VersionedResponseMixin:
+    cache_version_groups: tuple[str, ...] = ()
+    response_cache_vary: tuple[str, ...] = ()
+
+    def get_response_cache_variant(self) -> str:
+        """Часть ключа, зависящая от пользователя (например возрастная группа). По умолчанию — нет."""
+        return ""
+
+    def get_cache_version_groups(self) -> tuple[str, ...]:
+        return self.cache_version_groups
+
+    def get_cache_version_stamps(self) -> tuple[int, ...]:
+        if not hasattr(self, "_cache_version_stamps"):
+            self._cache_version_stamps = get_cache_versions(*self.get_cache_version_groups())
+        return self._cache_version_stamps
+
+
+# Кеширует list/retrieve целиком — уже отрендеренные и сжатые байты.
+# Комментарий, а не docstring: drf-spectacular взял бы его в описание эндпоинтов.
+#
+# Зачем:
+# Ответ каталога одинаков для всех клиентов с тем же URL, языком и форматом.
+# В кеш кладутся сразу br- и gzip-версии тела: попадание не запускает ни selectors,
+# ни сериализацию, ни сжатие — отдаются готовые байты под Accept-Encoding клиента.
+#
+# Инвалидация — номерами версий групп (commons.services.cache_versions):
+# изменение данных группы увеличивает номер, старые ключи перестают находиться.
+# Аутентификация, права и throttling выполняются как обычно (initial() до обработчика).
+class CachedResponseMixin(VersionedResponseMixin):
+    def get_response_cache_key(self, request) -> str:
+        parts = (
+            request.build_absolute_uri(),
+            get_language(),
+            request.accepted_media_type,
+            self.get_response_cache_variant(),
+            *self.get_cache_version_stamps(),
+        )
+        digest = hashlib.sha256("|".join(map(str, parts)).encode()).hexdigest()
+        return f"response:{self.basename}:{self.action}:{digest}"
+
+    def cached_response(self, handler, request, *args, **kwargs):
+        key = self.get_response_cache_key(request)
+
+        entry = cache.get(key)
+        if entry is not None:
+            response = HttpResponse(content_type=entry["content_type"])
+            self._apply_cached_body(request, response, entry)
+            return response
+
+        response = handler(request, *args, **kwargs)
+        if isinstance(response, Response) and response.status_code == 200:
+            response.add_post_render_callback(
+                lambda rendered: self._store_rendered(request, rendered, key)
+            )
+        patch_vary_headers(response, self.response_cache_vary)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
+
+    def _store_rendered(self, request, response, key: str) -> None:
+        content = response.content
+        content_type = response["Content-Type"]
+
+        if is_compressible(content_type) and len(content) >= min_compress_size():
+            body = {encoding: compress(content, encoding) for encoding in ENCODINGS}
+        else:
+            body = {IDENTITY: content}
+
+        entry = {"content_type": content_type, "body": body}
+        cache.set(key, entry, settings.RESPONSE_CACHE_TIMEOUT)
+        self._apply_cached_body(request, response, entry)
+
+    def _apply_cached_body(self, request, response, entry) -> None:
+        """
+        Тело ответа — сразу в подходящей клиенту кодировке.
+
+        Content-Encoding выставлен, поэтому CompressionMiddleware ответ не трогает —
+        Vary: Accept-Encoding ставим здесь сами.
+        """
+        body = entry["body"]
+        patch_vary_headers(response, self.response_cache_vary)
+
+        if IDENTITY in body:
+            response.content = body[IDENTITY]
+            return
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = choose_encoding(request.headers.get("Accept-Encoding", ""))
+        if encoding is None:
+            response.content = decompress(body["gzip"], "gzip")
+            return
+
+        response.content = body[encoding]
+        response.headers["Content-Encoding"] = encoding
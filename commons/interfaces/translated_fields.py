@@ -0,0 +1,58 @@
+from rest_framework import serializers
+
+from commons.interfaces.urlfile_path import FileResponseField
+
+
+def translated_value(instance, field: str):
+    """Значение переводимого поля: из аннотации translated_<field>, иначе через parler."""
+    annotated = f"translated_{field}"
+    if annotated in instance.__dict__:
+        return instance.__dict__[annotated]
+    return instance.safe_translation_getter(field, any_language=True)
+
+
+class TranslatedAnnotationMixin:
+    """
+    Читает переведённое значение из аннотации translated_<source>
+    (LanguageScopedQuerySet.with_translated), а если её нет — через parler.
+
+    Так один сериализатор работает и для «плоских» списков, и для объектов
+    из prefetch (корзина, избранное, вложенные сериализаторы).
+    """
+
+    def get_attribute(self, instance):
+        return translated_value(instance, self.source)
+
+
+class TranslatedCharField(TranslatedAnnotationMixin, serializers.CharField):
+    pass
+
+
+class TranslatedFileField(TranslatedAnnotationMixin, FileResponseField):
+    pass
+
+
+class TranslatedRelatedNamesField(serializers.ListField):
+    """
+    Список переводов поля связанных объектов (имена авторов/категорий книги).
+
+    Читает аннотацию translated_<relation>_<field> (with_translated_related),
+    иначе — из prefetch связи.
+    """
+
+    child = serializers.CharField(allow_null=True)
+
+    def __init__(self, *, relation: str, field: str = "name", **kwargs):
+        self.relation = relation
+        self.translated_field = field
+        kwargs.setdefault("read_only", True)
+        super().__init__(**kwargs)
+
+    def get_attribute(self, instance):
+        annotated = f"translated_{self.relation}_{self.translated_field}"
+        if annotated in instance.__dict__:
+            return instance.__dict__[annotated] or []
+        return [
+            related.safe_translation_getter(self.translated_field, any_language=True)
+            for related in getattr(instance, self.relation).all()
+        ]
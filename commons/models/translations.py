@@ -0,0 +1,166 @@
+from typing import Iterable
+
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db.models import Case, Model, OuterRef, Prefetch, Subquery, When
+from django.db.models.query import ModelIterable
+from parler.cache import MISSING
+from parler.managers import TranslatableManager, TranslatableQuerySet
+from parler.models import TranslatableModel
+from parler.utils.i18n import get_active_language_choices
+
+
+def translation_languages(language_code: str | None = None) -> tuple[str, ...]:
+    """
+    Языки, которые реально нужны запросу: активный + fallback из PARLER_LANGUAGES.
+
+    Для "ru" это ("ru", "tk"), для "tk" — ("tk",).
+    """
+    return tuple(get_active_language_choices(language_code))
+
+
+def translations_prefetch(
+    model: type[TranslatableModel],
+    lookup: str | None = None,
+    language_code: str | None = None,
+) -> Prefetch:
+    """
+    Prefetch переводов только на нужных языках.
+
+    lookup — путь до переводов, если модель связана (например "book__translations").
+    """
+    meta = model._parler_meta.root
+    return Prefetch(
+        lookup or meta.rel_name,
+        queryset=meta.model.objects.filter(language_code__in=translation_languages(language_code)),
+    )
+
+
+def fill_translations_cache(instances: Iterable[Model]) -> None:
+    """
+    Переносит prefetch переводов в локальный кеш parler (_translations_cache).
+
+    Зачем:
+    Без этого parler на каждое обращение к полю пишет перевод в кеш (Redis),
+    а для отсутствующего языка ещё и маркер fallback. Здесь же отсутствующие языки
+    сразу помечаются MISSING — safe_translation_getter и fallback работают
+    из памяти, без запросов и без походов в кеш.
+
+    Обходит вложенные prefetch и select_related объекты (авторы книги, группа услуги).
+    """
+    languages_by_code: dict[str, tuple[str, ...]] = {}
+    seen: set[int] = set()
+    stack = list(instances)
+
+    while stack:
+        obj = stack.pop()
+        if not isinstance(obj, Model) or id(obj) in seen:
+            continue
+        seen.add(id(obj))
+
+        prefetched = getattr(obj, "_prefetched_objects_cache", None) or {}
+        translation_names = set()
+
+        if isinstance(obj, TranslatableModel):
+            current = obj.get_current_language()
+            if current not in languages_by_code:
+                languages_by_code[current] = translation_languages(current)
+
+            for meta in obj._parler_meta:
+                translations = prefetched.get(meta.rel_name)
+                if translations is None:
+                    continue
+
+                translation_names.add(meta.rel_name)
+                local_cache = obj._translations_cache[meta.model]
+                for translation in translations:
+                    local_cache[translation.language_code] = translation
+                for language in languages_by_code[current]:
+                    local_cache.setdefault(language, MISSING)
+
+        for name, related in prefetched.items():
+            if name not in translation_names:
+                stack.extend(getattr(related, "_result_cache", None) or related)
+
+        stack.extend(value for value in obj._state.fields_cache.values() if value is not None)
+
+
+class LanguageScopedQuerySet(TranslatableQuerySet):
+    """
+    TranslatableQuerySet, который грузит переводы только на активном языке и его fallback.
+
+    Использование в selectors:
+        Book.objects.filter(...).prefetch_translations()
+        Prefetch("author", queryset=Author.objects.prefetch_translations())
+
+    После выборки переводы (в том числе вложенные) раскладываются
+    в кеш parler через fill_translations_cache.
+    """
+
+    def prefetch_translations(self, language_code: str | None = None):
+        return self.prefetch_related(translations_prefetch(self.model, language_code=language_code))
+
+    def with_translated(self, *fields: str, language_code: str | None = None):
+        """
+        Аннотирует translated_<field> прямо в SQL: поля перевода на активном языке или fallback.
+
+        Зачем:
+        Списку не нужны объекты переводов — значения приходят колонками того же
+        запроса, без prefetch и без safe_translation_getter на каждую строку.
+
+        Строка перевода выбирается один раз (по порядку языков), и все поля читаются
+        из неё — как в parler: ru-перевод с пустым description не подмешает tk-описание.
+        """
+        translation_model = self.model._parler_meta.root.model
+        languages = translation_languages(language_code)
+
+        translations = translation_model.objects.filter(master_id=OuterRef("pk"), language_code__in=languages)
+        if len(languages) > 1:
+            translations = translations.order_by(
+                Case(*[When(language_code=language, then=index) for index, language in enumerate(languages)])
+            )
+        queryset = self.alias(_translation_id=Subquery(translations.values("pk")[:1]))
+
+        annotations = {
+            f"translated_{field}": Subquery(
+                translation_model.objects.filter(pk=OuterRef("_translation_id")).values(field)[:1]
+            )
+            for field in fields
+        }
+        return queryset.annotate(**annotations)
+
+    def with_translated_related(self, relation: str, *fields: str, language_code: str | None = None):
+        """
+        Аннотирует translated_<relation>_<field> — массив переводов связанных объектов
+        (например имена авторов книги) через ARRAY(subquery), без prefetch связи.
+        """
+        model_field = self.model._meta.get_field(relation)
+        related_manager = model_field.related_model._default_manager
+        lookup = model_field.related_query_name()
+
+        annotations = {}
+        for field in fields:
+            names = (
+                related_manager.filter(**{lookup: OuterRef("pk")})
+                .with_translated(field, language_code=language_code)
+                .order_by("pk")
+                .values(f"translated_{field}")
+            )
+            annotations[f"translated_{relation}_{field}"] = ArraySubquery(names)
+
+        return self.annotate(**annotations)
+
+    def _fetch_all(self):
+        first_fetch = self._result_cache is None or not self._prefetch_done
+        super()._fetch_all()
+
+        if (
+            first_fetch
+            and self._prefetch_related_lookups
+            and self._iterable_class is ModelIterable
+            and self._result_cache
+        ):
+            fill_translations_cache(self._result_cache)
+
+
+class LanguageScopedManager(TranslatableManager.from_queryset(LanguageScopedQuerySet)):
+    pass
@@ -0,0 +1,178 @@
+import logging
+import os
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from commons.services.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Группы версий: любое изменение данных группы увеличивает её номер,
+# и все закешированные ответы, в ключ которых входит номер, перестают находиться.
+CATALOG = "catalog"
+# Остаток книг меняется с каждой покупкой — отдельная группа, чтобы оформление заказа
+# сбрасывало только ответы с in_stock, а не весь кеш каталога.
+STOCK = "stock"
+RECOMMENDATIONS = "recommendations"
+COMPANY = "company"
+
+KEY_TEMPLATE = "cache-version:{}"
+CHANNEL = "cache-version"
+
+RECONNECT_DELAY = 5
+
+
+def _key(group: str) -> str:
+    return KEY_TEMPLATE.format(group)
+
+
+def _initial_version() -> int:
+    # Если ключ версии вытеснен из Redis, новая версия не должна совпасть со старой.
+    return int(time.time() * 1000)
+
+
+class VersionListener:
+    """
+    Номера версий в памяти процесса, которые обновляет подписка Redis pub/sub.
+
+    Зачем:
+    Без него каждый запрос кеширующего эндпоинта начинается с GET номеров версий из Redis.
+    bump_cache_version публикует новый номер в канал, поток-подписчик каждого процесса
+    записывает его сюда — в устойчивом состоянии номера читаются из памяти без сети.
+
+    Номерам доверяем, только пока подписка жива, и не дольше CACHE_VERSION_LOCAL_TTL:
+    сообщение, потерянное при переподключении, устаревает само.
+    После подписки (и каждого переподключения) номера сбрасываются и перечитываются из Redis.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._versions: dict[str, tuple[int, float]] = {}
+        self._subscribed = threading.Event()
+        self._pid = None
+
+    def get(self, group: str) -> int | None:
+        self._ensure_started()
+        if not self._subscribed.is_set():
+            return None
+
+        entry = self._versions.get(group)
+        if entry is None or time.monotonic() - entry[1] > settings.CACHE_VERSION_LOCAL_TTL:
+            return None
+        return entry[0]
+
+    def set(self, group: str, version: int) -> None:
+        if not self._subscribed.is_set():
+            return
+        with self._lock:
+            current = self._versions.get(group)
+            # Номера только растут; опоздавшее сообщение не откатывает версию назад.
+            if current is None or version >= current[0]:
+                self._versions[group] = (version, time.monotonic())
+
+    def _ensure_started(self) -> None:
+        # После fork (gunicorn, celery prefork) поток родителя в дочернем процессе не живёт.
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._subscribed.clear()
+            self._versions.clear()
+            if settings.CACHE_VERSION_LOCAL_TTL <= 0 or get_redis_client() is None:
+                return
+            threading.Thread(target=self._listen, name="cache-version-listener", daemon=True).start()
+
+    def _listen(self) -> None:
+        channel = cache.make_key(CHANNEL)
+        while True:
+            pubsub = None
+            try:
+                pubsub = get_redis_client().pubsub()
+                pubsub.subscribe(channel)
+                for message in pubsub.listen():
+                    if message["type"] == "subscribe":
+                        with self._lock:
+                            self._versions.clear()
+                        self._subscribed.set()
+                    elif message["type"] == "message":
+                        group, _, version = message["data"].decode().rpartition(":")
+                        self.set(group, int(version))
+            except Exception:
+                logger.warning("Cache version subscription lost, reconnecting", exc_info=True)
+            finally:
+                self._subscribed.clear()
+                if pubsub is not None:
+                    pubsub.close()
+            time.sleep(RECONNECT_DELAY)
+
+
+local_versions = VersionListener()
+
+
+def get_cache_versions(*groups: str) -> tuple[int, ...]:
+    """
+    Текущие версии групп.
+
+    Из памяти процесса, если подписка на рассылку версий жива;
+    иначе — одним запросом к кешу.
+    """
+    versions = {group: local_versions.get(group) for group in groups}
+    missing = [group for group, version in versions.items() if version is None]
+    if missing:
+        for group, version in zip(missing, _fetch_cache_versions(missing)):
+            local_versions.set(group, version)
+            versions[group] = version
+
+    return tuple(versions[group] for group in groups)
+
+
+def _fetch_cache_versions(groups: list[str]) -> tuple[int, ...]:
+    keys = [_key(group) for group in groups]
+    versions = cache.get_many(keys)
+
+    missing = {key: _initial_version() for key in keys if key not in versions}
+    if missing:
+        for key, value in missing.items():
+            cache.add(key, value, timeout=None)
+        versions.update(cache.get_many(list(missing)))
+
+    return tuple(versions.get(key, 0) for key in keys)
+
+
+def bump_cache_version(group: str) -> None:
+    try:
+        version = cache.incr(_key(group))
+    except ValueError:
+        version = _initial_version()
+        cache.set(_key(group), version, timeout=None)
+
+    local_versions.set(group, version)
+    _publish_version(group, version)
+
+
+def _publish_version(group: str, version: int) -> None:
+    connection = get_redis_client()
+    if connection is None:
+        return
+    try:
+        connection.publish(cache.make_key(CHANNEL), f"{group}:{version}")
+    except Exception:
+        # Версия в Redis уже новая; остальные процессы подхватят её по CACHE_VERSION_LOCAL_TTL.
+        logger.warning("Failed to publish cache version %s", group, exc_info=True)
+
+
+def bump_cache_version_on_commit(group: str) -> None:
+    """
+    Увеличивает версию после коммита транзакции.
+
+    Зачем:
+    Если увеличить раньше, параллельный запрос успеет закешировать старые данные
+    уже под новой версией.
+    """
+    transaction.on_commit(lambda: bump_cache_version(group))
@@ -0,0 +1,97 @@
+import re
+import zlib
+from typing import Iterable, Iterator
+
+import brotli
+from django.conf import settings
+
+# Порядок = предпочтение сервера при равном q от клиента.
+ENCODINGS = ("br", "gzip")
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/msgpack",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "application/vnd.oai.openapi",
+    "image/svg+xml",
+    "text/",
+)
+
+BROTLI_QUALITY = 5
+GZIP_LEVEL = 6
+
+_ENCODING_RE = re.compile(r"^\s*([\w*-]+)\s*(?:;\s*q\s*=\s*([0-9.]+))?\s*$")
+
+
+def choose_encoding(accept_encoding: str) -> str | None:
+    """
+    Выбирает br или gzip по заголовку Accept-Encoding с учётом q-значений.
+
+    q=0 запрещает кодировку, "*" разрешает все не перечисленные явно.
+    """
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        match = _ENCODING_RE.match(part)
+        if not match:
+            continue
+        try:
+            weights[match.group(1).lower()] = float(match.group(2) or 1)
+        except ValueError:
+            continue
+
+    best, best_weight = None, 0.0
+    for encoding in ENCODINGS:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def is_compressible(content_type: str) -> bool:
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def min_compress_size() -> int:
+    return settings.COMPRESSION_MIN_SIZE
+
+
+def compress(content: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(content, quality=BROTLI_QUALITY)
+    if encoding == "gzip":
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+        return compressor.compress(content) + compressor.flush()
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+def decompress(content: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.decompress(content)
+    if encoding == "gzip":
+        return zlib.decompress(content, 31)
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+def compress_stream(chunks: Iterable[bytes], encoding: str) -> Iterator[bytes]:
+    """
+    Сжимает поток по кускам: каждый кусок отдаётся клиенту сразу (flush),
+    весь ответ в памяти не собирается — выгрузка каталога остаётся потоковой.
+    """
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        for chunk in chunks:
+            data = compressor.process(chunk) + compressor.flush()
+            if data:
+                yield data
+        yield compressor.finish()
+        return
+
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
@@ -0,0 +1,74 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core.cache import cache
+
+from commons.services.cache_versions import get_cache_versions
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Потокобезопасный LRU в памяти процесса."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default=None):
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class TwoTierCache:
+    """
+    LRU процесса перед Redis; актуальность — по номерам версий групп.
+
+    Зачем:
+    Редко меняющиеся данные (контакты, «о компании») читаются на каждой странице.
+    Номера версий процесс знает из рассылки (commons.services.cache_versions),
+    поэтому попадание в LRU не ходит ни в БД, ни в Redis.
+    Промах в LRU (новый процесс, новая версия) берёт значение из Redis —
+    сериализуется оно один раз на все процессы, а не в каждом.
+
+    В LRU на ключ одна запись с версиями, под которыми она собрана:
+    при смене версии запись просто перезаписывается.
+    """
+
+    def __init__(self, groups: tuple[str, ...], maxsize: int = 128):
+        self.groups = groups
+        self.local = LRUCache(maxsize)
+
+    def get_or_set(self, key: str, default: Callable[[], Any]):
+        versions = get_cache_versions(*self.groups)
+
+        entry = self.local.get(key)
+        if entry is not None and entry[0] == versions:
+            return entry[1]
+
+        versioned_key = f"{key}:{'.'.join(map(str, versions))}"
+        value = cache.get(versioned_key, _MISSING)
+        if value is _MISSING:
+            value = default()
+            cache.set(versioned_key, value, settings.RESPONSE_CACHE_TIMEOUT)
+
+        self.local.set(key, (versions, value))
+        return value
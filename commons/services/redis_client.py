@@ -0,0 +1,8 @@
+def get_redis_client():
+    """Сырой клиент Redis кеша default или None, если кеш не django-redis (locmem в разработке)."""
+    try:
+        from django_redis import get_redis_connection
+
+        return get_redis_connection("default")
+    except (ImportError, NotImplementedError):
+        return None
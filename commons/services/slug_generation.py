@@ -2,6 +2,11 @@ from django.utils.text import slugify
 from unidecode import unidecode
 
 
+def make_base_slug(title: str) -> str:
+    title_transliterated = unidecode(title)  # Cyrillic -> Latin
+    return slugify(title_transliterated)
+
+
 def generate_slug(instance, model_class, slug_attribute):
     if hasattr(instance, "slug"):
         if hasattr(instance, "safe_translation_getter"):
@@ -10,8 +15,7 @@ def generate_slug(instance, model_class, slug_attribute):
             title = getattr(instance, slug_attribute, None)
 
         if title:
-            title_transliterated = unidecode(title)  # Cyrillic -> Latin
-            base_slug = slugify(title_transliterated)
+            base_slug = make_base_slug(title)
             slug = base_slug
             counter = 1
 
@@ -0,0 +1,16 @@
+from itertools import islice
+from typing import Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+def chunked(iterable: Iterable[T], size: int) -> Iterator[list[T]]:
+    """
+    Разбивает любой итерируемый объект на списки длиной не больше size.
+
+    Не материализует исходный итератор целиком — подходит для потоковой
+    обработки файлов и server-side курсоров.
+    """
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
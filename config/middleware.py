@@ -1,4 +1,9 @@
 from django.http import HttpResponseRedirect
+from django.utils.cache import patch_vary_headers
+
+from commons.services.compression import (choose_encoding, compress,
+                                          compress_stream, is_compressible,
+                                          min_compress_size)
 
 
 class BlockAPIRouteMiddleware:
@@ -9,3 +14,55 @@ class BlockAPIRouteMiddleware:
         if request.path == "/ap/":  # change to /api/ when needed
             return HttpResponseRedirect("/")
         return self.get_response(request)
+
+
+class CompressionMiddleware:
+    """
+    Сжимает ответы br или gzip — что клиент принимает (Accept-Encoding).
+
+    Не трогает:
+    - ответы меньше COMPRESSION_MIN_SIZE и несжимаемые типы (картинки, application/gzip);
+    - ответы, уже сжатые раньше (Content-Encoding) — например из кеша CachedResponseMixin.
+
+    Потоковые ответы (выгрузка каталога) сжимаются по кускам, без буферизации.
+    Vary: Accept-Encoding ставится всем ответам, которые могли бы быть сжаты,
+    в том числе когда клиент сжатие не принял, — иначе прокси отдаст
+    сжатую копию клиенту без поддержки сжатия.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        if response.has_header("Content-Encoding") or not is_compressible(response.get("Content-Type", "")):
+            return response
+        if response.streaming and response.is_async:
+            return response
+        if not response.streaming and len(response.content) < min_compress_size():
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        encoding = choose_encoding(request.headers.get("Accept-Encoding", ""))
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            response.streaming_content = compress_stream(response.streaming_content, encoding)
+            del response["Content-Length"]
+        else:
+            compressed = compress(response.content, encoding)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(compressed))
+
+        # Сжатый ответ не побайтно равен исходному — сильный ETag становится слабым.
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+
+        response.headers["Content-Encoding"] = encoding
+        return response
@@ -60,12 +60,14 @@ INSTALLED_APPS = [
     "apps.orders",
     "apps.recommendations",
     "apps.services",
+    "apps.sync",
     "apps.users",
 ]
 
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "config.middleware.CompressionMiddleware",
     "config.middleware.BlockAPIRouteMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "debug_toolbar.middleware.DebugToolbarMiddleware",
@@ -122,6 +124,84 @@ CELERY_TASK_REJECT_ON_WORKER_LOST = True
 CELERY_TASK_TRACK_STARTED = True
 CELERY_TASK_TIME_LIMIT = 7200
 CELERY_TASK_SOFT_TIME_LIMIT = 6600
+CELERY_BEAT_SCHEDULE = {
+    "build-catalog-snapshots": {
+        "task": "apps.sync.infrastructure.tasks.build_catalog_snapshots",
+        "schedule": timedelta(minutes=env.int("CATALOG_SNAPSHOT_INTERVAL_MINUTES", 15)),
+    },
+    "flush-hot-carts": {
+        "task": "apps.cart.infrastructure.tasks.flush_hot_carts",
+        "schedule": timedelta(minutes=1),
+    },
+    "compact-carts": {
+        "task": "apps.cart.infrastructure.tasks.compact_carts",
+        "schedule": timedelta(hours=1),
+    },
+    "requeue-stale-checkouts": {
+        "task": "apps.orders.infrastructure.tasks.requeue_stale_checkouts",
+        "schedule": timedelta(minutes=5),
+    },
+    "rollup-sales": {
+        "task": "apps.orders.infrastructure.tasks.rollup_sales",
+        "schedule": timedelta(minutes=env.int("ORDER_ROLLUP_INTERVAL_MINUTES", 15)),
+    },
+}
+
+# Offline catalog snapshots (apps.sync)
+CATALOG_SNAPSHOT_KEEP = env.int("CATALOG_SNAPSHOT_KEEP", 3)
+
+# Response compression (br/gzip) and cached catalog responses
+COMPRESSION_MIN_SIZE = env.int("COMPRESSION_MIN_SIZE", 1024)
+RESPONSE_CACHE_TIMEOUT = env.int("RESPONSE_CACHE_TIMEOUT", 60 * 10)
+# Cache version numbers are kept in process memory and refreshed via Redis pub/sub;
+# this bounds how long a number is trusted without hearing from Redis (0 disables).
+CACHE_VERSION_LOCAL_TTL = env.int("CACHE_VERSION_LOCAL_TTL", 60)
+# Threads used to build missing /api/sync/bootstrap/ fragments on a cold cache (1 = sequential).
+BOOTSTRAP_WORKERS = env.int("BOOTSTRAP_WORKERS", 4)
+
+# Hot cart store (apps.cart): carts live in Redis hashes and are written back
+# to Cart/CartItem by flush_hot_carts CART_FLUSH_DELAY seconds after a change
+CART_STORE_ENABLED = env.bool("CART_STORE_ENABLED", True)
+CART_STORE_TTL = env.int("CART_STORE_TTL", 60 * 60 * 24 * 7)
+CART_FLUSH_DELAY = env.int("CART_FLUSH_DELAY", 5)
+CART_FLUSH_BATCH = env.int("CART_FLUSH_BATCH", 500)
+# Per-user cart summary (badge); dropped by every cart mutation
+CART_SUMMARY_TIMEOUT = env.int("CART_SUMMARY_TIMEOUT", 60 * 60)
+# Guest carts: anonymous carts kept in Redis hashes under a signed cookie token,
+# merged into the user's cart on JWT login. Cross-site frontends need SameSite=None.
+# A cart never touched after its first add expires after GUEST_CART_NEW_TTL;
+# anonymous cart changes are limited by the "guest_cart" throttle rate.
+GUEST_CART_COOKIE = env.str("GUEST_CART_COOKIE", "guest_cart")
+GUEST_CART_COOKIE_SAMESITE = env.str("GUEST_CART_COOKIE_SAMESITE", "Lax")
+GUEST_CART_TTL = env.int("GUEST_CART_TTL", 60 * 60 * 24 * 30)
+GUEST_CART_NEW_TTL = env.int("GUEST_CART_NEW_TTL", 60 * 60 * 24)
+# Carts untouched for CART_IDLE_DAYS are archived to AbandonedCart and their items
+# deleted by compact_carts, in keyset batches of CART_COMPACT_BATCH (each its own
+# short transaction), at most CART_COMPACT_MAX_BATCHES per run.
+CART_IDLE_DAYS = env.int("CART_IDLE_DAYS", 30)
+CART_COMPACT_BATCH = env.int("CART_COMPACT_BATCH", 500)
+CART_COMPACT_MAX_BATCHES = env.int("CART_COMPACT_MAX_BATCHES", 200)
+
+# Asynchronous checkout (apps.orders): purchase answers 202 with a queued order and
+# process_checkout runs on queue checkout-<n>, n = lowest book id % ORDER_CHECKOUT_PARTITIONS.
+# Run one worker per queue with --concurrency=1 so orders of a book are processed in order.
+ORDER_ASYNC_CHECKOUT = env.bool("ORDER_ASYNC_CHECKOUT", False)
+ORDER_CHECKOUT_PARTITIONS = env.int("ORDER_CHECKOUT_PARTITIONS", 4)
+ORDER_CHECKOUT_REQUEUE_AFTER = env.int("ORDER_CHECKOUT_REQUEUE_AFTER", 120)
+
+# Daily sales rollups (apps.orders.infrastructure.rollups): rollup_sales picks up orders changed
+# after the watermark, lagging ORDER_ROLLUP_LAG seconds behind now so in-flight checkouts commit first,
+# and rebuilds their days ORDER_ROLLUP_BATCH_DAYS at a time. Reports read only the rollup tables.
+ORDER_ROLLUP_LAG = env.int("ORDER_ROLLUP_LAG", 60)
+ORDER_ROLLUP_BATCH_DAYS = env.int("ORDER_ROLLUP_BATCH_DAYS", 31)
+ORDER_REPORT_LIMIT = env.int("ORDER_REPORT_LIMIT", 50)
+
+# Idempotency-Key (commons.interfaces.idempotency): first responses are kept for
+# IDEMPOTENCY_TTL; a concurrent duplicate waits up to IDEMPOTENCY_WAIT_TIMEOUT for them,
+# and an in-flight key is released after IDEMPOTENCY_LOCK_TIMEOUT if its worker died.
+IDEMPOTENCY_TTL = env.int("IDEMPOTENCY_TTL", 60 * 60 * 24)
+IDEMPOTENCY_WAIT_TIMEOUT = env.int("IDEMPOTENCY_WAIT_TIMEOUT", 10)
+IDEMPOTENCY_LOCK_TIMEOUT = env.int("IDEMPOTENCY_LOCK_TIMEOUT", 60)
 
 # REST Framework
 REST_FRAMEWORK = {
@@ -133,9 +213,21 @@ REST_FRAMEWORK = {
         "rest_framework.throttling.AnonRateThrottle",
         "rest_framework.throttling.UserRateThrottle",
     ],
-    "DEFAULT_THROTTLE_RATES": {"anon": "200/minute", "user": "200/minute"},
+    "DEFAULT_THROTTLE_RATES": {
+        "anon": "200/minute",
+        "user": "200/minute",
+        "catalog_export": env.str("CATALOG_EXPORT_RATE", "10/hour"),
+        "guest_cart": env.str("GUEST_CART_RATE", "30/minute"),
+    },
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "commons.interfaces.renderers.ORJSONRenderer",
+        "commons.interfaces.renderers.MessagePackRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "commons.interfaces.parsers.ORJSONParser",
+        "commons.interfaces.parsers.MessagePackParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
     ],
     "DEFAULT_FILTER_BACKENDS": ["django_filters.rest_framework.DjangoFilterBackend"],
 }
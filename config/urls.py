@@ -33,6 +33,7 @@ urlpatterns = [
     path("api/orders/", include("apps.orders.api.urls")),
     path("api/recommendations/", include("apps.recommendations.api.urls")),
     path("api/services/", include("apps.services.api.urls")),
+    path("api/sync/", include("apps.sync.api.urls")),
     path("api/users/", include("apps.users.api.urls")),
     path("api/documentations/schema/", SpectacularAPIView.as_view(), name="schema"),
     path(